@@ -4,14 +4,9 @@ Gasket API endpoints.
 Reference: .DESIGN_SPEC.md section 5 (REST API Endpoints)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 
-# Use relative import
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from api.deps import get_db
 from schemas import GasketCreate, GasketResponse
 from services import GasketService
@@ -22,6 +17,7 @@ router = APIRouter()
 @router.post("/gaskets", response_model=GasketResponse, status_code=status.HTTP_201_CREATED)
 def create_gasket(
     gasket_data: GasketCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -32,6 +28,7 @@ def create_gasket(
 
     Args:
         gasket_data: Request data with curvatures and max_depth
+        background_tasks: Runs the cache-hit access tracking after responding
         db: Database session (dependency injection)
 
     Returns:
@@ -52,7 +49,7 @@ def create_gasket(
         .DESIGN_SPEC.md section 5.1 - POST /api/gaskets endpoint
     """
     try:
-        service = GasketService(db)
+        service = GasketService(db, background_tasks)
         gasket = service.create_or_get_gasket(
             curvatures=gasket_data.curvatures,
             max_depth=gasket_data.max_depth
@@ -72,12 +69,17 @@ def create_gasket(
 
 
 @router.get("/gaskets/{gasket_id}", response_model=GasketResponse)
-def get_gasket(gasket_id: int, db: Session = Depends(get_db)):
+def get_gasket(
+    gasket_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """
     Retrieve a gasket by ID.
 
     Args:
         gasket_id: Gasket database ID
+        background_tasks: Runs the access tracking after responding
         db: Database session (dependency injection)
 
     Returns:
@@ -92,7 +94,7 @@ def get_gasket(gasket_id: int, db: Session = Depends(get_db)):
     Reference:
         .DESIGN_SPEC.md section 5.2 - GET /api/gaskets/{id} endpoint
     """
-    service = GasketService(db)
+    service = GasketService(db, background_tasks)
     gasket = service.get_gasket(gasket_id)
 
     if not gasket:
@@ -104,6 +106,33 @@ def get_gasket(gasket_id: int, db: Session = Depends(get_db)):
     return gasket
 
 
+@router.get("/gaskets/{gasket_id}/meta", response_model=GasketResponse)
+def get_gasket_meta(
+    gasket_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieve a gasket's metadata without its circles.
+
+    Same response shape as GET /api/gaskets/{id} with an empty circles
+    list; num_circles reports the stored count. Access tracking applies.
+
+    Raises:
+        HTTPException 404: Gasket not found
+    """
+    service = GasketService(db, background_tasks)
+    gasket = service.get_gasket(gasket_id, include_circles=False)
+
+    if not gasket:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error_code": "GASKET_NOT_FOUND", "message": f"Gasket with ID {gasket_id} not found"}
+        )
+
+    return gasket
+
+
 @router.delete("/gaskets/{gasket_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_gasket(gasket_id: int, db: Session = Depends(get_db)):
     """
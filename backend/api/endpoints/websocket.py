@@ -17,12 +17,8 @@ from fractions import Fraction
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import ValidationError
 
-# Use relative import
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from core.gasket_generator import generate_apollonian_gasket
+# Streaming serializes circles lossily via to_dict(), so use the float64 generator
+from core.float_generator import generate_apollonian_gasket
 from schemas import GasketCreate
 
 router = APIRouter()
@@ -6,11 +6,6 @@ Reference: .DESIGN_SPEC.md section 5 (API Endpoints)
 
 from fastapi import APIRouter
 
-# Use relative import
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from api.endpoints import gaskets
 
 # Create main API router
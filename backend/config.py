@@ -25,6 +25,9 @@ class Settings(BaseSettings):
     # Cache settings
     CACHE_SIZE_LIMIT_MB: int = 500
 
+    # Write circles.packed_rationals alongside the INTEGER columns
+    PACKED_RATIONALS: bool = True
+
     class Config:
         env_file = ".env"
 
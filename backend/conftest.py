@@ -0,0 +1,16 @@
+"""
+Root pytest configuration for the backend.
+
+Application modules import each other as top-level packages (``core``,
+``db``, ``services``, ...), which resolve when the process starts in the
+backend directory (``uvicorn main:app``). This puts the backend directory
+on ``sys.path`` once for test runs, so individual modules no longer need
+to patch ``sys.path`` at import time.
+"""
+
+import sys
+from pathlib import Path
+
+BACKEND_DIR = str(Path(__file__).parent)
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
@@ -11,7 +11,7 @@ system to support int, Fraction, and SymPy expression types.
 
 from dataclasses import dataclass, field
 from fractions import Fraction
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 from core.exact_math import (
     ExactNumber,
@@ -52,11 +52,20 @@ class CircleData:
     parent_ids: List[int] = field(default_factory=list)
     id: Optional[int] = None
     tangent_ids: List[int] = field(default_factory=list)
+    _floats: Optional[Tuple[float, float, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _radius: Optional[ExactNumber] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def radius(self) -> ExactNumber:
         """
         Calculate circle radius using hybrid exact arithmetic.
 
+        The division is done once; later calls return the cached value.
+        The radius is signed, so enclosing circles (k < 0) have r < 0.
+
         Returns:
             Radius as ExactNumber (r = 1/k)
             - Returns int if curvature is 1
@@ -71,7 +80,57 @@ class CircleData:
             >>> circle.radius()
             Fraction(1, 2)
         """
-        return smart_divide(1, self.curvature)
+        if self._radius is None:
+            self._radius = smart_divide(1, self.curvature)
+        return self._radius
+
+    @classmethod
+    def with_floats(
+        cls, floats: Tuple[float, float, float], **fields
+    ) -> "CircleData":
+        """
+        Create a circle whose float projection is already known.
+
+        Generators compute (curvature, center_x, center_y) as floats for
+        deduplication before building the circle; passing them here seeds
+        as_floats() instead of converting the exact values again.
+
+        Args:
+            floats: (curvature, center_x, center_y) matching the exact values
+            **fields: CircleData constructor arguments
+
+        Example:
+            >>> c = CircleData.with_floats((2.0, 0.5, 0.0), curvature=2, center=(Fraction(1, 2), 0), generation=1)
+            >>> c.as_floats()
+            (2.0, 0.5, 0.0)
+        """
+        circle = cls(**fields)
+        circle._floats = floats
+        return circle
+
+    def as_floats(self) -> Tuple[float, float, float]:
+        """
+        Float projection (curvature, center_x, center_y), computed once.
+
+        Used for tolerance-based duplicate detection during generation,
+        where converting Fractions or evaluating SymPy expressions on every
+        comparison would dominate. The cache assumes curvature and center
+        are not reassigned after the first call.
+
+        Returns:
+            Tuple of (curvature, center_x, center_y) as floats
+
+        Example:
+            >>> CircleData(curvature=Fraction(3, 2), center=(0, 1), generation=0).as_floats()
+            (1.5, 0.0, 1.0)
+        """
+        if self._floats is None:
+            self._floats = (
+                float(self.curvature),
+                float(smart_real(self.center)),
+                float(smart_imag(self.center)),
+            )
+        return self._floats
 
     def hash_key(self) -> str:
         """
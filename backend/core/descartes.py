@@ -43,7 +43,9 @@ from core.exact_math import (
     smart_imag,
     to_sympy,
     sympy_to_exact,
+    sympy_to_exact_batch,
 )
+import sympy as sp
 from sympy import simplify, I
 
 
@@ -204,6 +206,11 @@ def descartes_solve(
         - circle_plus: Solution using + branch of formula
         - circle_minus: Solution using - branch of formula
 
+        A solution that is a straight line (curvature 0) has no center and
+        is returned as (0, None); the other solution is still valid, so
+        callers skip k == 0 rather than discarding the pair (as with
+        descartes_reflect()).
+
     Example:
         >>> from fractions import Fraction
         >>> c1 = (-1, (0, 0))
@@ -222,9 +229,15 @@ def descartes_solve(
     # Calculate curvatures of the two solutions
     k4_plus, k4_minus = descartes_curvature(k1, k2, k3)
 
-    # Calculate centers for both solutions
-    center_plus = descartes_center(c1, c2, c3, k1, k2, k3, k4_plus, sign=1)
-    center_minus = descartes_center(c1, c2, c3, k1, k2, k3, k4_minus, sign=-1)
+    # Calculate centers for both solutions (a straight line has none)
+    center_plus = (
+        descartes_center(c1, c2, c3, k1, k2, k3, k4_plus, sign=1)
+        if k4_plus != 0 else None
+    )
+    center_minus = (
+        descartes_center(c1, c2, c3, k1, k2, k3, k4_minus, sign=-1)
+        if k4_minus != 0 else None
+    )
 
     # Return both complete circles
     circle_plus = (k4_plus, center_plus)
@@ -233,6 +246,161 @@ def descartes_solve(
     return (circle_plus, circle_minus)
 
 
+def descartes_reflect(
+    circle1: Circle, circle2: Circle, circle3: Circle, parent: Circle
+) -> Circle:
+    """
+    Calculate the other circle tangent to three circles, given one of them.
+
+    The two Descartes solutions for a triplet sum to twice the triplet, both
+    for curvatures and for curvature-weighted centers:
+
+        k₄' = 2(k₁ + k₂ + k₃) - k₄
+        k₄'z₄' = 2(k₁z₁ + k₂z₂ + k₃z₃) - k₄z₄
+
+    so once the quartet (circle1, circle2, circle3, parent) is known, the
+    new circle is a linear combination with no square root and no choice
+    of branch. This is how every circle after the first generation is found.
+
+    Args:
+        circle1: First circle as (curvature, center) where center is (x, y) tuple
+        circle2: Second circle as (curvature, center)
+        circle3: Third circle as (curvature, center)
+        parent: Fourth circle of the Descartes quartet, to be reflected
+
+    Returns:
+        The reflected circle as (curvature, center). Curvature is 0 if the
+        reflection is a straight line (center is then meaningless).
+
+    Example:
+        >>> from fractions import Fraction
+        >>> descartes_reflect((-1, (0, 0)), (2, (Fraction(1, 2), 0)),
+        ...                   (2, (Fraction(-1, 2), 0)), (3, (0, Fraction(2, 3))))
+        (3, (0, Fraction(-2, 3)))
+    """
+    k1, c1 = circle1
+    k2, c2 = circle2
+    k3, c3 = circle3
+    kp, cp = parent
+
+    if any(
+        isinstance(v, sp.Expr)
+        for v in (k1, k2, k3, kp, c1[0], c1[1], c2[0], c2[1], c3[0], c3[1], cp[0], cp[1])
+    ):
+        return _descartes_reflect_sympy(circle1, circle2, circle3, parent)
+
+    # k₄' = 2(k₁ + k₂ + k₃) - k₄
+    sum_curvatures = smart_add(smart_add(k1, k2), k3)
+    k_new = smart_add(smart_multiply(2, sum_curvatures), smart_multiply(-1, kp))
+
+    if k_new == 0:
+        return (k_new, (0, 0))
+
+    # k₄'z₄' = 2(k₁z₁ + k₂z₂ + k₃z₃) - k₄z₄
+    sum_kz = _complex_add(
+        _complex_add(_scalar_complex_multiply(k1, c1), _scalar_complex_multiply(k2, c2)),
+        _scalar_complex_multiply(k3, c3),
+    )
+    kz_new = _complex_add(
+        _scalar_complex_multiply(2, sum_kz),
+        _scalar_complex_multiply(smart_multiply(-1, kp), cp),
+    )
+
+    return (k_new, _scalar_complex_divide(kz_new, k_new))
+
+
+def descartes_reflect_quartet(
+    circle1: Circle, circle2: Circle, circle3: Circle, circle4: Circle
+) -> Tuple[Circle, Circle, Circle]:
+    """
+    Reflect each of the first three circles of a Descartes quartet.
+
+    These are the three children of circle4 in the Apollonian group: each
+    keeps circle4 and two of circle1..circle3, and replaces the third.
+    (Reflecting circle4 itself would give back the circle it came from.)
+    With S = k₁ + k₂ + k₃ + k₄ and W = k₁z₁ + k₂z₂ + k₃z₃ + k₄z₄,
+    descartes_reflect() of circle i across the other three simplifies to
+
+        kᵢ' = 2S - 3kᵢ
+        kᵢ'zᵢ' = 2W - 3kᵢzᵢ
+
+    so the two sums are computed once per quartet rather than once per child.
+
+    Args:
+        circle1, circle2, circle3: Circles to reflect, as (curvature, center)
+        circle4: Most recently generated circle of the quartet
+
+    Returns:
+        Tuple of the reflections of circle1, circle2 and circle3. A child's
+        curvature is 0 if it is a straight line.
+
+    Example:
+        >>> from fractions import Fraction
+        >>> children = descartes_reflect_quartet(
+        ...     (-1, (0, 0)), (2, (Fraction(1, 2), 0)),
+        ...     (2, (Fraction(-1, 2), 0)), (3, (0, Fraction(2, 3))))
+        >>> [k for k, _ in children]
+        [15, 6, 6]
+    """
+    quartet = (circle1, circle2, circle3, circle4)
+    if any(
+        isinstance(v, sp.Expr)
+        for k, (x, y) in quartet
+        for v in (k, x, y)
+    ):
+        return (
+            _descartes_reflect_sympy(circle2, circle3, circle4, circle1),
+            _descartes_reflect_sympy(circle1, circle3, circle4, circle2),
+            _descartes_reflect_sympy(circle1, circle2, circle4, circle3),
+        )
+
+    # S = k₁ + k₂ + k₃ + k₄ and W = k₁z₁ + k₂z₂ + k₃z₃ + k₄z₄
+    kz = [_scalar_complex_multiply(k, c) for k, c in quartet]
+    two_s = smart_multiply(2, smart_add(
+        smart_add(circle1[0], circle2[0]), smart_add(circle3[0], circle4[0])
+    ))
+    two_w = _scalar_complex_multiply(
+        2, _complex_add(_complex_add(kz[0], kz[1]), _complex_add(kz[2], kz[3]))
+    )
+
+    children = []
+    for (k, _), k_z in zip(quartet[:3], kz[:3]):
+        k_new = smart_add(two_s, smart_multiply(-3, k))
+        if k_new == 0:
+            children.append((k_new, (0, 0)))
+            continue
+        kz_new = _complex_add(two_w, _scalar_complex_multiply(-3, k_z))
+        children.append((k_new, _scalar_complex_divide(kz_new, k_new)))
+
+    return tuple(children)
+
+
+def _descartes_reflect_sympy(
+    circle1: Circle, circle2: Circle, circle3: Circle, parent: Circle
+) -> Circle:
+    """
+    descartes_reflect() for quartets containing irrational values.
+
+    Builds each output as one SymPy expression and simplifies it once,
+    instead of simplifying after every smart_* step.
+    """
+    (k1, (x1, y1)), (k2, (x2, y2)), (k3, (x3, y3)), (kp, (xp, yp)) = [
+        (to_sympy(k), (to_sympy(z[0]), to_sympy(z[1])))
+        for k, z in (circle1, circle2, circle3, parent)
+    ]
+
+    k_new = sympy_to_exact(2 * (k1 + k2 + k3) - kp)
+    if k_new == 0:
+        return (k_new, (0, 0))
+
+    k_new_sp = to_sympy(k_new)
+    x_new, y_new = sympy_to_exact_batch([
+        (2 * (k1 * x1 + k2 * x2 + k3 * x3) - kp * xp) / k_new_sp,
+        (2 * (k1 * y1 + k2 * y2 + k3 * y3) - kp * yp) / k_new_sp,
+    ])
+    return (k_new, (x_new, y_new))
+
+
 def create_complex(x: ExactNumber, y: ExactNumber) -> ComplexCenter:
     """
     Helper function to create a complex number from real and imaginary parts.
@@ -10,15 +10,16 @@ integral gaskets) and the recursive generation using Descartes Circle Theorem
 and breadth-first search.
 """
 
+import bisect
 import math
 from fractions import Fraction
-from typing import List, Generator, Set, Tuple, Optional
-from collections import deque
+from typing import Iterable, List, Generator, Set, Tuple, Optional
 import sympy as sp
 import itertools
+import numpy as np
 
 from core.circle_data import CircleData
-from core.descartes import descartes_solve
+from core.descartes import descartes_solve, descartes_reflect
 
 
 # --- NEW: Diophantine Generation Logic ---
@@ -107,14 +108,18 @@ def generate_diophantine_seed(B: int, mu: int, k: int, n: int) -> List[CircleDat
     c2_tup = (c2.curvature, c2.center)
     
     try:
-        (k_new1, z_new1), (k_new2, z_new2) = descartes_solve(c0_tup, c1_tup, c2_tup)
+        solutions = descartes_solve(c0_tup, c1_tup, c2_tup)
     except Exception as e:
          raise ValueError(f"Descartes solve failed for initial triplet {b0, b1, b2}: {e}")
+    (k_new1, z_new1), (k_new2, z_new2) = solutions
 
     # Check which one is the expected B3 circle (B+k+n-2*mu)
     new_circle_data = []
     
     for k, z in [(k_new1, z_new1), (k_new2, z_new2)]:
+        if k == 0:
+            # Straight-line solution: no center, cannot be C3
+            continue
         # Use numerical comparison for the irrational square root results from Descartes
         if abs(float(k - b3)) < 1e-6:
             c3_pos = z
@@ -249,14 +254,18 @@ def generate_diophantine_seed_from_curvatures(curvatures: List[Fraction]) -> Lis
     c2_tup = (c2.curvature, c2.center)
     
     try:
-        (k_new1, z_new1), (k_new2, z_new2) = descartes_solve(c0_tup, c1_tup, c2_tup)
+        solutions = descartes_solve(c0_tup, c1_tup, c2_tup)
     except Exception as e:
          raise ValueError(f"Descartes solve failed for initial triplet {k0, k1, k2}: {e}")
+    (k_new1, z_new1), (k_new2, z_new2) = solutions
 
     # Check which of the two new circles has the expected curvature k3
     c3 = None
     
     for k, z in [(k_new1, z_new1), (k_new2, z_new2)]:
+        if k == 0:
+            # Straight-line solution: no center, cannot be C3
+            continue
         # Use numerical comparison for the irrational square root results
         if abs(float(k - k3)) < 1e-6:
             c3 = CircleData(k3, z, 0, [])
@@ -295,20 +304,68 @@ def is_duplicate(
     Reference:
         ISSUES.md Issue #3 - Incomplete deduplication in BFS
     """
+    # Convert the candidate once; compare against cached float projections
+    # instead of building an exact difference per existing circle
+    return _is_duplicate_floats(
+        float(curvature), float(center[0]), float(center[1]),
+        existing_circles, tolerance
+    )
+
+
+def _is_duplicate_floats(
+    k_f: float, x_f: float, y_f: float,
+    existing_circles: Iterable[CircleData],
+    tolerance: float = 1e-10
+) -> bool:
+    """is_duplicate() for a candidate already projected to floats."""
     for existing in existing_circles:
+        existing_k, existing_x, existing_y = existing.as_floats()
         # Check curvature match
-        curvature_diff = abs(float(curvature - existing.curvature))
-        if curvature_diff < tolerance:
+        if abs(k_f - existing_k) < tolerance:
             # Check center coordinates match
-            center_x_diff = abs(float(center[0] - existing.center[0]))
-            center_y_diff = abs(float(center[1] - existing.center[1]))
-
-            if center_x_diff < tolerance and center_y_diff < tolerance:
+            if abs(x_f - existing_x) < tolerance and abs(y_f - existing_y) < tolerance:
                 return True
 
     return False
 
 
+def _exact_key(curvature, center: Tuple) -> Tuple:
+    """
+    Set key for exact duplicate detection.
+
+    Rational values contribute their (numerator, denominator) pair, so the
+    key hashes as a tuple of ints; irrational SymPy values are hashable and
+    used as they are.
+    """
+    return tuple(
+        (v.numerator, v.denominator) if isinstance(v, (int, Fraction)) else v
+        for v in (curvature, center[0], center[1])
+    )
+
+
+def _is_duplicate_sorted(
+    k_f: float, x_f: float, y_f: float,
+    sorted_curvatures: List[float],
+    sorted_centers: List[Tuple[float, float]],
+    tolerance: float = 1e-10
+) -> bool:
+    """
+    is_duplicate() against float projections kept sorted by curvature.
+
+    bisect narrows the scan to the circles whose curvature lies within
+    ``tolerance`` of ``k_f``; only those centers are compared.
+    """
+    lo = bisect.bisect_left(sorted_curvatures, k_f - tolerance)
+    hi = bisect.bisect_right(sorted_curvatures, k_f + tolerance, lo)
+    for i in range(lo, hi):
+        existing_x, existing_y = sorted_centers[i]
+        if (abs(k_f - sorted_curvatures[i]) < tolerance
+                and abs(x_f - existing_x) < tolerance
+                and abs(y_f - existing_y) < tolerance):
+            return True
+    return False
+
+
 def verify_tangency(
     circle1: CircleData,
     circle2: CircleData,
@@ -330,22 +387,44 @@ def verify_tangency(
     Reference:
         ISSUES.md Issue #2 - Tangency verification for exact placement
     """
-    # Calculate actual distance between centers
-    x1, y1 = circle1.center
-    x2, y2 = circle2.center
-    actual_distance = float(((x2 - x1)**2 + (y2 - y1)**2) ** 0.5)
-
     # Calculate expected tangency distance
-    expected_distance = float(_compute_tangent_distance(
-        circle1.curvature,
-        circle2.curvature
-    ))
+    expected_dist = _compute_tangent_distance(circle1.curvature, circle2.curvature)
+
+    # Rational circles: compare squared distances exactly (no sqrt, no error)
+    if _is_exactly_tangent(circle1.center, circle2.center, expected_dist):
+        return True
+
+    # Otherwise compare in floats, using the cached float projections
+    _, x1, y1 = circle1.as_floats()
+    _, x2, y2 = circle2.as_floats()
+    actual_distance = math.hypot(x2 - x1, y2 - y1)
+    expected_distance = float(expected_dist)
 
     # Check if they match within tolerance
     error = abs(actual_distance - expected_distance)
     return error < tolerance
 
 
+def _is_exactly_tangent(
+    center1: Tuple[Fraction, Fraction],
+    center2: Tuple[Fraction, Fraction],
+    distance: Fraction
+) -> bool:
+    """
+    Exact check |center2 - center1|² == distance² for rational values.
+
+    Returns False if any value is irrational (SymPy), leaving the decision
+    to the tolerance-based float comparison.
+    """
+    x1, y1 = center1
+    x2, y2 = center2
+    if not all(isinstance(v, (int, Fraction)) for v in (x1, y1, x2, y2, distance)):
+        return False
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy == distance * distance
+
+
 def _compute_tangent_distance(k1: Fraction, k2: Fraction) -> Fraction:
     """
     Compute exact distance between centers of two tangent circles.
@@ -377,17 +456,33 @@ def _compute_tangent_distance(k1: Fraction, k2: Fraction) -> Fraction:
         return abs(abs(r1) - abs(r2))
 
 
+def _rational_sqrt(q: Fraction) -> Optional[Fraction]:
+    """Exact square root of a non-negative Fraction, or None if irrational."""
+    num_root = math.isqrt(q.numerator)
+    den_root = math.isqrt(q.denominator)
+    if num_root * num_root == q.numerator and den_root * den_root == q.denominator:
+        return Fraction(num_root, den_root)
+    return None
+
+
 def _solve_third_circle_position_exact(
     k1: Fraction, k2: Fraction, k3: Fraction,
     c1_pos: Tuple[Fraction, Fraction],
     c2_pos: Tuple[Fraction, Fraction]
 ) -> Tuple[Fraction, Fraction]:
     """
-    Solve for exact position of third circle using symbolic math.
+    Solve for exact position of third circle in closed form.
 
-    Given two circles with known positions, finds the exact position
-    of a third circle that is tangent to both, using sympy for
-    exact rational arithmetic throughout.
+    Given two circles with known positions, finds the position of a third
+    circle that is tangent to both. Subtracting the two tangency equations
+    leaves a linear one, so with v = c2 - c1 the solutions are
+
+        p = c1 + t·v ± s·v⊥,   t = (d13² - d23² + |v|²) / (2|v|²),
+                               s² = d13² / |v|² - t²
+
+    t and s² are Fractions; when s² is a perfect square the position is
+    exact, otherwise each coordinate is evaluated once with SymPy and
+    approximated with limit_denominator(10**9).
 
     Args:
         k1, k2, k3: Curvatures of the three circles
@@ -395,76 +490,50 @@ def _solve_third_circle_position_exact(
         c2_pos: Position (x, y) of circle 2 as Fractions
 
     Returns:
-        Position (x, y) of circle 3 as Fractions
+        Position (x, y) of circle 3 as Fractions, taking the solution with
+        the larger y
 
     Reference:
         ISSUES.md Issue #2 - Exact rational geometry for initial placement
     """
-    # Define symbolic variables (use real=True, not rational=True)
-    # Solutions often involve square roots which are irrational
-    x, y = sp.symbols('x y', real=True)
-
-    # Convert Fractions to sympy expressions
-    x1 = sp.Rational(c1_pos[0].numerator, c1_pos[0].denominator)
-    y1 = sp.Rational(c1_pos[1].numerator, c1_pos[1].denominator)
-    x2 = sp.Rational(c2_pos[0].numerator, c2_pos[0].denominator)
-    y2 = sp.Rational(c2_pos[1].numerator, c2_pos[1].denominator)
+    x1, y1 = Fraction(c1_pos[0]), Fraction(c1_pos[1])
+    vx = Fraction(c2_pos[0]) - x1
+    vy = Fraction(c2_pos[1]) - y1
+    v_sq = vx * vx + vy * vy
+    if v_sq == 0:
+        raise ValueError("Cannot find exact tangent position for concentric circles")
 
     # Calculate target distances
-    d13 = _compute_tangent_distance(k1, k3)
-    d23 = _compute_tangent_distance(k2, k3)
+    d13 = Fraction(_compute_tangent_distance(k1, k3))
+    d23 = Fraction(_compute_tangent_distance(k2, k3))
 
-    # Convert to sympy Rationals
-    d13_sp = sp.Rational(d13.numerator, d13.denominator)
-    d23_sp = sp.Rational(d23.numerator, d23.denominator)
-
-    # Set up tangency constraint equations
-    # (x - x1)^2 + (y - y1)^2 = d13^2
-    # (x - x2)^2 + (y - y2)^2 = d23^2
-    eq1 = sp.Eq((x - x1)**2 + (y - y1)**2, d13_sp**2)
-    eq2 = sp.Eq((x - x2)**2 + (y - y2)**2, d23_sp**2)
+    t = (d13 * d13 - d23 * d23 + v_sq) / (2 * v_sq)
+    s_sq = d13 * d13 / v_sq - t * t
+    if s_sq < 0:
+        raise ValueError("Cannot find exact tangent position for given curvatures")
 
-    # Solve the system symbolically
-    solutions = sp.solve([eq1, eq2], [x, y])
+    # Prefer the solution with the larger y: y = y1 + t·vy ± s·vx
+    sign = -1 if vx < 0 else 1
+    base_x = x1 + t * vx
+    base_y = y1 + t * vy
 
-    if not solutions:
-        # Fallback to approximate solution if symbolic solving fails
-        raise ValueError("Cannot find exact tangent position for given curvatures")
+    s = _rational_sqrt(s_sq)
+    if s is not None:
+        return (base_x - sign * s * vy, base_y + sign * s * vx)
 
-    # Choose the solution with positive y (above x-axis)
-    # If multiple solutions, prefer the one with y > 0
-    best_solution = None
-    for sol in solutions:
-        x_val, y_val = sol
-
-        # Convert sympy expressions to Python Fraction
-        # For irrational expressions (like sqrt), convert to float with high precision
-        try:
-            # Try exact rational conversion first
-            if isinstance(x_val, sp.Rational):
-                x_frac = Fraction(int(x_val.p), int(x_val.q))
-            else:
-                # For irrational values, evaluate numerically with high precision
-                x_float = float(x_val.evalf(50))  # 50 digits of precision
-                x_frac = Fraction(x_float).limit_denominator(10**9)
-
-            if isinstance(y_val, sp.Rational):
-                y_frac = Fraction(int(y_val.p), int(y_val.q))
-            else:
-                y_float = float(y_val.evalf(50))
-                y_frac = Fraction(y_float).limit_denominator(10**9)
-
-            # Prefer solution with y > 0 (above x-axis)
-            if best_solution is None or y_frac > best_solution[1]:
-                best_solution = (x_frac, y_frac)
-        except (ValueError, AttributeError, TypeError) as e:
-            # Skip solutions that can't be converted
-            continue
+    # Irrational offset: approximate each coordinate with high precision
+    root = sign * sp.sqrt(sp.Rational(s_sq.numerator, s_sq.denominator))
 
-    if best_solution is None:
-        raise ValueError("Cannot convert symbolic solution to exact Fraction")
+    def approximate(base: Fraction, coefficient: Fraction) -> Fraction:
+        if coefficient == 0:
+            return base
+        value = (
+            sp.Rational(base.numerator, base.denominator)
+            + sp.Rational(coefficient.numerator, coefficient.denominator) * root
+        )
+        return Fraction(float(value.evalf(50))).limit_denominator(10**9)
 
-    return best_solution
+    return (approximate(base_x, -vy), approximate(base_y, vx))
 
 
 # The old initialize functions are replaced/redirected
@@ -516,7 +585,28 @@ def generate_apollonian_gasket(
 
     # The rest of the BFS logic is sound, but we must update the initial queueing
     # to handle the 4 initial circles (C0, C1, C2, C3).
-    circle_hashes: Set[str] = {c.hash_key() for c in circles}
+    circle_hashes: Set[Tuple] = {_exact_key(c.curvature, c.center) for c in circles}
+
+    # Float projections of every circle, kept sorted by curvature so the
+    # tolerance check only scans the few circles with a matching curvature
+    sorted_curvatures: List[float] = []
+    sorted_centers: List[Tuple[float, float]] = []
+
+    def record_floats(k_f: float, x_f: float, y_f: float) -> None:
+        position = bisect.bisect_right(sorted_curvatures, k_f)
+        sorted_curvatures.insert(position, k_f)
+        sorted_centers.insert(position, (x_f, y_f))
+
+    for circle in circles:
+        record_floats(*circle.as_floats())
+
+    # An exactly tangent rational seed makes every rational descendant exact,
+    # so for those the exact key is authoritative and the tolerance check
+    # is only needed for approximated (e.g. limit_denominator) placements
+    exact_seed = all(
+        _is_exactly_tangent(a.center, b.center, _compute_tangent_distance(a.curvature, b.curvature))
+        for a, b in itertools.combinations(circles, 2)
+    )
 
     # Step 2: Yield initial circles if streaming
     if stream:
@@ -524,86 +614,99 @@ def generate_apollonian_gasket(
             yield circle
 
     # Step 3: Set up BFS queue
-    # Queue contains tuples of (circle1, circle2, circle3, depth)
-    queue = deque()
+    # Each row is (index1, index2, index3, parent, depth) into `circles`:
+    # a triplet plus the fourth circle of its Descartes quartet. A flat
+    # int32 buffer with head/tail cursors avoids a tuple per entry
+    queue_capacity = 64
+    queue = np.empty((queue_capacity, 5), dtype=np.int32)
+    head = 0
+    tail = 0
 
     # Step 4: Add all possible initial triplets to queue
     # For 4 initial circles (C0, C1, C2, C3), there are 4 unique triplets:
-    # (C0, C1, C2), (C0, C1, C3), (C0, C2, C3), (C1, C2, C3)
+    # (C0, C1, C2), (C0, C1, C3), (C0, C2, C3), (C1, C2, C3), each with
+    # the remaining seed circle as its parent
     if len(circles) == 4:
-        c0, c1, c2, c3 = circles
-        queue.append((c0, c1, c2, 0))
-        queue.append((c0, c1, c3, 0))
-        queue.append((c0, c2, c3, 0))
-        queue.append((c1, c2, c3, 0))
+        for triplet, parent in (((0, 1, 2), 3), ((0, 1, 3), 2), ((0, 2, 3), 1), ((1, 2, 3), 0)):
+            queue[tail] = (*triplet, parent, 0)
+            tail += 1
     else:
         # This case should have been caught by initialize_standard_gasket
         raise ValueError("Gasket generation expected 4 initial circles but got a different number after initialization.")
 
     # Step 5: BFS loop
-    while queue:
-        # ... (rest of the BFS loop remains unchanged as it handles recursion) ...
-        c1, c2, c3, depth = queue.popleft()
+    while head < tail:
+        i1, i2, i3, ip, depth = queue[head].tolist()
+        head += 1
+        c1, c2, c3, parent = circles[i1], circles[i2], circles[i3], circles[ip]
 
         # Check depth limit
         if depth >= max_depth:
             continue
 
-        # Convert CircleData to format expected by descartes_solve
-        circle1 = (c1.curvature, c1.center)
-        circle2 = (c2.curvature, c2.center)
-        circle3 = (c3.curvature, c3.center)
-
-        try:
-            # Compute two new circles tangent to all three
-            (k_new1, z_new1), (k_new2, z_new2) = descartes_solve(
-                circle1, circle2, circle3
-            )
-
-            # Process both new circles
-            new_circles = []
-            for k, z in [(k_new1, z_new1), (k_new2, z_new2)]:
-                # ISSUE #3 FIX: Check if this solution is a parent circle
-                # Descartes theorem returns two solutions: one new circle + one parent
-                # We must explicitly discard the parent before hash checking
-                if is_duplicate(k, z, [c1, c2, c3]):
-                    # This is the parent circle that was part of the quartet
-                    continue
-
-                # Create CircleData object
-                new_circle = CircleData(
-                    curvature=k,
-                    center=z,
-                    generation=depth + 1,
-                    parent_ids=[],  # Will be set when persisted to DB
-                )
-
-                # Check for duplicates using hash
-                hash_key = new_circle.hash_key()
-                if hash_key not in circle_hashes:
-                    # ISSUE #3 FIX: Additional numerical tolerance check
-                    if not is_duplicate(k, z, circles):
-                        # New unique circle found
-                        circle_hashes.add(hash_key)
-                        circles.append(new_circle)
-                        new_circles.append(new_circle)
-
-                        # Yield immediately if streaming
-                        if stream:
-                            yield new_circle
-
-            # Step 6: Add new triplets to queue for next iteration
-            # For each new circle, create triplets with existing parent circles
-            for new_circle in new_circles:
-                # Create three new triplets, each replacing one parent circle
-                queue.append((c1, c2, new_circle, depth + 1))
-                queue.append((c2, c3, new_circle, depth + 1))
-                queue.append((c3, c1, new_circle, depth + 1))
-
-        except Exception as e:
-            # Skip invalid configurations
+        # The two Descartes solutions for the triplet are the parent and the
+        # new circle, so the new circle is the parent's reflection: linear,
+        # no square root, and no parent solution to compute and discard
+        k, z = descartes_reflect(
+            (c1.curvature, c1.center),
+            (c2.curvature, c2.center),
+            (c3.curvature, c3.center),
+            (parent.curvature, parent.center),
+        )
+        if k == 0:
+            # Straight line (no center): invalid configuration, skip
             continue
 
+        # Project the candidate to floats once; every tolerance check
+        # below reuses them and the CircleData is only built on acceptance
+        floats = (float(k), float(z[0]), float(z[1]))
+
+        # ISSUE #3 FIX: Guard against a degenerate quartet reflecting onto
+        # one of its own circles
+        if _is_duplicate_floats(*floats, (c1, c2, c3, parent)):
+            continue
+
+        # Check for exact duplicates by value
+        hash_key = _exact_key(k, z)
+        if hash_key in circle_hashes:
+            continue
+
+        # ISSUE #3 FIX: Additional numerical tolerance check
+        is_exact = exact_seed and all(
+            isinstance(v, (int, Fraction)) for v in (k, z[0], z[1])
+        )
+        if not is_exact and _is_duplicate_sorted(
+            *floats, sorted_curvatures, sorted_centers
+        ):
+            continue
+
+        # New unique circle found
+        new_circle = CircleData.with_floats(
+            floats,
+            curvature=k,
+            center=z,
+            generation=depth + 1,
+            parent_ids=[],  # Will be set when persisted to DB
+        )
+        circle_hashes.add(hash_key)
+        new_index = len(circles)
+        circles.append(new_circle)
+        record_floats(*floats)
+
+        # Yield immediately if streaming
+        if stream:
+            yield new_circle
+
+        # Step 6: Add new triplets to queue for next iteration
+        # Each replaces one circle of the triplet, which becomes the parent
+        if tail + 3 > queue_capacity:
+            queue_capacity *= 2
+            queue = np.resize(queue, (queue_capacity, 5))
+        queue[tail] = (i1, i2, new_index, i3, depth + 1)
+        queue[tail + 1] = (i2, i3, new_index, i1, depth + 1)
+        queue[tail + 2] = (i3, i1, new_index, i2, depth + 1)
+        tail += 3
+
     # Step 7: If not streaming, yield all circles at the end
     if not stream:
         for circle in circles:
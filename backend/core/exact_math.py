@@ -12,10 +12,14 @@ while maintaining exactness throughout all calculations.
 Reference: .DESIGN_SPEC.md Section 8.4 - Hybrid Exact Arithmetic System
 """
 
+import functools
+import os
 from fractions import Fraction
-from typing import Union, Tuple
+from math import gcd, isqrt, log10
+from typing import Callable, Dict, List, Optional, Union, Tuple
 import sympy as sp
 from sympy import Rational, sqrt, simplify, I, re, im
+from sympy.core.cache import clear_cache
 
 
 # ============================================================================
@@ -25,6 +29,10 @@ from sympy import Rational, sqrt, simplify, I, re, im
 # Union type representing any exact number
 ExactNumber = Union[int, Fraction, sp.Expr]
 
+# Types handled with plain Python arithmetic (hoisted so the hot isinstance
+# checks don't rebuild the tuple on every call)
+_RATIONAL_TYPES = (int, Fraction)
+
 # Complex exact number (for circle centers)
 ExactComplex = Union[
     Tuple[ExactNumber, ExactNumber],  # (real, imag) tuple
@@ -32,6 +40,75 @@ ExactComplex = Union[
 ]
 
 
+# Fraction constructor that skips normalization for already-coprime ints
+# (Python 3.12+). None on older Pythons, where Fraction(a, b) is used instead.
+_fraction_from_coprime_ints = getattr(Fraction, "_from_coprime_ints", None)
+
+
+def coprime_fraction(a: int, b: int) -> Fraction:
+    """
+    Build Fraction(a, b) for a pair already in lowest terms with b > 0.
+
+    Skips the gcd entirely, so it is only for values with that invariant,
+    such as num/denom column pairs written from Fraction components. The
+    invariant is asserted in debug runs (tests) and unchecked under -O.
+
+    Args:
+        a: Numerator
+        b: Positive denominator coprime to a
+
+    Returns:
+        Fraction equal to a/b
+    """
+    if __debug__:
+        assert b > 0 and gcd(a, b) == 1, f"{a}/{b} is not in lowest terms"
+    if _fraction_from_coprime_ints is not None:
+        return _fraction_from_coprime_ints(a, b)
+    value = object.__new__(Fraction)
+    value._numerator = a
+    value._denominator = b
+    return value
+
+
+def _int_fraction(a: int, b: int) -> Fraction:
+    """
+    Build Fraction(a, b) for ints without going through the generic constructor.
+
+    Reduces by gcd and normalizes the sign of the denominator directly, then
+    uses Fraction._from_coprime_ints where available.
+
+    Args:
+        a: Numerator
+        b: Non-zero denominator
+
+    Returns:
+        Fraction equal to a/b in lowest terms
+    """
+    if _fraction_from_coprime_ints is None:
+        return Fraction(a, b)
+
+    g = gcd(a, b)
+    if b < 0:
+        g = -g
+    return _fraction_from_coprime_ints(a // g, b // g)
+
+
+# SymPy's internal @cacheit cache grows without bound during long generation
+# runs, and most entries are single-use intermediates. Flush it after every
+# _SYMPY_CLEAR_INTERVAL SymPy-path arithmetic operations (0 disables).
+_SYMPY_CLEAR_INTERVAL = int(os.environ.get("APOLLONIAN_SYMPY_CACHE_INTERVAL", "100000"))
+_sympy_op_count = 0
+
+
+def _count_sympy_op() -> None:
+    """Record one SymPy-path operation, clearing SymPy's cache every interval."""
+    global _sympy_op_count
+    _sympy_op_count += 1
+    if _SYMPY_CLEAR_INTERVAL > 0 and _sympy_op_count >= _SYMPY_CLEAR_INTERVAL:
+        _sympy_op_count = 0
+        clear_cache()
+
+
 # ============================================================================
 # DETECTION FUNCTIONS
 # ============================================================================
@@ -191,6 +268,44 @@ def sympy_to_exact(expr: sp.Expr) -> ExactNumber:
     return simplified
 
 
+def sympy_to_exact_batch(exprs: List[sp.Expr]) -> List[ExactNumber]:
+    """
+    Convert a batch of SymPy expressions with sympy_to_exact().
+
+    Generated circles share many subexpressions (e.g. sqrt(k) for a handful
+    of k). Duplicate expressions are converted once, and sp.cse() pulls out
+    common subexpressions so each is simplified and classified a single time
+    before being substituted back into the expressions that use it.
+
+    Args:
+        exprs: SymPy expressions (int/Fraction entries are also accepted)
+
+    Returns:
+        List of int, Fraction, or SymPy Expr, in the same order as exprs
+
+    Example:
+        >>> sympy_to_exact_batch([sp.sqrt(4) + 1, sp.sqrt(4) / 4, sp.sqrt(2)])
+        [3, Fraction(1, 2), sqrt(2)]
+    """
+    exprs_sp = [to_sympy(e) for e in exprs]
+    unique = list(dict.fromkeys(exprs_sp))
+
+    replacements, reduced = sp.cse(unique)
+
+    # Classify each shared subexpression once; later replacements may
+    # reference earlier ones, so substitute as we go
+    known = {}
+    for symbol, subexpr in replacements:
+        known[symbol] = to_sympy(sympy_to_exact(subexpr.xreplace(known)))
+
+    converted = {
+        expr: sympy_to_exact(reduced_expr.xreplace(known))
+        for expr, reduced_expr in zip(unique, reduced)
+    }
+
+    return [converted[expr] for expr in exprs_sp]
+
+
 # ============================================================================
 # ARITHMETIC OPERATIONS
 # ============================================================================
@@ -219,8 +334,12 @@ def smart_add(a: ExactNumber, b: ExactNumber) -> ExactNumber:
         >>> smart_add(sp.sqrt(2), sp.sqrt(3))
         sqrt(2) + sqrt(3)  # SymPy
     """
+    # int + int is always int
+    if type(a) is int and type(b) is int:
+        return a + b
+
     # If both are int/Fraction, use Python arithmetic
-    if isinstance(a, (int, Fraction)) and isinstance(b, (int, Fraction)):
+    if isinstance(a, _RATIONAL_TYPES) and isinstance(b, _RATIONAL_TYPES):
         result = a + b
         if isinstance(result, int):
             return result
@@ -230,6 +349,7 @@ def smart_add(a: ExactNumber, b: ExactNumber) -> ExactNumber:
         return result  # Fraction
 
     # Otherwise use SymPy
+    _count_sympy_op()
     a_sp = to_sympy(a)
     b_sp = to_sympy(b)
     result_sp = simplify(a_sp + b_sp)
@@ -253,8 +373,12 @@ def smart_multiply(a: ExactNumber, b: ExactNumber) -> ExactNumber:
         >>> smart_multiply(sp.sqrt(2), sp.sqrt(2))
         2  # int (simplifies)
     """
+    # int * int is always int
+    if type(a) is int and type(b) is int:
+        return a * b
+
     # If both are int/Fraction, use Python arithmetic
-    if isinstance(a, (int, Fraction)) and isinstance(b, (int, Fraction)):
+    if isinstance(a, _RATIONAL_TYPES) and isinstance(b, _RATIONAL_TYPES):
         result = a * b
         if isinstance(result, int):
             return result
@@ -264,6 +388,7 @@ def smart_multiply(a: ExactNumber, b: ExactNumber) -> ExactNumber:
         return result  # Fraction
 
     # Otherwise use SymPy
+    _count_sympy_op()
     a_sp = to_sympy(a)
     b_sp = to_sympy(b)
     result_sp = simplify(a_sp * b_sp)
@@ -288,20 +413,24 @@ def smart_divide(a: ExactNumber, b: ExactNumber) -> ExactNumber:
         >>> smart_divide(1, sp.sqrt(2))
         sqrt(2)/2  # SymPy (rationalizes)
     """
+    # int / int: exact quotient or reduced Fraction
+    if type(a) is int and type(b) is int:
+        q, r = divmod(a, b)
+        if r == 0:
+            return q  # int
+        return _int_fraction(a, b)
+
     # If both are int/Fraction, use Python arithmetic
-    if isinstance(a, (int, Fraction)) and isinstance(b, (int, Fraction)):
-        if isinstance(a, int) and isinstance(b, int):
-            # Check if division is exact
-            if a % b == 0:
-                return a // b  # int
-            return Fraction(a, b)
-        else:
-            result = Fraction(a) / Fraction(b) if not isinstance(a, Fraction) or not isinstance(b, Fraction) else a / b
-            if isinstance(result, Fraction) and result.denominator == 1:
-                return int(result.numerator)
-            return result
+    if isinstance(a, _RATIONAL_TYPES) and isinstance(b, _RATIONAL_TYPES):
+        # At least one operand is a Fraction (or a bool); Fraction(a) keeps
+        # bool / bool from producing a float
+        result = Fraction(a) / b
+        if result.denominator == 1:
+            return result.numerator
+        return result
 
     # Otherwise use SymPy
+    _count_sympy_op()
     a_sp = to_sympy(a)
     b_sp = to_sympy(b)
     result_sp = simplify(a_sp / b_sp)
@@ -342,13 +471,23 @@ def smart_sqrt(n: ExactNumber) -> ExactNumber:
     return sympy_to_exact(simplified)
 
 
+def _normalize_exact(x: ExactNumber) -> ExactNumber:
+    """Demote a Fraction with denominator 1 to int, leaving other values as-is."""
+    if isinstance(x, Fraction) and x.denominator == 1:
+        return x.numerator
+    return x
+
+
 def smart_power(base: ExactNumber, exp: ExactNumber) -> ExactNumber:
     """
     Raise base to exponent power, returning exact representation.
 
     Algorithm:
-    1. If both int/Fraction, use Python arithmetic
-    2. Otherwise convert to SymPy, compute power, simplify, convert back
+    1. If both int/Fraction and exponent is an integer, use Python arithmetic
+       (negative exponents go through Fraction, never float)
+    2. If exponent is p/q and base is a non-negative exact q-th power,
+       take the integer root and continue as in step 1
+    3. Otherwise convert to SymPy, compute power, simplify, convert back
 
     Args:
         base: Base number
@@ -362,18 +501,31 @@ def smart_power(base: ExactNumber, exp: ExactNumber) -> ExactNumber:
         8  # int
         >>> smart_power(Fraction(1, 2), 2)
         Fraction(1, 4)
+        >>> smart_power(2, -2)
+        Fraction(1, 4)
+        >>> smart_power(8, Fraction(2, 3))
+        4  # int (no SymPy round-trip)
         >>> smart_power(sqrt(2), 2)
         2  # int (simplifies)
     """
     # If both are int/Fraction, use Python arithmetic
-    if isinstance(base, (int, Fraction)) and isinstance(exp, (int, Fraction)):
-        # For integer exponent, use ** operator
-        if isinstance(exp, int) or (isinstance(exp, Fraction) and exp.denominator == 1):
-            exp_int = int(exp) if isinstance(exp, Fraction) else exp
-            result = base ** exp_int
-            if isinstance(result, int):
-                return result
-            return result  # Fraction
+    if isinstance(base, _RATIONAL_TYPES) and isinstance(exp, _RATIONAL_TYPES):
+        if isinstance(exp, int):
+            exp_num, exp_denom = exp, 1
+        else:
+            exp_num, exp_denom = exp.numerator, exp.denominator
+
+        # Rational exponent: exact only if base is a perfect exp_denom-th power
+        if exp_denom != 1 and base >= 0:
+            root = _rational_root(base, exp_denom)
+            if root is not None:
+                base, exp_denom = root, 1
+
+        if exp_denom == 1:
+            if exp_num < 0:
+                # int ** negative int would produce a float
+                return _normalize_exact(Fraction(base) ** exp_num)
+            return _normalize_exact(base ** exp_num)
 
     # Otherwise use SymPy
     base_sp = to_sympy(base)
@@ -383,6 +535,48 @@ def smart_power(base: ExactNumber, exp: ExactNumber) -> ExactNumber:
     return sympy_to_exact(result_sp)
 
 
+def _int_root(n: int, q: int) -> Optional[int]:
+    """
+    Exact q-th root of a non-negative int.
+
+    Args:
+        n: Non-negative integer
+        q: Root degree (>= 2)
+
+    Returns:
+        r such that r**q == n, or None if n is not a perfect q-th power
+    """
+    if q == 2:
+        r = isqrt(n)
+    elif n == 0:
+        return 0
+    else:
+        # Integer Newton iteration from an upper bound converges to floor(n**(1/q))
+        r = 1 << -(-n.bit_length() // q)
+        while True:
+            s = ((q - 1) * r + n // r ** (q - 1)) // q
+            if s >= r:
+                break
+            r = s
+    return r if r ** q == n else None
+
+
+def _rational_root(base: Union[int, Fraction], q: int) -> Optional[Union[int, Fraction]]:
+    """
+    Exact q-th root of a non-negative int or Fraction, or None if irrational.
+    """
+    if isinstance(base, int):
+        return _int_root(base, q)
+
+    num_root = _int_root(base.numerator, q)
+    if num_root is None:
+        return None
+    denom_root = _int_root(base.denominator, q)
+    if denom_root is None:
+        return None
+    return Fraction(num_root, denom_root)
+
+
 def smart_abs(n: ExactNumber) -> ExactNumber:
     """
     Compute absolute value, preserving exact type.
@@ -401,9 +595,7 @@ def smart_abs(n: ExactNumber) -> ExactNumber:
         >>> smart_abs(-sqrt(2))
         sqrt(2)  # SymPy
     """
-    if isinstance(n, int):
-        return abs(n)
-    elif isinstance(n, Fraction):
+    if isinstance(n, _RATIONAL_TYPES):
         return abs(n)
     else:
         # SymPy Expr
@@ -473,7 +665,10 @@ def smart_complex_sqrt(z: ExactComplex) -> Tuple[ExactNumber, ExactNumber]:
     """
     Compute square root of complex number.
 
-    For complex sqrt, result is typically irrational, so delegates to SymPy.
+    Gaussian integers whose modulus is an integer (the common Apollonian
+    case) use the closed form
+    sqrt(a + bi) = sqrt((|z| + a)/2) + sign(b)*i*sqrt((|z| - a)/2)
+    in pure integer arithmetic. Everything else delegates to SymPy.
 
     Args:
         z: Complex number as (real, imag) tuple or SymPy Expr
@@ -488,21 +683,52 @@ def smart_complex_sqrt(z: ExactComplex) -> Tuple[ExactNumber, ExactNumber]:
     # Convert to SymPy complex
     if isinstance(z, tuple):
         z_r, z_i = z
+        if isinstance(z_r, int) and isinstance(z_i, int):
+            root = _gaussian_integer_sqrt(z_r, z_i)
+            if root is not None:
+                return root
         z_sp = to_sympy(z_r) + to_sympy(z_i) * I
     elif isinstance(z, sp.Expr):
         z_sp = z
     else:
         z_sp = to_sympy(z)
 
-    # Take sqrt
-    result_sp = sqrt(z_sp)
-    simplified = simplify(result_sp)
+    # Take sqrt and split into real and imaginary parts in one pass;
+    # sympy_to_exact() simplifies each part
+    real_sp, imag_sp = sqrt(z_sp).as_real_imag()
 
-    # Extract real and imaginary parts
-    real_part = sympy_to_exact(simplify(re(simplified)))
-    imag_part = sympy_to_exact(simplify(im(simplified)))
+    return (sympy_to_exact(real_sp), sympy_to_exact(imag_sp))
 
-    return (real_part, imag_part)
+
+def _gaussian_integer_sqrt(a: int, b: int) -> Optional[Tuple[int, int]]:
+    """
+    Principal square root of a + bi using integer arithmetic only.
+
+    Args:
+        a: Real part
+        b: Imaginary part
+
+    Returns:
+        (real_part, imag_part) as ints, or None if the root is not a
+        Gaussian integer
+    """
+    modulus_sq = a * a + b * b
+    modulus = isqrt(modulus_sq)
+    if modulus * modulus != modulus_sq:
+        return None
+
+    # (|z| + a) and (|z| - a) have the same parity
+    if (modulus + a) % 2:
+        return None
+
+    real_sq = (modulus + a) // 2
+    imag_sq = (modulus - a) // 2
+    real = isqrt(real_sq)
+    imag = isqrt(imag_sq)
+    if real * real != real_sq or imag * imag != imag_sq:
+        return None
+
+    return (real, -imag if b < 0 else imag)
 
 
 def smart_real(z: ExactComplex) -> ExactNumber:
@@ -690,11 +916,17 @@ def to_sympy(n: ExactNumber) -> sp.Expr:
         return sp.Rational(n.numerator, n.denominator)
     elif isinstance(n, int):
         return sp.Integer(n)
-    elif isinstance(n, float):
-        # Discouraged but supported
-        return sp.Float(n)
-    else:
+
+    # Anything else SymPy knows how to convert (float - discouraged but
+    # supported - NumPy scalars, gmpy2 mpz, ...); strict mode rejects strings
+    try:
+        result = sp.sympify(n, strict=True)
+    except sp.SympifyError as exc:
+        raise TypeError(f"Cannot convert {type(n)} to SymPy") from exc
+    # Containers sympify to Tuple/dict/list, which are not expressions
+    if not isinstance(result, sp.Expr):
         raise TypeError(f"Cannot convert {type(n)} to SymPy")
+    return result
 
 
 def to_string(n: ExactNumber) -> str:
@@ -767,6 +999,42 @@ def format_exact(n: ExactNumber) -> str:
         raise TypeError(f"Cannot format {type(n)} as exact string")
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_fraction_body(body: str) -> Fraction:
+    """
+    Parse the "3/2" part of a "frac:3/2" tagged string.
+
+    Memoized like _sympify_cached: curvatures and radii repeat heavily
+    within a gasket, and Fractions are immutable, so repeated bodies skip
+    both int() conversions and the gcd.
+    """
+    numerator, sep, denominator = body.partition("/")
+    if not sep or "/" in denominator:
+        raise ValueError(f"Invalid fraction format: frac:{body}")
+    return Fraction(int(numerator), int(denominator))
+
+
+@functools.lru_cache(maxsize=4096)
+def _sympify_cached(text: str) -> sp.Expr:
+    """
+    sp.sympify() memoized on the stored text.
+
+    Circles of one gasket share a handful of irrational expressions
+    (sqrt(2), sqrt(3)/2, ...), and SymPy expressions are immutable, so
+    each distinct string is parsed once and the result shared.
+    """
+    return sp.sympify(text)
+
+
+# Tag -> parser for the text after "tag:"; one dict lookup replaces a chain
+# of startswith() checks on every exact column read
+_EXACT_PARSERS: Dict[str, Callable[[str], ExactNumber]] = {
+    "int": int,
+    "frac": _parse_fraction_body,
+    "sym": _sympify_cached,
+}
+
+
 def parse_exact(s: str) -> ExactNumber:
     """
     Parse tagged exact number string from database.
@@ -790,17 +1058,17 @@ def parse_exact(s: str) -> ExactNumber:
         >>> parse_exact("sym:7/6 + 2*sqrt(2)/3")
         7/6 + 2*sqrt(2)/3
     """
-    if s.startswith("int:"):
-        return int(s[4:])
-    elif s.startswith("frac:"):
-        parts = s[5:].split("/")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid fraction format: {s}")
-        return Fraction(int(parts[0]), int(parts[1]))
-    elif s.startswith("sym:"):
-        return sp.sympify(s[4:])
-    else:
+    tag, sep, body = s.partition(":")
+    parser = _EXACT_PARSERS.get(tag) if sep else None
+    if parser is None:
         raise ValueError(f"Unknown exact format: {s}")
+    return parser(body)
+
+
+def clear_parse_exact_cache() -> None:
+    """Drop the memoized "frac:"/"sym:" parses behind parse_exact()."""
+    _parse_fraction_body.cache_clear()
+    _sympify_cached.cache_clear()
 
 
 def to_numerator_denominator(n: ExactNumber) -> Tuple[int, int]:
@@ -844,13 +1112,29 @@ def to_numerator_denominator(n: ExactNumber) -> Tuple[int, int]:
                 return (exact.numerator, exact.denominator)
         else:
             # Must convert lossily - WARNING!
-            float_val = float(n.evalf(50))
-            frac = Fraction(float_val).limit_denominator(10**9)
+            frac = _approximate_fraction(n, 10**9)
             return (frac.numerator, frac.denominator)
     else:
         raise TypeError(f"Cannot convert {type(n)} to num/denom")
 
 
+def _approximate_fraction(n: sp.Expr, max_denom: int) -> Fraction:
+    """
+    Approximate a SymPy expression by a Fraction with denominator <= max_denom.
+
+    Evaluates with only as many digits as max_denom can make use of: a
+    float's 17 significant digits for denominators up to 10**12, otherwise
+    enough digits that the Fraction is built from the decimal string rather
+    than being truncated to a float.
+    """
+    precision = max(17, int(log10(max_denom)) + 5)
+    if precision == 17:
+        value = Fraction(float(n.evalf(precision)))
+    else:
+        value = Fraction(str(n.evalf(precision)))
+    return value.limit_denominator(max_denom)
+
+
 def to_fraction_lossy(n: ExactNumber, max_denom: int = 10**9) -> Fraction:
     """
     Convert exact number to Fraction (LOSSY for irrationals).
@@ -879,7 +1163,6 @@ def to_fraction_lossy(n: ExactNumber, max_denom: int = 10**9) -> Fraction:
         return n
     elif isinstance(n, sp.Expr):
         # Lossy conversion
-        float_val = float(n.evalf(50))
-        return Fraction(float_val).limit_denominator(max_denom)
+        return _approximate_fraction(n, max_denom)
     else:
         raise TypeError(f"Cannot convert {type(n)} to Fraction")
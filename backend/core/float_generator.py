@@ -0,0 +1,543 @@
+"""
+Float64 Apollonian Gasket generation for streaming.
+
+Reference: .DESIGN_SPEC.md section 8.2 (Gasket Generation Algorithm)
+
+This module runs the same breadth-first Descartes search as
+core/gasket_generator.py, but keeps curvatures and centers as float64 values
+in a NumPy array while searching. Exact values are only materialized when a
+circle is yielded, via Fraction.limit_denominator().
+
+Use this generator where the output is approximated anyway (WebSocket
+streaming serializes circles with to_dict()). Persistence keeps using the
+exact generator so the TEXT columns stay lossless.
+"""
+
+import cmath
+import math
+from fractions import Fraction
+from typing import Generator, List, Tuple
+
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict
+
+from core.circle_data import CircleData
+from core.exact_math import ExactNumber
+from core.gasket_generator import initialize_standard_gasket
+
+# Circle as (curvature, center_x, center_y) in float64
+FloatCircle = Tuple[float, float, float]
+
+# Largest denominator used when converting float results back to Fractions
+MAX_DENOMINATOR = 10**9
+
+# Curvatures closer to zero than this are treated as straight lines and skipped
+_MIN_CURVATURE = 1e-12
+
+# Upper limit on rows preallocated up front; deeper runs grow by doubling
+_MAX_PREALLOCATED_ROWS = 1 << 20
+
+# numba type of the spatial hash: quantized (curvature, x, y) cell -> row index
+_SPATIAL_KEY_TYPE = types.UniTuple(types.int64, 3)
+
+
+@njit(cache=True)
+def descartes_solve_f64(
+    k1: float, k2: float, k3: float,
+    x1: float, y1: float,
+    x2: float, y2: float,
+    x3: float, y3: float,
+) -> Tuple[FloatCircle, FloatCircle]:
+    """
+    Float64 version of descartes_solve() for the BFS hot path.
+
+    Computes both circles tangent to three mutually tangent circles using
+    plain math/cmath operations. The complex square root does not say which
+    center sign belongs to which curvature root, so the pairing that is
+    tangent to the three given circles is chosen.
+
+    Args:
+        k1, k2, k3: Curvatures of the three circles
+        x1, y1, x2, y2, x3, y3: Centers of the three circles
+
+    Returns:
+        Two (curvature, x, y) tuples. A solution is (nan, nan, nan) when the
+        triplet is invalid or the solution is a straight line.
+
+    Example:
+        >>> descartes_solve_f64(-1.0, 2.0, 2.0, 0.0, 0.0, 0.5, 0.0, -0.5, 0.0)
+        ((3.0, 0.0, 0.666...), (3.0, 0.0, -0.666...))
+    """
+    disc = k1 * k2 + k2 * k3 + k3 * k1
+    if disc < 0.0:
+        return (math.nan, math.nan, math.nan), (math.nan, math.nan, math.nan)
+
+    k_sum = k1 + k2 + k3
+    k_root = 2.0 * math.sqrt(disc)
+
+    z1 = complex(x1, y1)
+    z2 = complex(x2, y2)
+    z3 = complex(x3, y3)
+    kz_sum = k1 * z1 + k2 * z2 + k3 * z3
+    z_root = 2.0 * cmath.sqrt(k1 * k2 * z1 * z2 + k2 * k3 * z2 * z3 + k3 * k1 * z3 * z1)
+
+    k4_plus = k_sum + k_root
+    k4_minus = k_sum - k_root
+
+    # Pair the center signs with the curvature roots the way that best
+    # satisfies tangency; pairing jointly keeps the two solutions distinct
+    # when the curvature roots coincide (disc == 0)
+    best_plus, best_error = _tangent_solution(
+        k4_plus, kz_sum + z_root, z1, z2, z3, k1, k2, k3
+    )
+    best_minus, minus_error = _tangent_solution(
+        k4_minus, kz_sum - z_root, z1, z2, z3, k1, k2, k3
+    )
+    best_error += minus_error
+
+    swapped_plus, plus_error = _tangent_solution(
+        k4_plus, kz_sum - z_root, z1, z2, z3, k1, k2, k3
+    )
+    swapped_minus, minus_error = _tangent_solution(
+        k4_minus, kz_sum + z_root, z1, z2, z3, k1, k2, k3
+    )
+    if plus_error + minus_error < best_error:
+        return swapped_plus, swapped_minus
+
+    return best_plus, best_minus
+
+
+@njit(cache=True)
+def _tangent_solution(
+    k4: float, kz4: complex,
+    z1: complex, z2: complex, z3: complex,
+    k1: float, k2: float, k3: float
+) -> Tuple[FloatCircle, float]:
+    """
+    Build a (k, x, y) solution and its tangency error against three circles.
+
+    Tangent circles have center distance |r4 + ri| with signed radii, so the
+    error is zero for a correctly paired solution.
+    """
+    if abs(k4) < _MIN_CURVATURE:
+        return (math.nan, math.nan, math.nan), 0.0
+
+    z4 = kz4 / k4
+    r4 = 1.0 / k4
+    error = (
+        abs(abs(z4 - z1) - abs(r4 + 1.0 / k1))
+        + abs(abs(z4 - z2) - abs(r4 + 1.0 / k2))
+        + abs(abs(z4 - z3) - abs(r4 + 1.0 / k3))
+    )
+    return (k4, z4.real, z4.imag), error
+
+
+def descartes_reflect_f64_batch(
+    r1: np.ndarray, r2: np.ndarray, r3: np.ndarray, parent: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized float64 descartes_reflect() over a whole BFS frontier.
+
+    Each row of the inputs is a curvature-weighted circle (k, k*x, k*y);
+    row i of r1, r2, r3 and parent forms one Descartes quartet. In these
+    coordinates the reflection of the parent across the triplet
+
+        k' = 2(k1 + k2 + k3) - kp
+        k'z' = 2(k1z1 + k2z2 + k3z3) - kp*zp
+
+    is the same linear map on every column, with no products or division.
+    It needs no square root and never reproduces the parent.
+
+    Args:
+        r1, r2, r3: (N, 3) float64 arrays of weighted triplet circles
+        parent: (N, 3) float64 arrays of the weighted circles to reflect
+
+    Returns:
+        (N, 3) float64 array of weighted new circles. Straight-line results
+        have zero curvature.
+    """
+    return 2.0 * (r1 + r2 + r3) - parent
+
+
+def _best_rational(numerator: int, denominator: int, max_denominator: int) -> Tuple[int, int]:
+    """
+    Closest fraction to numerator/denominator with denominator <= max_denominator.
+
+    Same continued-fraction walk as Fraction.limit_denominator(), but on
+    plain ints so no intermediate Fraction objects are built.
+
+    Returns:
+        (numerator, denominator) of the best approximation, not reduced
+    """
+    if denominator <= max_denominator:
+        return numerator, denominator
+
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = numerator, denominator
+    while True:
+        a = n // d
+        q2 = q0 + a * q1
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+
+    # Choose between the last convergent and the best semiconvergent
+    k = (max_denominator - q0) // q1
+    p_semi, q_semi = p0 + k * p1, q0 + k * q1
+    if abs(p1 * denominator - numerator * q1) * q_semi <= abs(p_semi * denominator - numerator * q_semi) * q1:
+        return p1, q1
+    return p_semi, q_semi
+
+
+def _float_to_exact(value: float) -> ExactNumber:
+    """Convert a float64 result to int or Fraction for CircleData."""
+    if value.is_integer():
+        return int(value)
+    numerator, denominator = _best_rational(*value.as_integer_ratio(), MAX_DENOMINATOR)
+    if denominator == 1:
+        return numerator
+    return Fraction(numerator, denominator)
+
+
+@njit(cache=True)
+def _small_rationals(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compiled fast path of _float_to_exact() for a block of values.
+
+    Walks the continued fraction of each value in float64 and stops at the
+    first convergent p/q that rounds back to the value exactly. Any other
+    fraction with denominator <= MAX_DENOMINATOR is at least
+    1/(q * MAX_DENOMINATOR) away from p/q, so while q stays below
+    1/(MAX_DENOMINATOR * ulp) the convergent is provably what
+    limit_denominator() would return.
+
+    Returns:
+        (numerators, denominators) int64 arrays; denominator 0 marks values
+        that need the exact Python path
+    """
+    numerators = np.zeros(len(values), dtype=np.int64)
+    denominators = np.zeros(len(values), dtype=np.int64)
+    for i in range(len(values)):
+        v = values[i]
+        # ulp(v) <= 2**-52 * max(|v|, 1), so this bound is conservative
+        max_q = 1.0 / (MAX_DENOMINATOR * 2.0**-52 * max(abs(v), 1.0))
+        if max_q < 1.0:
+            continue
+
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        x = v
+        for _ in range(64):
+            a = math.floor(x)
+            p2 = int(a) * p1 + p0
+            q2 = int(a) * q1 + q0
+            if q2 > max_q:
+                break
+            if p2 / q2 == v:
+                numerators[i] = p2
+                denominators[i] = q2
+                break
+            remainder = x - a
+            if remainder == 0.0:
+                break
+            x = 1.0 / remainder
+            p0, q0, p1, q1 = p1, q1, p2, q2
+
+    return numerators, denominators
+
+
+def _to_circle_data(rows: np.ndarray, generations: np.ndarray) -> List[CircleData]:
+    """
+    Materialize a block of float64 (k, x, y) rows as CircleData.
+
+    The block is converted in one _small_rationals() call and one tolist()
+    call, rather than one NumPy scalar access per value; only values the
+    compiled fast path cannot settle go through _float_to_exact().
+    """
+    flat = np.ascontiguousarray(rows).reshape(-1)
+    numerators, denominators = _small_rationals(flat)
+
+    exact = [
+        _float_to_exact(v) if d == 0 else n if d == 1 else Fraction(n, d)
+        for v, n, d in zip(flat.tolist(), numerators.tolist(), denominators.tolist())
+    ]
+    return [
+        CircleData(
+            curvature=exact[3 * i],
+            center=(exact[3 * i + 1], exact[3 * i + 2]),
+            generation=generation,
+            parent_ids=[],
+        )
+        for i, generation in enumerate(generations.tolist())
+    ]
+
+
+@njit(cache=True)
+def _spatial_key(k: float, x: float, y: float, tolerance: float) -> Tuple[int, int, int]:
+    """Quantize a float circle to its spatial hash cell."""
+    return (
+        int(math.floor(k / tolerance + 0.5)),
+        int(math.floor(x / tolerance + 0.5)),
+        int(math.floor(y / tolerance + 0.5)),
+    )
+
+
+@njit(cache=True)
+def _is_duplicate_f64(
+    k: float, x: float, y: float,
+    coords: np.ndarray,
+    spatial_index: Dict,
+    tolerance: float
+) -> bool:
+    """Check the circle's spatial hash cell and its 26 neighbours for a match."""
+    k_cell, x_cell, y_cell = _spatial_key(k, x, y, tolerance)
+    for dk in range(-1, 2):
+        for dx in range(-1, 2):
+            for dy in range(-1, 2):
+                cell = (k_cell + dk, x_cell + dx, y_cell + dy)
+                if cell not in spatial_index:
+                    continue
+                i = spatial_index[cell]
+                if (
+                    abs(k - coords[i, 0]) < tolerance
+                    and abs(x - coords[i, 1]) < tolerance
+                    and abs(y - coords[i, 2]) < tolerance
+                ):
+                    return True
+    return False
+
+
+@njit(cache=True)
+def _accept_candidates(
+    coords: np.ndarray,
+    weighted: np.ndarray,
+    count: int,
+    candidates: np.ndarray,
+    spatial_index: Dict,
+    tolerance: float
+) -> np.ndarray:
+    """
+    Deduplicate one layer of weighted (k, k*x, k*y) candidates against the spatial hash.
+
+    Candidates are checked in order against every accepted circle, including
+    those accepted earlier in the same layer. Accepted circles are written
+    from row ``count`` onward, as (k, x, y) to coords and unchanged to
+    weighted; the caller must size both for every candidate.
+
+    Returns:
+        Boolean mask of accepted candidates
+    """
+    accepted = np.zeros(len(candidates), dtype=np.bool_)
+    for c in range(len(candidates)):
+        k = candidates[c, 0]
+        if not math.isfinite(k) or abs(k) < _MIN_CURVATURE:
+            continue
+        x = candidates[c, 1] / k
+        y = candidates[c, 2] / k
+        if _is_duplicate_f64(k, x, y, coords, spatial_index, tolerance):
+            continue
+
+        coords[count, 0] = k
+        coords[count, 1] = x
+        coords[count, 2] = y
+        weighted[count, 0] = k
+        weighted[count, 1] = candidates[c, 1]
+        weighted[count, 2] = candidates[c, 2]
+        spatial_index[_spatial_key(k, x, y, tolerance)] = count
+        accepted[c] = True
+        count += 1
+
+    return accepted
+
+
+def _initial_capacity(num_initial: int, max_depth: int) -> int:
+    """
+    Upper bound on the circle count of a gasket, capped for preallocation.
+
+    Generation g holds at most 2 * 3**(g - 1) circles, so a gasket of depth n
+    has fewer than num_initial + 3**n circles.
+    """
+    if max_depth >= 13:  # 3**13 already exceeds _MAX_PREALLOCATED_ROWS
+        return _MAX_PREALLOCATED_ROWS
+    return min(num_initial + 3**max_depth, _MAX_PREALLOCATED_ROWS)
+
+
+def _ensure_rows(array: np.ndarray, rows: int) -> np.ndarray:
+    """Grow a buffer (at least doubling) so it has room for ``rows`` rows."""
+    if rows <= len(array):
+        return array
+    grown = np.empty((max(rows, 2 * len(array)),) + array.shape[1:], dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+def _float_layers(
+    initial_circles: List[CircleData],
+    max_depth: int,
+    tolerance: float
+) -> Generator[Tuple[np.ndarray, np.ndarray, int, int], None, None]:
+    """
+    Run the layer-synchronous float64 BFS, one depth layer per step.
+
+    Yields:
+        (coords, generations, layer_start, layer_end) after each layer,
+        starting with the initial circles as layer 0. coords holds float64
+        (k, x, y) rows and generations their depth; both buffers may be
+        reallocated between layers, so use the arrays from the latest step.
+    """
+    capacity = _initial_capacity(len(initial_circles), max_depth)
+    coords = np.empty((capacity, 3), dtype=np.float64)
+    # Curvature-weighted (k, k*x, k*y) rows, in which reflection is linear
+    weighted = np.empty((capacity, 3), dtype=np.float64)
+    generations = np.empty(capacity, dtype=np.int16)
+    spatial_index = Dict.empty(key_type=_SPATIAL_KEY_TYPE, value_type=types.int64)
+
+    for i, circle in enumerate(initial_circles):
+        k, x, y = float(circle.curvature), float(circle.center[0]), float(circle.center[1])
+        coords[i] = (k, x, y)
+        weighted[i] = (k, k * x, k * y)
+        spatial_index[_spatial_key(k, x, y, tolerance)] = i
+    count = len(initial_circles)
+    generations[:count] = 0
+    yield coords, generations, 0, count
+
+    # Solve the initial triplet once with the full Descartes theorem;
+    # its two solutions are the first layer of candidates
+    if count >= 3:
+        (k1, x1, y1), (k2, x2, y2), (k3, x3, y3) = coords[:3].tolist()
+        candidates = np.array(descartes_solve_f64(k1, k2, k3, x1, y1, x2, y2, x3, y3))
+        candidates[:, 1:] *= candidates[:, :1]
+        triplets = (np.array([0, 0]), np.array([1, 1]), np.array([2, 2]))
+    else:
+        candidates = np.empty((0, 3), dtype=np.float64)
+
+    # Every candidate of the current depth is deduplicated in one kernel
+    # call, then the next layer is computed with one vectorized reflection
+    # over all child quartets
+    depth = 0
+    while len(candidates) and depth < max_depth:
+        coords = _ensure_rows(coords, count + len(candidates))
+        weighted = _ensure_rows(weighted, count + len(candidates))
+        generations = _ensure_rows(generations, count + len(candidates))
+
+        layer_start = count
+        accepted = _accept_candidates(
+            coords, weighted, count, candidates, spatial_index, tolerance
+        )
+        count += int(accepted.sum())
+        depth += 1
+
+        generations[layer_start:count] = depth
+        yield coords, generations, layer_start, count
+
+        if depth == max_depth:
+            break
+
+        # Each accepted circle replaces one member of its triplet in three
+        # child quartets; the replaced member is the circle to reflect
+        source = np.nonzero(accepted)[0]
+        t1, t2, t3 = (t[source] for t in triplets)
+        new_rows = np.repeat(np.arange(layer_start, count), 3)
+        f1 = np.stack([t1, t2, t3], axis=1).ravel()
+        f2 = np.stack([t2, t3, t1], axis=1).ravel()
+        parents = np.stack([t3, t1, t2], axis=1).ravel()
+
+        triplets = (f1, f2, new_rows)
+        candidates = descartes_reflect_f64_batch(
+            weighted[f1], weighted[f2], weighted[new_rows], weighted[parents]
+        )
+
+
+def generate_gasket_array(
+    initial_curvatures: List[Fraction],
+    max_depth: int,
+    tolerance: float = 1e-9
+) -> np.ndarray:
+    """
+    Generate an Apollonian gasket as a raw float64 array.
+
+    Runs the same BFS as generate_apollonian_gasket() but skips building
+    CircleData and converting values to int/Fraction, for consumers that
+    only need coordinates (rendering, numerical analysis).
+
+    Args:
+        initial_curvatures: List of 3-4 curvatures for initial circles
+        max_depth: Maximum recursion depth (generation level)
+        tolerance: Absolute tolerance for duplicate detection (default 1e-9)
+
+    Returns:
+        (N, 4) float64 array of (curvature, center_x, center_y, generation)
+        rows in generation order
+
+    Example:
+        >>> generate_gasket_array([Fraction(-1), Fraction(2), Fraction(2)], 1)[:, 0]
+        array([-1.,  2.,  2.,  3.,  3.])
+    """
+    initial_circles = initialize_standard_gasket(initial_curvatures)
+    for coords, generations, _, count in _float_layers(initial_circles, max_depth, tolerance):
+        pass
+
+    result = np.empty((count, 4), dtype=np.float64)
+    result[:, :3] = coords[:count]
+    result[:, 3] = generations[:count]
+    return result
+
+
+def generate_apollonian_gasket(
+    initial_curvatures: List[Fraction],
+    max_depth: int,
+    stream: bool = False,
+    tolerance: float = 1e-9
+) -> Generator[CircleData, None, None]:
+    """
+    Generate an Apollonian gasket using float64 breadth-first search.
+
+    Drop-in replacement for core.gasket_generator.generate_apollonian_gasket()
+    when approximate output is acceptable. The initial circles are placed
+    exactly and yielded unchanged; every generated circle is computed in
+    float64 one depth layer at a time and written into preallocated buffers
+    sized from the gasket's growth bound (see _initial_capacity()). Only
+    the initial triplet needs descartes_solve_f64(); every later layer comes
+    from one vectorized descartes_reflect_f64_batch() call, and is
+    deduplicated by the compiled _accept_candidates() kernel. Values are
+    converted to int/Fraction only for output, one depth layer at a time, so
+    streaming consumers receive each layer as a burst of already-built
+    circles.
+
+    Args:
+        initial_curvatures: List of 3-4 curvatures for initial circles
+        max_depth: Maximum recursion depth (generation level)
+        stream: If True, yield circles as generated (for WebSocket streaming).
+                If False, collect all circles and yield at the end.
+        tolerance: Absolute tolerance for duplicate detection (default 1e-9)
+
+    Yields:
+        CircleData objects with int/Fraction values
+
+    Reference:
+        .DESIGN_SPEC.md section 8.2 - BFS gasket generation algorithm
+    """
+    # Step 1: Initialize starting circles exactly; the BFS projects them to float64
+    initial_circles = initialize_standard_gasket(initial_curvatures)
+    num_initial = len(initial_circles)
+
+    if stream:
+        for circle in initial_circles:
+            yield circle
+
+    # Step 2: Run the BFS; layer 0 is the initial circles, yielded exactly
+    for coords, generations, layer_start, count in _float_layers(
+        initial_circles, max_depth, tolerance
+    ):
+        if stream and layer_start > 0:
+            # Materialize the whole layer at once, then hand it out
+            yield from _to_circle_data(
+                coords[layer_start:count], generations[layer_start:count]
+            )
+
+    # Step 3: If not streaming, yield all circles at the end
+    if not stream:
+        for circle in initial_circles:
+            yield circle
+        yield from _to_circle_data(coords[num_initial:count], generations[num_initial:count])
@@ -9,31 +9,123 @@ using the Descartes Circle Theorem and breadth-first search.
 
 import math
 from fractions import Fraction
-from typing import List, Generator, Set, Tuple
-from collections import deque
-import sympy as sp
+from typing import Dict, List, Generator, Optional, Set, Tuple, Union
+
+import numpy as np
 
 from core.circle_data import CircleData
-from core.exact_math import ExactNumber, ExactComplex, smart_abs, smart_divide
-from core.descartes import descartes_solve
+from core.exact_math import (
+    ExactNumber, ExactComplex, smart_abs, smart_add, smart_divide, smart_multiply, smart_sqrt
+)
+from core.descartes import descartes_solve, descartes_reflect, descartes_reflect_quartet
+
+
+# Spatial hash for duplicate detection, keyed on the quantized curvature
+# first: curvature cell -> (x cell, y cell) -> circles. Lookups test the cheap
+# curvature key before touching any center cells.
+SpatialIndex = Dict[int, Dict[Tuple[int, int], List[CircleData]]]
+
+# Offsets of a center cell and its 8 neighbours
+_CENTER_NEIGHBOR_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+
+# Width of one signed field in a packed circle key
+_KEY_FIELD_BITS = 64
+_KEY_FIELD_MASK = (1 << _KEY_FIELD_BITS) - 1
+
+
+def _pack_key(k_f: float, x_f: float, y_f: float, inv_tol: float) -> int:
+    """
+    Pack a circle's quantized (curvature, x, y) into a single int set key.
+
+    Each coordinate is rounded to a multiple of the tolerance and stored in
+    its own 64-bit two's-complement field, so distinct cells never share a
+    key. Two circles with equal keys agree to within tolerance in all three
+    coordinates; circles straddling a cell boundary are left to
+    is_duplicate().
+    """
+    return (
+        (int(round(k_f * inv_tol)) & _KEY_FIELD_MASK) << (2 * _KEY_FIELD_BITS)
+        | (int(round(x_f * inv_tol)) & _KEY_FIELD_MASK) << _KEY_FIELD_BITS
+        | (int(round(y_f * inv_tol)) & _KEY_FIELD_MASK)
+    )
+
+
+def _spatial_key(
+    k_f: float, x_f: float, y_f: float, tolerance: float
+) -> Tuple[int, int, int]:
+    """
+    Quantize a circle's float projection to its spatial hash cell.
+
+    Cells are ``tolerance`` wide, so any two circles within tolerance of
+    each other land in the same or adjacent cells.
+    """
+    return (
+        int(round(k_f / tolerance)),
+        int(round(x_f / tolerance)),
+        int(round(y_f / tolerance)),
+    )
+
+
+def add_to_spatial_index(
+    index: SpatialIndex,
+    circle: CircleData,
+    tolerance: float = 1e-10
+) -> None:
+    """
+    Insert a circle into a spatial hash index used by is_duplicate().
+
+    Args:
+        index: Spatial index to update in place
+        circle: Circle to insert
+        tolerance: Cell width; must match the tolerance used for lookups
+    """
+    k_cell, x_cell, y_cell = _spatial_key(*circle.as_floats(), tolerance)
+    index.setdefault(k_cell, {}).setdefault((x_cell, y_cell), []).append(circle)
+
+
+def _matches_any(
+    k_f: float, x_f: float, y_f: float,
+    circles: List[CircleData],
+    tolerance: float
+) -> bool:
+    """Compare a float projection against circles' cached float projections."""
+    for existing in circles:
+        existing_k, existing_x, existing_y = existing.as_floats()
+        # Check curvature first; centers only when it matches
+        if (
+            abs(k_f - existing_k) < tolerance
+            and abs(x_f - existing_x) < tolerance
+            and abs(y_f - existing_y) < tolerance
+        ):
+            return True
+    return False
 
 
 def is_duplicate(
     curvature: ExactNumber,
     center: Tuple[ExactNumber, ExactNumber],
-    existing_circles: List[CircleData],
+    existing_circles: Union[List[CircleData], SpatialIndex],
     tolerance: float = 1e-10
 ) -> bool:
     """
     Check if a circle is a duplicate of any existing circle.
 
     Uses numerical tolerance to handle floating-point precision issues
-    in square root calculations during Descartes theorem.
+    in square root calculations during Descartes theorem. Values are
+    compared as floats: the candidate is converted once per call and each
+    existing circle's projection is cached by CircleData.as_floats().
+
+    existing_circles may be a plain list (scanned linearly) or a spatial
+    index built with add_to_spatial_index(). With an index only the
+    circle's cell and its 26 neighbours are compared, so lookups stay
+    O(1) on average as the gasket grows; the curvature cells are probed
+    first, so most lookups end after three dict misses.
 
     Args:
         curvature: Curvature of the circle to check
         center: Center coordinates as (x, y) tuple of Fractions
-        existing_circles: List of CircleData objects to check against
+        existing_circles: List of CircleData objects or SpatialIndex to check against
         tolerance: Maximum difference for considering values equal (default 1e-10)
 
     Returns:
@@ -42,18 +134,30 @@ def is_duplicate(
     Reference:
         ISSUES.md Issue #3 - Incomplete deduplication in BFS
     """
-    for existing in existing_circles:
-        # Check curvature match (handle ExactNumber types)
-        curvature_diff = float(smart_abs(curvature - existing.curvature))
-        if curvature_diff < tolerance:
-            # Check center coordinates match (handle ExactNumber types)
-            center_x_diff = float(smart_abs(center[0] - existing.center[0]))
-            center_y_diff = float(smart_abs(center[1] - existing.center[1]))
+    k_f, x_f, y_f = float(curvature), float(center[0]), float(center[1])
+    return _is_duplicate_floats(k_f, x_f, y_f, existing_circles, tolerance)
 
-            if center_x_diff < tolerance and center_y_diff < tolerance:
-                return True
 
-    return False
+def _is_duplicate_floats(
+    k_f: float, x_f: float, y_f: float,
+    existing_circles: Union[List[CircleData], SpatialIndex],
+    tolerance: float
+) -> bool:
+    """is_duplicate() for a candidate already projected to floats."""
+    if isinstance(existing_circles, dict):
+        k_cell, x_cell, y_cell = _spatial_key(k_f, x_f, y_f, tolerance)
+        for k_neighbor in (k_cell - 1, k_cell, k_cell + 1):
+            # Most candidates share no curvature cell with any circle
+            center_cells = existing_circles.get(k_neighbor)
+            if not center_cells:
+                continue
+            for dx, dy in _CENTER_NEIGHBOR_OFFSETS:
+                bucket = center_cells.get((x_cell + dx, y_cell + dy))
+                if bucket and _matches_any(k_f, x_f, y_f, bucket, tolerance):
+                    return True
+        return False
+
+    return _matches_any(k_f, x_f, y_f, existing_circles, tolerance)
 
 
 def verify_tangency(
@@ -77,40 +181,98 @@ def verify_tangency(
     Reference:
         ISSUES.md Issue #2 - Tangency verification for exact placement
     """
-    # Calculate actual distance between centers (handle ExactNumber types)
-    x1, y1 = circle1.center
-    x2, y2 = circle2.center
-
-    # Compute distance - handle SymPy expressions
-    dx = x2 - x1
-    dy = y2 - y1
-    distance_squared = dx**2 + dy**2
-
-    # Convert to float for numerical comparison
-    if isinstance(distance_squared, sp.Expr):
-        actual_distance = float(sp.sqrt(distance_squared))
+    # Calculate expected tangency distance from the circles' cached radii
+    if circle1.curvature != 0 and circle2.curvature != 0:
+        expected_dist = smart_abs(smart_add(circle1.radius(), circle2.radius()))
     else:
-        actual_distance = float(distance_squared ** 0.5)
+        expected_dist = _compute_tangent_distance(circle1.curvature, circle2.curvature)
 
-    # Calculate expected tangency distance
-    expected_dist = _compute_tangent_distance(circle1.curvature, circle2.curvature)
+    # Rational circles: compare squared distances exactly (no sqrt, no error)
+    if _is_exactly_tangent(circle1.center, circle2.center, expected_dist):
+        return True
 
-    # Convert to float for comparison
-    if isinstance(expected_dist, sp.Expr):
-        expected_distance = float(expected_dist)
-    else:
-        expected_distance = float(expected_dist)
+    # Otherwise compare in floats, using the cached float projections
+    _, x1, y1 = circle1.as_floats()
+    _, x2, y2 = circle2.as_floats()
+    actual_distance = math.hypot(x2 - x1, y2 - y1)
+
+    # Convert to float for comparison (works for SymPy values too)
+    expected_distance = float(expected_dist)
 
     # Check if they match within tolerance
     error = abs(actual_distance - expected_distance)
     return error < tolerance
 
 
+def verify_tangency_batch(
+    circles: List[CircleData],
+    tolerance: float = 1e-10,
+    screen_tolerance: float = 1e-8,
+) -> np.ndarray:
+    """
+    Verify tangency for every pair of circles at once.
+
+    Screens all pairs with float64 broadcasting over the cached float
+    projections, comparing squared center distances against the squared
+    tangency distances; only pairs within screen_tolerance of tangency are
+    re-checked with verify_tangency() (exact for rational circles).
+
+    Args:
+        circles: CircleData objects to check pairwise
+        tolerance: Tolerance passed to verify_tangency() for the re-check
+        screen_tolerance: Float distance error below which a pair is
+            re-checked; anything further off is rejected outright
+
+    Returns:
+        Symmetric (N, N) bool array; entry [i, j] is True if circles i and
+        j are tangent. The diagonal is False.
+    """
+    n = len(circles)
+    floats = np.array([c.as_floats() for c in circles], dtype=np.float64).reshape(n, 3)
+    ks, xs, ys = floats[:, 0], floats[:, 1], floats[:, 2]
+
+    # Signed radii, with radius 1 for straight lines as in
+    # _compute_tangent_distance()
+    nonzero = ks != 0
+    rs = np.ones(n)
+    np.divide(1.0, ks, out=rs, where=nonzero)
+
+    dist_sq = (xs[:, None] - xs[None, :]) ** 2 + (ys[:, None] - ys[None, :]) ** 2
+    expected = np.abs(rs[:, None] + rs[None, :])
+    candidates = np.abs(np.sqrt(dist_sq) - expected) < screen_tolerance
+    np.fill_diagonal(candidates, False)
+
+    tangent = np.zeros((n, n), dtype=bool)
+    for i, j in zip(*np.nonzero(np.triu(candidates))):
+        if verify_tangency(circles[i], circles[j], tolerance):
+            tangent[i, j] = tangent[j, i] = True
+    return tangent
+
+
+def _is_exactly_tangent(
+    center1: ExactComplex, center2: ExactComplex, distance: ExactNumber
+) -> bool:
+    """
+    Exact check |center2 - center1|² == distance² for int/Fraction values.
+
+    Returns False if any value is irrational (SymPy), leaving the decision
+    to the tolerance-based float comparison.
+    """
+    x1, y1 = center1
+    x2, y2 = center2
+    if not all(isinstance(v, (int, Fraction)) for v in (x1, y1, x2, y2, distance)):
+        return False
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy == distance * distance
+
+
 def _compute_tangent_distance(k1: ExactNumber, k2: ExactNumber) -> ExactNumber:
     """
     Compute exact distance between centers of two tangent circles.
 
     Uses hybrid exact arithmetic to preserve exactness for all number types.
+    Both tangency types reduce to |1/k1 + 1/k2| with signed radii.
 
     Args:
         k1, k2: Curvatures of two circles as ExactNumber
@@ -121,27 +283,13 @@ def _compute_tangent_distance(k1: ExactNumber, k2: ExactNumber) -> ExactNumber:
     Reference:
         ISSUES.md Issue #2 - Exact rational arithmetic for initial placement
     """
-    # Calculate radii using smart_divide for exact arithmetic
-    r1 = smart_divide(1, smart_abs(k1)) if k1 != 0 else 1
-    r2 = smart_divide(1, smart_abs(k2)) if k2 != 0 else 1
-
-    # Determine tangency type based on curvature signs
-    # Use float comparison for SymPy expressions
-    k1_positive = float(k1) > 0 if isinstance(k1, sp.Expr) else k1 > 0
-    k2_positive = float(k2) > 0 if isinstance(k2, sp.Expr) else k2 > 0
-
-    if k1_positive and k2_positive:
-        # Both circles external - distance is sum of radii
-        return r1 + r2
-    elif not k1_positive and k2_positive:
-        # Circle 1 encloses circle 2 - distance is difference
-        return smart_abs(r1) - r2
-    elif k1_positive and not k2_positive:
-        # Circle 2 encloses circle 1 - distance is difference
-        return smart_abs(r2) - r1
-    else:
-        # Both negative (both enclosing) - edge case
-        return smart_abs(smart_abs(r1) - smart_abs(r2))
+    # Signed radii: an enclosing circle (k < 0) has a negative radius, so
+    # |r1 + r2| is the sum of radii for external tangency and the
+    # difference for internal tangency
+    r1 = smart_divide(1, k1) if k1 != 0 else 1
+    r2 = smart_divide(1, k2) if k2 != 0 else 1
+
+    return smart_abs(smart_add(r1, r2))
 
 
 def _solve_third_circle_position_exact(
@@ -150,12 +298,22 @@ def _solve_third_circle_position_exact(
     c2_pos: Tuple[Fraction, Fraction]
 ) -> Tuple[ExactNumber, ExactNumber]:
     """
-    Solve for exact position of third circle using symbolic math.
+    Solve for exact position of third circle in closed form.
 
     Given two circles with known positions, finds the exact position
-    of a third circle that is tangent to both, using sympy for
-    exact rational arithmetic throughout. Uses hybrid exact arithmetic
-    to preserve irrational values (sqrt expressions) as SymPy Expr types.
+    of a third circle that is tangent to both. Subtracting the two
+    tangency equations
+
+        |p - c1|² = d13²,   |p - c2|² = d23²
+
+    leaves a linear equation, so with v = c2 - c1 the solutions are
+
+        p = c1 + t·v ± s·v⊥,   t = (d13² - d23² + |v|²) / (2|v|²),
+                               s² = d13² / |v|² - t²
+
+    where v⊥ = (-vy, vx). Everything is rational except the one square
+    root s, which stays exact through hybrid exact arithmetic (SymPy Expr
+    when irrational).
 
     Args:
         k1, k2, k3: Curvatures of the three circles
@@ -163,97 +321,49 @@ def _solve_third_circle_position_exact(
         c2_pos: Position (x, y) of circle 2 as Fractions
 
     Returns:
-        Position (x, y) of circle 3 as ExactNumber tuple
+        Position (x, y) of circle 3 as ExactNumber tuple, taking the
+        solution with the larger y (above the line c1-c2 when it is
+        horizontal)
         - int for integer values
         - Fraction for rational values
         - SymPy Expr for irrational values (sqrt, etc.)
 
+    Raises:
+        ValueError: If the circles cannot all be tangent
+
     Reference:
         ISSUES.md Issue #2 - Exact rational geometry for initial placement
         .DESIGN_SPEC.md section 8.4 - Hybrid exact arithmetic system
     """
-    # Define symbolic variables (use real=True, not rational=True)
-    # Solutions often involve square roots which are irrational
-    x, y = sp.symbols('x y', real=True)
-
-    # Convert Fractions to sympy expressions
-    x1 = sp.Rational(c1_pos[0].numerator, c1_pos[0].denominator)
-    y1 = sp.Rational(c1_pos[1].numerator, c1_pos[1].denominator)
-    x2 = sp.Rational(c2_pos[0].numerator, c2_pos[0].denominator)
-    y2 = sp.Rational(c2_pos[1].numerator, c2_pos[1].denominator)
+    x1, y1 = c1_pos
+    vx = smart_add(c2_pos[0], smart_multiply(-1, x1))
+    vy = smart_add(c2_pos[1], smart_multiply(-1, y1))
+    v_sq = smart_add(smart_multiply(vx, vx), smart_multiply(vy, vy))
+    if v_sq == 0:
+        raise ValueError("Cannot find exact tangent position for concentric circles")
 
     # Calculate target distances
     d13 = _compute_tangent_distance(k1, k3)
     d23 = _compute_tangent_distance(k2, k3)
+    d13_sq = smart_multiply(d13, d13)
 
-    # Convert to sympy Rationals
-    d13_sp = sp.Rational(d13.numerator, d13.denominator)
-    d23_sp = sp.Rational(d23.numerator, d23.denominator)
-
-    # Set up tangency constraint equations
-    # (x - x1)^2 + (y - y1)^2 = d13^2
-    # (x - x2)^2 + (y - y2)^2 = d23^2
-    eq1 = sp.Eq((x - x1)**2 + (y - y1)**2, d13_sp**2)
-    eq2 = sp.Eq((x - x2)**2 + (y - y2)**2, d23_sp**2)
-
-    # Solve the system symbolically
-    solutions = sp.solve([eq1, eq2], [x, y])
-
-    if not solutions:
-        # Fallback to approximate solution if symbolic solving fails
+    # Position of the foot point along v, and offset along v⊥
+    t = smart_divide(
+        smart_add(smart_add(d13_sq, smart_multiply(-1, smart_multiply(d23, d23))), v_sq),
+        smart_multiply(2, v_sq),
+    )
+    s_sq = smart_add(smart_divide(d13_sq, v_sq), smart_multiply(-1, smart_multiply(t, t)))
+    if float(s_sq) < 0:
         raise ValueError("Cannot find exact tangent position for given curvatures")
+    s = smart_sqrt(s_sq)
 
-    # Choose the solution with positive y (above x-axis)
-    # If multiple solutions, prefer the one with y > 0
-    best_solution = None
-    for sol in solutions:
-        x_val, y_val = sol
-
-        # Convert SymPy expressions to hybrid exact types
-        # Rationals → int/Fraction, Irrationals → SymPy Expr (preserves exactness)
-        try:
-            # Use hybrid exact arithmetic: keep int/Fraction for rationals, SymPy for irrationals
-            if isinstance(x_val, sp.Rational):
-                # Rational value - convert to int or Fraction
-                if x_val.q == 1:
-                    x_exact = int(x_val.p)
-                else:
-                    x_exact = Fraction(int(x_val.p), int(x_val.q))
-            else:
-                # Irrational value - keep as SymPy Expr (preserves sqrt, etc.)
-                x_exact = x_val
-
-            if isinstance(y_val, sp.Rational):
-                # Rational value - convert to int or Fraction
-                if y_val.q == 1:
-                    y_exact = int(y_val.p)
-                else:
-                    y_exact = Fraction(int(y_val.p), int(y_val.q))
-            else:
-                # Irrational value - keep as SymPy Expr (preserves sqrt, etc.)
-                y_exact = y_val
-
-            # Prefer solution with y > 0 (above x-axis)
-            # Use float comparison for SymPy expressions
-            if best_solution is None:
-                best_solution = (x_exact, y_exact)
-            else:
-                # Compare y values (handle both Fraction and SymPy types)
-                if isinstance(y_exact, (int, Fraction)) and isinstance(best_solution[1], (int, Fraction)):
-                    if y_exact > best_solution[1]:
-                        best_solution = (x_exact, y_exact)
-                else:
-                    # At least one is SymPy - use float comparison
-                    if float(y_exact) > float(best_solution[1]):
-                        best_solution = (x_exact, y_exact)
-        except (ValueError, AttributeError, TypeError) as e:
-            # Skip solutions that can't be converted
-            continue
-
-    if best_solution is None:
-        raise ValueError("Cannot convert symbolic solution to ExactNumber types")
+    # Prefer the solution with the larger y: y = y1 + t·vy ± s·vx
+    if float(vx) < 0:
+        s = smart_multiply(-1, s)
 
-    return best_solution
+    x = smart_add(smart_add(x1, smart_multiply(t, vx)), smart_multiply(-1, smart_multiply(s, vy)))
+    y = smart_add(smart_add(y1, smart_multiply(t, vy)), smart_multiply(s, vx))
+    return (x, y)
 
 
 def initialize_standard_gasket(curvatures: List[Fraction]) -> List[CircleData]:
@@ -290,14 +400,17 @@ def _initialize_three_circles(curvatures: List[Fraction]) -> List[CircleData]:
     """
     Initialize gasket with 3 circles in standard configuration using exact geometry.
 
-    Uses exact rational arithmetic with symbolic solving:
+    Uses exact rational arithmetic:
     - Circle 1: at origin (0, 0)
     - Circle 2: on x-axis, tangent to circle 1
-    - Circle 3: positioned using symbolic solving to be exactly tangent to both
+    - Circle 3: above the x-axis, placed in closed form to be exactly
+      tangent to both
 
-    This implementation uses sympy to solve the tangency constraints exactly,
-    avoiding floating-point approximations that would compromise the goal of
-    exact rational arithmetic throughout the system.
+    For this placement the closed form is the law of cosines: the third
+    center follows directly from the three tangent distances (one exact
+    square root, no trigonometry or symbolic solving), avoiding
+    floating-point approximations that would compromise the goal of exact
+    rational arithmetic throughout the system.
 
     Args:
         curvatures: List of exactly 3 curvatures
@@ -350,17 +463,29 @@ def _initialize_three_circles(curvatures: List[Fraction]) -> List[CircleData]:
             parent_ids=[],
         )
 
-        # Circle 3: solve for exact position using symbolic math
-        # This solves the system of equations:
-        # distance(c1, c3) = tangent_distance(k1, k3)
-        # distance(c2, c3) = tangent_distance(k2, k3)
-        try:
-            c3_pos = _solve_third_circle_position_exact(k1, k2, k3, c1_pos, c2_pos)
-        except ValueError as e:
-            # If symbolic solving fails, raise with context
-            raise ValueError(
-                f"Cannot compute exact tangent position for curvatures {k1}, {k2}, {k3}: {e}"
+        # Circle 3: solve for exact position in closed form
+        if k1 == k2 == k3 and isinstance(d12, (int, Fraction)):
+            # Equilateral case, e.g. (1, 1, 1): the centers form an
+            # equilateral triangle of side d12, so c3 = (d12/2, d12·√3/2)
+            # exactly, without going through smart_sqrt()/simplify
+            import sympy as sp
+
+            half_d12 = smart_divide(d12, 2)
+            c3_pos = (
+                half_d12,
+                sp.Rational(half_d12.numerator, half_d12.denominator) * sp.sqrt(3),
             )
+        else:
+            # This solves the system of equations:
+            # distance(c1, c3) = tangent_distance(k1, k3)
+            # distance(c2, c3) = tangent_distance(k2, k3)
+            # With c1 at the origin and c2 on the x-axis this is the law of cosines
+            try:
+                c3_pos = _solve_third_circle_position_exact(k1, k2, k3, c1_pos, c2_pos)
+            except ValueError as e:
+                raise ValueError(
+                    f"Cannot compute exact tangent position for curvatures {k1}, {k2}, {k3}: {e}"
+                )
 
     c3 = CircleData(
         curvature=k3,
@@ -404,6 +529,170 @@ def _initialize_four_circles(curvatures: List[Fraction]) -> List[CircleData]:
     )
 
 
+def _initial_children(
+    c1: CircleData, c2: CircleData, c3: CircleData
+) -> List[CircleData]:
+    """
+    Compute the two first-generation circles tangent to the initial triplet.
+
+    Uses descartes_solve() and keeps solutions that pass verify_tangency().
+    The two solutions are reflections of each other, so if only one passes
+    the other is recovered exactly with descartes_reflect().
+
+    Args:
+        c1, c2, c3: The three initial circles
+
+    Returns:
+        List of 0, 1 or 2 CircleData objects with generation 1 (none if the
+        circles cannot be mutually tangent; one if the other solution is a
+        straight line)
+    """
+    # An invalid triplet has a negative Descartes discriminant
+    k1, k2, k3 = (c.as_floats()[0] for c in (c1, c2, c3))
+    if k1 * k2 + k2 * k3 + k3 * k1 < 0.0:
+        return []
+
+    triplet = [(c.curvature, c.center) for c in (c1, c2, c3)]
+    # A straight-line solution (k == 0) has no center; the other is kept
+    solutions = [(k, z) for k, z in descartes_solve(*triplet) if k != 0]
+
+    tangent = [
+        (k, z) for k, z in solutions
+        if all(
+            verify_tangency(CircleData(curvature=k, center=z, generation=1), parent)
+            for parent in (c1, c2, c3)
+        )
+    ]
+    if not tangent:
+        return []
+    if len(tangent) == 1 and len(solutions) == 2:
+        tangent.append(descartes_reflect(*triplet, tangent[0]))
+
+    return [
+        CircleData(curvature=k, center=z, generation=1, parent_ids=[])
+        for k, z in tangent
+        if k != 0
+    ]
+
+
+def _exact_quotient(a: int, b: int) -> Union[int, Fraction]:
+    """Divide two ints exactly, returning int when the result is integral."""
+    if a % b == 0:
+        return a // b
+    return Fraction(a, b)
+
+
+def _generate_rational_gasket(
+    circles: List[CircleData],
+    max_depth: int,
+    stream: bool
+) -> Generator[CircleData, None, None]:
+    """
+    Breadth-first generation for gaskets whose initial circles are rational.
+
+    Every curvature and center of such a gasket is rational, and the
+    quartet reflection in curvature-weighted coordinates (k, k*x, k*y)
+
+        k' = 2S - 3k,   (kx)' = 2Σkx - 3kx,   (ky)' = 2Σky - 3ky
+
+    has integer coefficients. Scaling the initial values by the common
+    denominators of the curvatures and of the weighted coordinates therefore
+    keeps the whole BFS in plain ints: no Fractions, smart_* dispatch or
+    square roots after the initial triplet. Curvatures and centers are
+    divided out only for the output circles, and duplicates are detected by
+    exact integer equality.
+
+    Args:
+        circles: Initial circles from initialize_standard_gasket()
+        max_depth: Maximum recursion depth (generation level)
+        stream: Yield circles as generated instead of all at the end
+
+    Yields:
+        CircleData objects, in the same order as generate_apollonian_gasket()
+    """
+    if stream:
+        yield from circles
+
+    # Solve the initial triplet once with the full Descartes theorem
+    children = []
+    if len(circles) >= 3 and max_depth > 0:
+        children = _initial_children(*circles[:3])
+
+    # Common denominators: K = k_scale*k and (U, V) = xy_scale*(kx, ky) are ints
+    seeds = circles + children
+    weighted = [
+        (Fraction(c.curvature), c.curvature * Fraction(c.center[0]), c.curvature * Fraction(c.center[1]))
+        for c in seeds
+    ]
+    k_scale = math.lcm(*(k.denominator for k, _, _ in weighted))
+    xy_scale = math.lcm(*(w.denominator for _, u, v in weighted for w in (u, v)))
+    scaled = [
+        (int(k * k_scale), int(u * xy_scale), int(v * xy_scale))
+        for k, u, v in weighted
+    ]
+
+    seen: Set[Tuple[int, int, int]] = set(scaled[:len(circles)])
+    frontier = []
+    for new_circle, key in zip(children, scaled[len(circles):]):
+        if key in seen:
+            continue
+        seen.add(key)
+        circles.append(new_circle)
+        if stream:
+            yield new_circle
+        frontier.append((scaled[0], scaled[1], scaled[2], key))
+
+    # Expand one depth layer at a time, reflecting the three older members
+    # of each quartet (see generate_apollonian_gasket)
+    depth = 1
+    while frontier and depth < max_depth:
+        next_frontier = []
+        keep_children = depth + 1 < max_depth
+
+        for quartet in frontier:
+            (k1, u1, v1), (k2, u2, v2), (k3, u3, v3), newest = quartet
+            k4, u4, v4 = newest
+            two_k = 2 * (k1 + k2 + k3 + k4)
+            two_u = 2 * (u1 + u2 + u3 + u4)
+            two_v = 2 * (v1 + v2 + v3 + v4)
+
+            for i in range(3):
+                k, u, v = quartet[i]
+                key = (two_k - 3 * k, two_u - 3 * u, two_v - 3 * v)
+                if key[0] == 0:
+                    # Straight line - not a circle
+                    continue
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                # x = (U / xy_scale) / (K / k_scale)
+                k_new, u_new, v_new = key
+                denominator = k_new * xy_scale
+                new_circle = CircleData(
+                    curvature=_exact_quotient(k_new, k_scale),
+                    center=(
+                        _exact_quotient(u_new * k_scale, denominator),
+                        _exact_quotient(v_new * k_scale, denominator),
+                    ),
+                    generation=depth + 1,
+                    parent_ids=[],  # Will be set when persisted to DB
+                )
+                circles.append(new_circle)
+                if stream:
+                    yield new_circle
+
+                if keep_children:
+                    kept = quartet[:i] + quartet[i + 1:3]
+                    next_frontier.append(kept + (newest, key))
+
+        frontier = next_frontier
+        depth += 1
+
+    if not stream:
+        yield from circles
+
+
 def generate_apollonian_gasket(
     initial_curvatures: List[Fraction],
     max_depth: int,
@@ -413,8 +702,11 @@ def generate_apollonian_gasket(
     Generate Apollonian gasket using breadth-first search.
 
     Uses the Descartes Circle Theorem to recursively generate circles.
-    For each triplet of mutually tangent circles, computes two new circles
-    that are tangent to all three. Continues until max_depth is reached.
+    The initial triplet is solved once for its two tangent circles; after
+    that each Descartes quartet yields the three children of its newest
+    circle by linear reflection (descartes_reflect_quartet), which needs no
+    square roots and never reproduces the parent. Continues until max_depth
+    is reached.
 
     Args:
         initial_curvatures: List of 3-4 curvatures for initial circles
@@ -436,97 +728,111 @@ def generate_apollonian_gasket(
     """
     # Step 1: Initialize starting circles
     circles = initialize_standard_gasket(initial_curvatures)
-    circle_hashes: Set[str] = {c.hash_key() for c in circles}
+
+    # Rational placements (e.g. integer seeds such as -1, 2, 2) stay rational
+    # under reflection, so they take the plain int/Fraction path
+    if all(
+        isinstance(v, (int, Fraction))
+        for c in circles
+        for v in (c.curvature, *c.center)
+    ):
+        yield from _generate_rational_gasket(circles, max_depth, stream)
+        return
+
+    # Packed quantized keys for the fast exact-cell duplicate check;
+    # CircleData.hash_key() is only needed for persistence
+    inv_tol = 1e10
+    circle_hashes: Set[int] = {_pack_key(*c.as_floats(), inv_tol) for c in circles}
+    spatial_index: SpatialIndex = {}
+    for circle in circles:
+        add_to_spatial_index(spatial_index, circle)
 
     # Step 2: Yield initial circles if streaming
     if stream:
         for circle in circles:
             yield circle
 
-    # Step 3: Set up BFS queue
-    # Queue contains tuples of (circle1, circle2, circle3, depth)
-    queue = deque()
-
-    # Step 4: Add all possible initial triplets to queue
-    # For 3 initial circles, there's only one triplet
-    if len(circles) >= 3:
-        # Add the initial triplet
-        queue.append((circles[0], circles[1], circles[2], 0))
-
-    # Step 5: BFS loop
-    while queue:
-        c1, c2, c3, depth = queue.popleft()
-
-        # Check depth limit
-        if depth >= max_depth:
-            continue
-
-        # Convert CircleData to format expected by descartes_solve
-        # descartes_solve expects: (curvature, (center_real, center_imag))
-        circle1 = (c1.curvature, c1.center)
-        circle2 = (c2.curvature, c2.center)
-        circle3 = (c3.curvature, c3.center)
-
-        try:
-            # Compute two new circles tangent to all three
-            (k_new1, z_new1), (k_new2, z_new2) = descartes_solve(
-                circle1, circle2, circle3
+    # Step 3: Set up the BFS frontier
+    # The frontier holds the Descartes quartets (circle1, circle2, circle3,
+    # newest) of the current depth, where newest is the circle generated at
+    # that depth. Reflecting each of circle1..circle3 gives newest's three
+    # children; reflecting newest would only give back its parent. Depth is
+    # implicit in the layer, and quartets are only kept while their children
+    # are still within max_depth.
+    frontier: List[Tuple[CircleData, CircleData, CircleData, CircleData]] = []
+
+    def accept(
+        curvature: ExactNumber, center: Tuple[ExactNumber, ExactNumber], generation: int
+    ) -> Optional[CircleData]:
+        """Record and return a new circle, or None if it is a duplicate."""
+        floats = (float(curvature), float(center[0]), float(center[1]))
+        # Check for duplicates in the same tolerance cell
+        key = _pack_key(*floats, inv_tol)
+        if key in circle_hashes:
+            return None
+        # ISSUE #3 FIX: Additional numerical tolerance check
+        # Near-duplicates may fall in a neighbouring cell
+        if _is_duplicate_floats(*floats, spatial_index, 1e-10):
+            return None
+        circle_hashes.add(key)
+
+        # Only circles that survive deduplication are materialized
+        # Seed the as_floats() cache rather than re-evaluating SymPy values
+        new_circle = CircleData.with_floats(
+            floats,
+            curvature=curvature,
+            center=center,
+            generation=generation,
+            parent_ids=[],  # Will be set when persisted to DB
+        )
+        add_to_spatial_index(spatial_index, new_circle)
+        circles.append(new_circle)
+        return new_circle
+
+    # Step 4: Solve the initial triplet once with the full Descartes theorem
+    if len(circles) >= 3 and max_depth > 0:
+        c1, c2, c3 = circles[0], circles[1], circles[2]
+        for child in _initial_children(c1, c2, c3):
+            new_circle = accept(child.curvature, child.center, 1)
+            if new_circle is not None:
+                if stream:
+                    yield new_circle
+                frontier.append((c1, c2, c3, new_circle))
+
+    # Step 5: BFS loop, one depth layer at a time
+    depth = 1
+    while frontier and depth < max_depth:
+        next_frontier = []
+        keep_children = depth + 1 < max_depth
+
+        for c1, c2, c3, newest in frontier:
+            # Reflect each older member of the quartet (Descartes Eq. 4)
+            children = descartes_reflect_quartet(
+                (c1.curvature, c1.center),
+                (c2.curvature, c2.center),
+                (c3.curvature, c3.center),
+                (newest.curvature, newest.center),
             )
 
-            # Process both new circles
-            new_circles = []
-            for k, z in [(k_new1, z_new1), (k_new2, z_new2)]:
-                # ISSUE #3 FIX: Check if this solution is a parent circle
-                # Descartes theorem returns two solutions: one new circle + one parent
-                # We must explicitly discard the parent before hash checking
-                if is_duplicate(k, z, [c1, c2, c3]):
-                    # This is the parent circle that was part of the quartet
-                    # Skip it and continue to the next solution
+            # The two circles that stay alongside newest for each child
+            kept_pairs = ((c2, c3), (c1, c3), (c1, c2))
+            for (k, z), (keep1, keep2) in zip(children, kept_pairs):
+                if k == 0:
+                    # Straight line - not a circle
                     continue
 
-                # Create CircleData object
-                new_circle = CircleData(
-                    curvature=k,
-                    center=z,
-                    generation=depth + 1,
-                    parent_ids=[],  # Will be set when persisted to DB
-                )
+                new_circle = accept(k, z, depth + 1)
+                if new_circle is not None:
+                    # Yield immediately if streaming
+                    if stream:
+                        yield new_circle
 
-                # Verify tangency with all parent circles
-                if not all(verify_tangency(new_circle, parent) 
-                        for parent in [c1, c2, c3]):
-                    # Skip this circle if tangency verification fails
-                    continue
+                    # Step 6: Keep the child's quartet for the next layer
+                    if keep_children:
+                        next_frontier.append((keep1, keep2, newest, new_circle))
 
-                # Check for duplicates using hash
-                hash_key = new_circle.hash_key()
-                if hash_key not in circle_hashes:
-                    # ISSUE #3 FIX: Additional numerical tolerance check
-                    # Hash may miss duplicates due to sqrt approximation errors
-                    if not is_duplicate(k, z, circles):
-                        # New unique circle found
-                        circle_hashes.add(hash_key)
-                        circles.append(new_circle)
-                        new_circles.append(new_circle)
-
-                        # Yield immediately if streaming
-                        if stream:
-                            yield new_circle
-
-            # Step 6: Add new triplets to queue for next iteration
-            # For each new circle, create triplets with existing parent circles
-            for new_circle in new_circles:
-                # Create three new triplets, each replacing one parent circle
-                queue.append((c1, c2, new_circle, depth + 1))
-                queue.append((c2, c3, new_circle, depth + 1))
-                queue.append((c3, c1, new_circle, depth + 1))
-
-        except Exception as e:
-            # Skip invalid configurations
-            # This can happen if the Descartes formula produces invalid results
-            # (e.g., complex square roots, invalid geometric configurations)
-            # For MVP, we silently skip these cases
-            continue
+        frontier = next_frontier
+        depth += 1
 
     # Step 7: If not streaming, yield all circles at the end
     if not stream:
@@ -8,15 +8,13 @@ This module provides:
 - Database engine creation
 - Session factory
 - Table creation utility
+- Client-side UTC timestamp default
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from datetime import datetime, timezone
 
-# Use relative import to avoid "backend" module issues
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import declarative_base, sessionmaker
 
 from config import settings
 
@@ -26,12 +24,29 @@ Base = declarative_base()
 # Create database engine
 # - connect_args for SQLite: check_same_thread=False allows FastAPI async
 # - echo=True in debug mode for SQL logging
+# - pool_pre_ping=True: the pool validates connections on checkout, so
+#   stale connections are replaced instead of failing requests
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {},
     echo=settings.DEBUG,
+    pool_pre_ping=True,
 )
 
+if settings.DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        """
+        Turn on foreign key enforcement for each new SQLite connection.
+
+        SQLite ignores ON DELETE CASCADE unless this pragma is set, and the
+        circles of a deleted gasket are removed by that cascade alone.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 # Create session factory
 # - autocommit=False: require explicit commit()
 # - autoflush=False: require explicit flush()
@@ -43,6 +58,16 @@ SessionLocal = sessionmaker(
 )
 
 
+def utc_now() -> datetime:
+    """
+    Current UTC time, used for client-side timestamp defaults.
+
+    Computing timestamps in Python lets bulk inserts share one value
+    instead of evaluating now() on the database for every row.
+    """
+    return datetime.now(timezone.utc)
+
+
 def create_tables():
     """
     Create all database tables.
@@ -9,23 +9,51 @@ separate numerator and denominator fields for curvature, center coordinates,
 and radius.
 """
 
+import json
+import struct
+import sys
+from array import array
 from datetime import datetime
+from decimal import Decimal
 from fractions import Fraction
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
-import sympy as sp
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy import BigInteger, Column, Integer, LargeBinary, Numeric, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.sql import func
 
-# Use relative import
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from db.base import Base, utc_now
+from core.exact_math import (
+    ExactNumber,
+    clear_parse_exact_cache,
+    coprime_fraction,
+    parse_exact,
+)
+
+if TYPE_CHECKING:
+    # Relationships name their targets as strings, resolved by the mapper
+    from db.models.gasket import Gasket
+
+# Layout of the packed_rationals column: eight little-endian int64 values
+_PACKED_RATIONAL_COLUMNS = (
+    "center_x_num", "center_x_denom",
+    "center_y_num", "center_y_denom",
+    "radius_num", "radius_denom",
+    "curvature_num", "curvature_denom",
+)
+_PACKED_RATIONALS = struct.Struct("<8q")
+
+# Whether array("i") already matches the little-endian int32 layout of
+# packed ID columns, so unpack_ids() can decode with a single buffer copy
+_ARRAY_IS_LE_INT32 = sys.byteorder == "little" and array("i").itemsize == 4
+
+# Range of the BigInteger num/denom columns
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
 
-from db.base import Base
-from core.exact_math import ExactNumber
+# Precision and scale of the curvature_numeric column
+_NUMERIC_PRECISION = 38
+_NUMERIC_SCALE = 20
 
 
 class Circle(Base):
@@ -46,6 +74,9 @@ class Circle(Base):
         center_x_num, center_x_denom: Center X as num/denom pair
         center_y_num, center_y_denom: Center Y as num/denom pair
         radius_num, radius_denom: Radius as num/denom pair
+        curvature_numeric: Curvature as one NUMERIC(38, 20) value when it is
+            a terminating decimal (see numeric_value()), else NULL; for
+            server-side ranges and ORDER BY
 
         # TEXT columns (exact storage, supports int/Fraction/SymPy)
         curvature_exact: Tagged string (e.g., "int:6", "frac:3/2", "sym:sqrt(2)")
@@ -53,12 +84,20 @@ class Circle(Base):
         center_y_exact: Tagged string for Y coordinate
         radius_exact: Tagged string for radius
 
-        parent_ids: JSON string of parent circle IDs (e.g., '[1, 2, 3]')
-        tangent_ids: JSON string of tangent circle IDs (e.g., '[4, 5, 6]')
+        parent_ids_packed: Parent circle IDs as packed little-endian int32
+            (column "parent_ids"; e.g. 12 bytes for 3 parents)
+        tangent_ids_packed: Tangent circle IDs as packed little-endian int32
+            (column "tangent_ids")
+        packed_rationals: Optional copy of the eight INTEGER columns as one
+            64-byte BLOB for bulk render reads (see pack_rationals()); NULL
+            when a value exceeds int64 and was fitted by fit_int64()
         created_at: Timestamp when circle was computed
         gasket: Relationship back to parent Gasket
 
     Hybrid Properties (Dual-Mode Access):
+        parent_ids: List[int] decoded from / encoded to parent_ids_packed
+        tangent_ids: List[int] decoded from / encoded to tangent_ids_packed
+
         # Legacy mode (Fraction only, from INTEGER columns)
         curvature: Returns Fraction from curvature_num/curvature_denom
         center_x: Returns Fraction from center_x_num/center_x_denom
@@ -99,35 +138,40 @@ class Circle(Base):
 
     __tablename__ = "circles"
 
-    # Primary key
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # Primary key (the primary key is already indexed; no extra index)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    # Foreign key to gasket
+    # Foreign key to gasket (served by the leading column of
+    # ix_circles_gasket_gen_id)
     gasket_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("gaskets.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Generation (recursion depth)
-    generation: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    generation: Mapped[int] = mapped_column(Integer, nullable=False)
 
     # Curvature as rational number (k = curvature_num / curvature_denom)
-    curvature_num: Mapped[int] = mapped_column(Integer, nullable=False)
-    curvature_denom: Mapped[int] = mapped_column(Integer, nullable=False)
+    curvature_num: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    curvature_denom: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
     # Center X coordinate as rational number
-    center_x_num: Mapped[int] = mapped_column(Integer, nullable=False)
-    center_x_denom: Mapped[int] = mapped_column(Integer, nullable=False)
+    center_x_num: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    center_x_denom: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
     # Center Y coordinate as rational number
-    center_y_num: Mapped[int] = mapped_column(Integer, nullable=False)
-    center_y_denom: Mapped[int] = mapped_column(Integer, nullable=False)
+    center_y_num: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    center_y_denom: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
     # Radius as rational number (r = radius_num / radius_denom)
-    radius_num: Mapped[int] = mapped_column(Integer, nullable=False)
-    radius_denom: Mapped[int] = mapped_column(Integer, nullable=False)
+    radius_num: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    radius_denom: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    # Curvature as a single sortable number; NULL unless exactly representable
+    curvature_numeric: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(_NUMERIC_PRECISION, _NUMERIC_SCALE), nullable=True
+    )
 
     # Exact storage (TEXT columns for ExactNumber types - Phase 3)
     # Tagged format: "int:6", "frac:3/2", "sym:sqrt(2)"
@@ -136,22 +180,40 @@ class Circle(Base):
     center_y_exact: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     radius_exact: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    # Graph structure (stored as JSON strings)
-    parent_ids: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    tangent_ids: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Graph structure: parent and tangent IDs as packed int32 (see pack_ids())
+    parent_ids_packed: Mapped[Optional[bytes]] = mapped_column(
+        "parent_ids", LargeBinary, nullable=True
+    )
+    tangent_ids_packed: Mapped[Optional[bytes]] = mapped_column(
+        "tangent_ids", LargeBinary, nullable=True
+    )
 
-    # Timestamp
+    # Denormalized copy of the num/denom columns (see pack_rationals())
+    packed_rationals: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary, nullable=True
+    )
+
+    # Timestamp (client-side; bulk inserts pass one shared value)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utc_now, nullable=False
     )
 
     # Relationship back to gasket
     gasket: Mapped["Gasket"] = relationship("Gasket", back_populates="circles")
 
-    # Indexes for common queries
+    # Indexes for the queries the service issues; every extra index is
+    # maintained on each bulk insert, so none exist speculatively
     __table_args__ = (
-        Index("ix_circles_gasket_generation", "gasket_id", "generation"),
-        Index("ix_circles_curvature", "curvature_num", "curvature_denom"),
+        # Circles of a gasket, by generation, in id order
+        Index(
+            "ix_circles_gasket_gen_id",
+            "gasket_id",
+            "generation",
+            "id",
+            postgresql_include=["curvature_num", "curvature_denom"],
+        ),
+        # Curvature ranges / ORDER BY within a gasket
+        Index("ix_circles_gasket_curvature_numeric", "gasket_id", "curvature_numeric"),
     )
 
     @staticmethod
@@ -186,18 +248,218 @@ class Circle(Base):
         """
         if not exact_str:
             raise ValueError("Cannot parse empty exact string")
+        return parse_exact(exact_str)
+
+    @classmethod
+    def _clear_exact_cache(cls) -> None:
+        """Drop memoized "frac:"/"sym:" parses (see parse_exact); used by tests."""
+        clear_parse_exact_cache()
+
+    @staticmethod
+    def pack_ids(ids: List[int]) -> bytes:
+        """
+        Pack circle IDs as little-endian int32 values.
+
+        Example:
+            >>> Circle.pack_ids([1, 2, 3])
+            b'\\x01\\x00\\x00\\x00\\x02\\x00\\x00\\x00\\x03\\x00\\x00\\x00'
+        """
+        return struct.pack(f"<{len(ids)}i", *ids)
+
+    @staticmethod
+    def unpack_ids(packed: Union[bytes, str, None]) -> List[int]:
+        """
+        Unpack circle IDs stored by pack_ids().
+
+        Rows written before IDs were packed hold a JSON string such as
+        '[1, 2, 3]'; those are still decoded.
+
+        Example:
+            >>> Circle.unpack_ids(Circle.pack_ids([1, 2, 3]))
+            [1, 2, 3]
+        """
+        if not packed:
+            return []
+        if isinstance(packed, str):
+            return json.loads(packed)
+        if _ARRAY_IS_LE_INT32:
+            return array("i", packed).tolist()
+        return list(struct.unpack(f"<{len(packed) // 4}i", packed))
+
+    @staticmethod
+    def pack_rationals(columns: Dict[str, int]) -> Optional[bytes]:
+        """
+        Pack the eight num/denom column values as one BLOB.
+
+        Order is center_x, center_y, radius, curvature (num then denom),
+        each a little-endian int64.
+
+        Args:
+            columns: Mapping with the INTEGER column values, e.g. the dict
+                returned by CircleData.to_database_dict()
+
+        Returns:
+            64 bytes, or None if a value does not fit in int64
+        """
+        try:
+            return _PACKED_RATIONALS.pack(
+                *(columns[name] for name in _PACKED_RATIONAL_COLUMNS)
+            )
+        except struct.error:
+            return None
+
+    @staticmethod
+    def fit_int64(num: int, denom: int) -> Tuple[int, int]:
+        """
+        Return num/denom as a pair that fits the 64-bit INTEGER columns.
+
+        Pairs already in range are returned unchanged. Larger ones (deep
+        generations) get the closest fraction with an in-range numerator
+        and denominator; like irrationals, they are then exact only in the
+        TEXT *_exact column, which readers consult first.
+
+        Raises:
+            ValueError: If the magnitude itself exceeds int64
+        """
+        if _INT64_MIN <= num <= _INT64_MAX and denom <= _INT64_MAX:
+            return num, denom
+
+        bound = _INT64_MAX // (abs(num) // denom + 1)
+        if bound < 1:
+            raise ValueError(f"{num}/{denom} is outside the int64 column range")
+        approx = Fraction(num, denom).limit_denominator(bound)
+        if not _INT64_MIN <= approx.numerator <= _INT64_MAX:
+            raise ValueError(f"{num}/{denom} is outside the int64 column range")
+        return approx.numerator, approx.denominator
+
+    @staticmethod
+    def numeric_value(num: int, denom: int) -> Optional[Decimal]:
+        """
+        Exact Decimal for num/denom, or None if NUMERIC(38, 20) can't hold it.
+
+        Only denominators of the form 2^a * 5^b give terminating decimals;
+        anything else (thirds, sevenths, ...) stays num/denom only.
+
+        Example:
+            >>> Circle.numeric_value(3, 8)
+            Decimal('0.375')
+            >>> Circle.numeric_value(1, 3) is None
+            True
+        """
+        rest, twos, fives = denom, 0, 0
+        while rest % 2 == 0:
+            rest //= 2
+            twos += 1
+        while rest % 5 == 0:
+            rest //= 5
+            fives += 1
+        scale = max(twos, fives)
+        if rest != 1 or scale > _NUMERIC_SCALE:
+            return None
+
+        digits = num * (10 ** scale // denom)
+        if len(str(abs(digits))) > _NUMERIC_PRECISION:
+            return None
+        return Decimal(digits).scaleb(-scale)
+
+    @staticmethod
+    def from_packed(packed: bytes) -> Tuple[int, ...]:
+        """
+        Decode a packed_rationals BLOB without building a Circle.
+
+        Returns:
+            (cx_num, cx_denom, cy_num, cy_denom, r_num, r_denom, k_num, k_denom)
+
+        Example:
+            >>> Circle.from_packed(Circle.pack_rationals(row))[6:]
+            (3, 2)  # curvature 3/2
+        """
+        return _PACKED_RATIONALS.unpack_from(memoryview(packed))
+
+    @hybrid_property
+    def parent_ids(self) -> List[int]:
+        """Get parent circle IDs, decoded from the packed column."""
+        return self.unpack_ids(self.parent_ids_packed)
+
+    @parent_ids.setter
+    def parent_ids(self, ids: List[int]) -> None:
+        """Set parent circle IDs, packing them as int32."""
+        self.parent_ids_packed = self.pack_ids(ids)
 
-        if exact_str.startswith("int:"):
-            return int(exact_str[4:])
-        elif exact_str.startswith("frac:"):
-            parts = exact_str[5:].split("/")
-            if len(parts) != 2:
-                raise ValueError(f"Invalid fraction format: {exact_str}")
-            return Fraction(int(parts[0]), int(parts[1]))
-        elif exact_str.startswith("sym:"):
-            return sp.sympify(exact_str[4:])
-        else:
-            raise ValueError(f"Unknown exact format: {exact_str}")
+    @parent_ids.expression
+    def parent_ids(cls):
+        """SQL expression: the packed column itself."""
+        return cls.parent_ids_packed
+
+    @hybrid_property
+    def tangent_ids(self) -> List[int]:
+        """Get tangent circle IDs, decoded from the packed column."""
+        return self.unpack_ids(self.tangent_ids_packed)
+
+    @tangent_ids.setter
+    def tangent_ids(self, ids: List[int]) -> None:
+        """Set tangent circle IDs, packing them as int32."""
+        self.tangent_ids_packed = self.pack_ids(ids)
+
+    @tangent_ids.expression
+    def tangent_ids(cls):
+        """SQL expression: the packed column itself."""
+        return cls.tangent_ids_packed
+
+    def _fraction_entries(self) -> dict:
+        """
+        Per-instance cache of decoded values (not a column).
+
+        Holds {field: (num, denom, Fraction)} for the INTEGER pairs and
+        {"<field>_exact": (text, ExactNumber)} for the TEXT columns.
+        """
+        cache = self.__dict__.get("_fraction_cache")
+        if cache is None:
+            cache = self.__dict__["_fraction_cache"] = {}
+        return cache
+
+    def _cached_fraction(self, field: str, num: int, denom: int) -> Fraction:
+        """
+        Return Fraction(num, denom), reusing the one built on a previous access.
+
+        The cache is keyed on the (num, denom) pair that produced it, so
+        assigning the INTEGER columns directly simply misses and rebuilds;
+        no invalidation hooks are needed.
+        """
+        cache = self._fraction_entries()
+        entry = cache.get(field)
+        if entry is not None and entry[0] == num and entry[1] == denom:
+            return entry[2]
+        value = coprime_fraction(num, denom)
+        cache[field] = (num, denom, value)
+        return value
+
+    def _cached_exact(self, column: str, exact: str) -> ExactNumber:
+        """
+        Return parse_exact(exact), reusing the value parsed on a previous access.
+
+        Keyed on the stored text, like _cached_fraction() on its num/denom pair.
+        """
+        cache = self._fraction_entries()
+        entry = cache.get(column)
+        if entry is not None and entry[0] == exact:
+            return entry[1]
+        value = parse_exact(exact)
+        cache[column] = (exact, value)
+        return value
+
+    def _store_fraction(self, field: str, value: Fraction) -> None:
+        """Write value to the field's num/denom columns and prime the cache."""
+        num, denom = self.fit_int64(value.numerator, value.denominator)
+        setattr(self, f"{field}_num", num)
+        setattr(self, f"{field}_denom", denom)
+        if (
+            not isinstance(value, Fraction)
+            or num != value.numerator
+            or denom != value.denominator
+        ):
+            value = coprime_fraction(num, denom)
+        self._fraction_entries()[field] = (num, denom, value)
 
     @hybrid_property
     def curvature(self) -> Fraction:
@@ -213,7 +475,7 @@ class Circle(Base):
             >>> circle.curvature
             Fraction(3, 2)
         """
-        return Fraction(self.curvature_num, self.curvature_denom)
+        return self._cached_fraction("curvature", self.curvature_num, self.curvature_denom)
 
     @curvature.setter
     def curvature(self, value: Fraction) -> None:
@@ -230,41 +492,40 @@ class Circle(Base):
             >>> circle.curvature_denom
             2
         """
-        self.curvature_num = value.numerator
-        self.curvature_denom = value.denominator
+        self._store_fraction("curvature", value)
+        self.curvature_numeric = self.numeric_value(
+            self.curvature_num, self.curvature_denom
+        )
 
     @hybrid_property
     def center_x(self) -> Fraction:
         """Get center X coordinate as Fraction."""
-        return Fraction(self.center_x_num, self.center_x_denom)
+        return self._cached_fraction("center_x", self.center_x_num, self.center_x_denom)
 
     @center_x.setter
     def center_x(self, value: Fraction) -> None:
         """Set center X coordinate from Fraction."""
-        self.center_x_num = value.numerator
-        self.center_x_denom = value.denominator
+        self._store_fraction("center_x", value)
 
     @hybrid_property
     def center_y(self) -> Fraction:
         """Get center Y coordinate as Fraction."""
-        return Fraction(self.center_y_num, self.center_y_denom)
+        return self._cached_fraction("center_y", self.center_y_num, self.center_y_denom)
 
     @center_y.setter
     def center_y(self, value: Fraction) -> None:
         """Set center Y coordinate from Fraction."""
-        self.center_y_num = value.numerator
-        self.center_y_denom = value.denominator
+        self._store_fraction("center_y", value)
 
     @hybrid_property
     def radius(self) -> Fraction:
         """Get radius as Fraction."""
-        return Fraction(self.radius_num, self.radius_denom)
+        return self._cached_fraction("radius", self.radius_num, self.radius_denom)
 
     @radius.setter
     def radius(self, value: Fraction) -> None:
         """Set radius from Fraction."""
-        self.radius_num = value.numerator
-        self.radius_denom = value.denominator
+        self._store_fraction("radius", value)
 
     # Exact value hybrid properties (Phase 9)
     # These provide access to ExactNumber types (int/Fraction/SymPy) from TEXT columns
@@ -291,10 +552,11 @@ class Circle(Base):
         Reference:
             .DESIGN_SPEC.md section 8.4 - Hybrid exact arithmetic
         """
-        if self.curvature_exact:
-            return self.parse_exact(self.curvature_exact)
+        exact = self.curvature_exact
+        if exact:
+            return self._cached_exact("curvature_exact", exact)
         # Fallback to INTEGER columns
-        return Fraction(self.curvature_num, self.curvature_denom)
+        return self.curvature
 
     @hybrid_property
     def center_x_exact_value(self) -> ExactNumber:
@@ -309,9 +571,11 @@ class Circle(Base):
             >>> circle.center_x_exact_value
             Fraction(7, 6)
         """
-        if self.center_x_exact:
-            return self.parse_exact(self.center_x_exact)
-        return Fraction(self.center_x_num, self.center_x_denom)
+        exact = self.center_x_exact
+        if exact:
+            return self._cached_exact("center_x_exact", exact)
+        # Fallback to INTEGER columns
+        return self.center_x
 
     @hybrid_property
     def center_y_exact_value(self) -> ExactNumber:
@@ -326,9 +590,11 @@ class Circle(Base):
             >>> circle.center_y_exact_value
             2*sqrt(2)/3  # SymPy expression
         """
-        if self.center_y_exact:
-            return self.parse_exact(self.center_y_exact)
-        return Fraction(self.center_y_num, self.center_y_denom)
+        exact = self.center_y_exact
+        if exact:
+            return self._cached_exact("center_y_exact", exact)
+        # Fallback to INTEGER columns
+        return self.center_y
 
     @hybrid_property
     def radius_exact_value(self) -> ExactNumber:
@@ -343,9 +609,11 @@ class Circle(Base):
             >>> circle.radius_exact_value
             1
         """
-        if self.radius_exact:
-            return self.parse_exact(self.radius_exact)
-        return Fraction(self.radius_num, self.radius_denom)
+        exact = self.radius_exact
+        if exact:
+            return self._cached_exact("radius_exact", exact)
+        # Fallback to INTEGER columns
+        return self.radius
 
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -354,6 +622,3 @@ class Circle(Base):
             f"k={self.curvature}, gen={self.generation})>"
         )
 
-
-# Import Gasket to avoid circular import issues
-from db.models.gasket import Gasket  # noqa: E402, F811
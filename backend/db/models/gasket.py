@@ -8,18 +8,16 @@ with their metadata, caching information, and relationships to circles.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
 
-# Use relative import
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from db.base import Base, utc_now
 
-from db.base import Base
+if TYPE_CHECKING:
+    # Relationships name their targets as strings, resolved by the mapper
+    from db.models.circle import Circle
 
 
 class Gasket(Base):
@@ -28,7 +26,7 @@ class Gasket(Base):
 
     Attributes:
         id: Primary key
-        hash: SHA-256 hash of sorted initial curvatures (for cache lookup)
+        hash: BLAKE2b-256 hash of sorted initial curvatures (for cache lookup)
         initial_curvatures: JSON string of curvature list (e.g., '["1", "1", "1"]')
         num_circles: Total number of circles in this gasket
         max_depth_cached: Maximum generation depth cached in database
@@ -61,10 +59,10 @@ class Gasket(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utc_now, nullable=False
     )
     last_accessed_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True), nullable=True, onupdate=func.now()
+        DateTime(timezone=True), nullable=True, onupdate=utc_now
     )
 
     # Access tracking (for cache eviction policy)
@@ -75,7 +73,12 @@ class Gasket(Base):
         "Circle",
         back_populates="gasket",
         cascade="all, delete-orphan",
-        lazy="selectin",  # Load circles with gasket by default
+        # Deleting a gasket leaves circles to the FK's ON DELETE CASCADE
+        # instead of loading them to delete one by one
+        passive_deletes=True,
+        # Loaded on first access only; queries that render circles opt in
+        # with .options(selectinload(Gasket.circles))
+        lazy="select",
     )
 
     def __repr__(self) -> str:
@@ -87,7 +90,3 @@ class Gasket(Base):
             f"max_depth={self.max_depth_cached})>"
         )
 
-
-# Import Circle here to avoid circular imports (will be defined in circle.py)
-# This is imported at the bottom to ensure Gasket is defined first
-from db.models.circle import Circle  # noqa: E402, F811
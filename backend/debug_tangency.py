@@ -4,6 +4,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import math
 from fractions import Fraction
 import sympy as sp
 
@@ -71,10 +72,9 @@ except Exception as e:
         print(f"  dy = {dy}")
         print(f"  distance_squared = {distance_squared}")
 
-        if isinstance(distance_squared, sp.Expr):
-            actual_distance = float(sp.sqrt(distance_squared))
-        else:
-            actual_distance = float(distance_squared ** 0.5)
+        # Only a float is needed, so evaluate the square once and take a
+        # float sqrt rather than building a symbolic sqrt expression
+        actual_distance = math.sqrt(float(distance_squared))
 
         print(f"  actual_distance = {actual_distance}")
 
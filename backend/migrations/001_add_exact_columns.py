@@ -15,7 +15,8 @@ The existing INTEGER columns (curvature_num/denom, etc.) are preserved for:
 3. Fallback if exact values are not set
 
 Migration Strategy:
-- ADD COLUMN operations are idempotent (SQLite ignores if column exists)
+- ADD COLUMN operations are idempotent (existing columns are skipped)
+- All columns are added in a single transaction
 - No data migration initially (new columns nullable)
 - Future inserts will populate both INTEGER and TEXT columns
 - Existing rows remain valid with NULL exact columns
@@ -30,13 +31,32 @@ Usage:
     migrate_down(engine)
 """
 
-from sqlalchemy import Engine, text
+from math import gcd
+
+from sqlalchemy import Engine, bindparam, text
 from sqlalchemy.exc import OperationalError
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+EXACT_COLUMNS = ("curvature_exact", "center_x_exact", "center_y_exact", "radius_exact")
+
+# Databases (by URL) already verified in this process; cleared by migrate_down
+_verified_urls = set()
+
+
+def _existing_columns(conn, names) -> set:
+    """Return which of the given column names exist on the circles table."""
+    result = conn.execute(
+        text(
+            "SELECT name FROM pragma_table_info('circles') WHERE name IN :names"
+        ).bindparams(bindparam("names", expanding=True)),
+        {"names": list(names)},
+    )
+    return set(result.scalars())
+
+
 def migrate_up(engine: Engine) -> None:
     """
     Apply migration: Add exact arithmetic TEXT columns.
@@ -56,21 +76,22 @@ def migrate_up(engine: Engine) -> None:
         ("radius_exact", "TEXT"),
     ]
 
-    with engine.connect() as conn:
+    # One transaction (one commit) for all columns; columns already present
+    # are found with a single PRAGMA instead of one failing ALTER each
+    with engine.begin() as conn:
+        existing = _existing_columns(conn, [name for name, _ in columns_to_add])
+
         for column_name, column_type in columns_to_add:
+            if column_name in existing:
+                logger.info(f"⊘ Column already exists: circles.{column_name} (skipping)")
+                continue
             try:
-                # SQLite: ALTER TABLE ADD COLUMN is idempotent (safe if exists)
                 sql = text(f"ALTER TABLE circles ADD COLUMN {column_name} {column_type}")
                 conn.execute(sql)
-                conn.commit()
                 logger.info(f"✓ Added column: circles.{column_name}")
-            except OperationalError as e:
-                # Check if error is "duplicate column name" (expected if already migrated)
-                if "duplicate column name" in str(e).lower():
-                    logger.info(f"⊘ Column already exists: circles.{column_name} (skipping)")
-                else:
-                    logger.error(f"✗ Failed to add column: circles.{column_name}")
-                    raise
+            except OperationalError:
+                logger.error(f"✗ Failed to add column: circles.{column_name}")
+                raise
 
     logger.info("✓ Migration 001 complete: All exact columns added")
 
@@ -86,14 +107,11 @@ def migrate_down(engine: Engine) -> None:
     """
     logger.warning("Rolling back migration 001: Removing exact arithmetic columns")
 
-    columns_to_remove = [
-        "curvature_exact",
-        "center_x_exact",
-        "center_y_exact",
-        "radius_exact",
-    ]
+    columns_to_remove = list(EXACT_COLUMNS)
+    _verified_urls.discard(str(engine.url))
 
-    with engine.connect() as conn:
+    # One transaction for all columns (committed on exit)
+    with engine.begin() as conn:
         # SQLite doesn't support DROP COLUMN directly (until SQLite 3.35+)
         # Need to check SQLite version and use appropriate method
 
@@ -102,7 +120,6 @@ def migrate_down(engine: Engine) -> None:
             for column_name in columns_to_remove:
                 sql = text(f"ALTER TABLE circles DROP COLUMN {column_name}")
                 conn.execute(sql)
-                conn.commit()
                 logger.info(f"✓ Removed column: circles.{column_name}")
         except OperationalError as e:
             if "no such column" in str(e).lower():
@@ -123,7 +140,24 @@ def migrate_down(engine: Engine) -> None:
     logger.info("Migration 001 rollback complete")
 
 
-def migrate_existing_data(engine: Engine) -> None:
+def _format_pair(num: int, denom: int) -> str:
+    """
+    Tagged exact string for an INTEGER num/denom pair, without a Fraction.
+
+    Matches what the generator writes: whole numbers as "int:n" (the
+    generator keeps ints as ints), everything else as a reduced
+    "frac:n/d" with a positive denominator.
+    """
+    g = gcd(num, denom)
+    if denom < 0:
+        g = -g
+    num, denom = num // g, denom // g
+    if denom == 1:
+        return f"int:{num}"
+    return f"frac:{num}/{denom}"
+
+
+def migrate_existing_data(engine: Engine, batch_size: int = 1000) -> None:
     """
     Optional: Migrate existing INTEGER data to TEXT exact format.
 
@@ -135,62 +169,89 @@ def migrate_existing_data(engine: Engine) -> None:
 
     Only run this if you want to populate exact columns for existing data.
 
+    Rows are processed in pages of batch_size, keyed on id, with one
+    executemany UPDATE and one commit per page, so memory stays bounded
+    by a page and an interrupted run resumes where it stopped. On SQLite
+    the run uses WAL with synchronous=NORMAL, and the file's previous
+    journal mode is restored afterwards.
+
     Args:
         engine: SQLAlchemy engine connected to database
+        batch_size: Circles fetched, updated and committed per page
     """
     logger.info("Migrating existing circle data to exact format")
 
-    from fractions import Fraction
-    from core.exact_math import format_exact
+    select_page = text("""
+        SELECT id,
+               curvature_num, curvature_denom,
+               center_x_num, center_x_denom,
+               center_y_num, center_y_denom,
+               radius_num, radius_denom
+        FROM circles
+        WHERE curvature_exact IS NULL AND id > :last_id
+        ORDER BY id
+        LIMIT :batch_size
+    """)
+    update_rows = text("""
+        UPDATE circles
+        SET curvature_exact = :curvature,
+            center_x_exact = :center_x,
+            center_y_exact = :center_y,
+            radius_exact = :radius
+        WHERE id = :id
+    """)
+
+    migrated = 0
+    last_id = 0
+
+    is_sqlite = engine.dialect.name == "sqlite"
 
     with engine.connect() as conn:
-        # Get all circles with NULL exact columns
-        result = conn.execute(text("""
-            SELECT id,
-                   curvature_num, curvature_denom,
-                   center_x_num, center_x_denom,
-                   center_y_num, center_y_denom,
-                   radius_num, radius_denom
-            FROM circles
-            WHERE curvature_exact IS NULL
-        """))
-
-        circles = result.fetchall()
-        logger.info(f"Found {len(circles)} circles to migrate")
-
-        for circle in circles:
-            circle_id = circle[0]
-
-            # Convert INTEGER pairs to Fraction, then to exact format
-            curvature = Fraction(circle[1], circle[2])
-            center_x = Fraction(circle[3], circle[4])
-            center_y = Fraction(circle[5], circle[6])
-            radius = Fraction(circle[7], circle[8])
-
-            # Format as tagged strings
-            curvature_exact = format_exact(curvature)
-            center_x_exact = format_exact(center_x)
-            center_y_exact = format_exact(center_y)
-            radius_exact = format_exact(radius)
-
-            # Update circle with exact values
-            conn.execute(text("""
-                UPDATE circles
-                SET curvature_exact = :curvature,
-                    center_x_exact = :center_x,
-                    center_y_exact = :center_y,
-                    radius_exact = :radius
-                WHERE id = :id
-            """), {
-                "id": circle_id,
-                "curvature": curvature_exact,
-                "center_x": center_x_exact,
-                "center_y": center_y_exact,
-                "radius": radius_exact,
-            })
-
-        conn.commit()
-        logger.info(f"✓ Migrated {len(circles)} circles to exact format")
+        if is_sqlite:
+            # Bulk-write settings for the migration window: WAL with
+            # synchronous=NORMAL syncs at checkpoints rather than on every
+            # commit. journal_mode persists in the file, so it is restored.
+            journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+            conn.execute(text("PRAGMA journal_mode=WAL"))
+            conn.execute(text("PRAGMA synchronous=NORMAL"))
+            conn.execute(text("PRAGMA temp_store=MEMORY"))
+            conn.commit()
+
+        try:
+            while True:
+                page = conn.execute(
+                    select_page, {"last_id": last_id, "batch_size": batch_size}
+                ).fetchall()
+                if not page:
+                    break
+
+                # Format INTEGER pairs directly as tagged strings
+                params = [
+                    {
+                        "id": circle[0],
+                        "curvature": _format_pair(circle[1], circle[2]),
+                        "center_x": _format_pair(circle[3], circle[4]),
+                        "center_y": _format_pair(circle[5], circle[6]),
+                        "radius": _format_pair(circle[7], circle[8]),
+                    }
+                    for circle in page
+                ]
+
+                conn.execute(update_rows, params)
+                conn.commit()
+
+                migrated += len(page)
+                last_id = page[-1][0]
+                logger.info(f"Migrated {migrated} circles (through id {last_id})")
+        finally:
+            if is_sqlite:
+                conn.rollback()
+                conn.execute(text(f"PRAGMA journal_mode={journal_mode}"))
+                conn.execute(text("PRAGMA synchronous=FULL"))
+                conn.execute(text("PRAGMA temp_store=DEFAULT"))
+                conn.commit()
+
+    logger.info(f"✓ Migrated {migrated} circles to exact format")
 
 
 def verify_migration(engine: Engine) -> bool:
@@ -203,26 +264,22 @@ def verify_migration(engine: Engine) -> bool:
     Returns:
         True if all exact columns exist, False otherwise
     """
+    url = str(engine.url)
+    if url in _verified_urls:
+        return True
+
     with engine.connect() as conn:
-        # Query table schema
-        result = conn.execute(text("PRAGMA table_info(circles)"))
-        columns = {row[1] for row in result.fetchall()}  # row[1] is column name
-
-        required_columns = {
-            "curvature_exact",
-            "center_x_exact",
-            "center_y_exact",
-            "radius_exact",
-        }
-
-        missing = required_columns - columns
-
-        if missing:
-            logger.error(f"Migration incomplete. Missing columns: {missing}")
-            return False
-        else:
-            logger.info("✓ Migration verified: All exact columns present")
-            return True
+        present = _existing_columns(conn, EXACT_COLUMNS)
+
+    missing = set(EXACT_COLUMNS) - present
+
+    if missing:
+        logger.error(f"Migration incomplete. Missing columns: {missing}")
+        return False
+    else:
+        logger.info("✓ Migration verified: All exact columns present")
+        _verified_urls.add(url)
+        return True
 
 
 # Convenience function for easy import
@@ -0,0 +1,135 @@
+"""
+Database migration: Replace circle indexes with the (gasket_id, generation, id) index.
+
+Reference: .DESIGN_SPEC.md Section 4.2 - Database Schema
+
+Responses load a gasket's circles with
+
+    WHERE gasket_id = ? AND generation <= ? ORDER BY id
+
+so this migration creates the composite index that serves that query and
+drops the indexes that no query uses (each one is maintained on every
+bulk insert of circles):
+- ix_circles_gasket_gen_id: (gasket_id, generation, id) - created
+- ix_circles_gasket_generation: (gasket_id, generation) - prefix of the new index
+- ix_circles_curvature: (curvature_num, curvature_denom) - unused
+- ix_circles_gasket_id, ix_circles_generation, ix_circles_id - single-column
+  indexes covered by the new index or the primary key
+
+Databases created from the current models already have this layout; all
+statements use IF [NOT] EXISTS, so the migration is idempotent.
+
+Usage:
+    python migrations/002_circle_indexes.py
+"""
+
+from sqlalchemy import Engine, text
+import logging
+
+logger = logging.getLogger(__name__)
+
+NEW_INDEX = "ix_circles_gasket_gen_id"
+
+# Indexes removed by this migration, with their definitions for rollback
+DROPPED_INDEXES = {
+    "ix_circles_gasket_generation": "circles (gasket_id, generation)",
+    "ix_circles_curvature": "circles (curvature_num, curvature_denom)",
+    "ix_circles_gasket_id": "circles (gasket_id)",
+    "ix_circles_generation": "circles (generation)",
+    "ix_circles_id": "circles (id)",
+}
+
+
+def migrate_up(engine: Engine) -> None:
+    """
+    Apply migration: create the composite index and drop the unused ones.
+
+    Args:
+        engine: SQLAlchemy engine connected to database
+    """
+    logger.info("Starting migration 002: Circle indexes")
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {NEW_INDEX} "
+            "ON circles (gasket_id, generation, id)"
+        ))
+        logger.info(f"✓ Index present: {NEW_INDEX}")
+
+        for index_name in DROPPED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            logger.info(f"✓ Index absent: {index_name}")
+
+    logger.info("✓ Migration 002 complete")
+
+
+def migrate_down(engine: Engine) -> None:
+    """
+    Rollback migration: restore the previous circle indexes.
+
+    Args:
+        engine: SQLAlchemy engine connected to database
+    """
+    logger.warning("Rolling back migration 002: Restoring previous circle indexes")
+
+    with engine.begin() as conn:
+        for index_name, definition in DROPPED_INDEXES.items():
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {definition}"))
+        conn.execute(text(f"DROP INDEX IF EXISTS {NEW_INDEX}"))
+
+    logger.info("Migration 002 rollback complete")
+
+
+def verify_migration(engine: Engine) -> bool:
+    """
+    Verify that migration was applied successfully.
+
+    Args:
+        engine: SQLAlchemy engine connected to database
+
+    Returns:
+        True if the composite index exists and the dropped ones do not
+    """
+    with engine.connect() as conn:
+        result = conn.execute(text("PRAGMA index_list(circles)"))
+        indexes = {row[1] for row in result.fetchall()}  # row[1] is index name
+
+    leftover = indexes & set(DROPPED_INDEXES)
+    if NEW_INDEX not in indexes or leftover:
+        logger.error(
+            f"Migration incomplete. {NEW_INDEX} present: {NEW_INDEX in indexes}; "
+            f"indexes still to drop: {leftover or 'none'}"
+        )
+        return False
+
+    logger.info("✓ Migration verified: circle indexes up to date")
+    return True
+
+
+if __name__ == "__main__":
+    """
+    Run migration directly from command line.
+
+    Usage:
+        python migrations/002_circle_indexes.py
+    """
+    import sys
+    from pathlib import Path
+
+    # Add parent directory to path for imports
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    from db.base import engine
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    migrate_up(engine)
+    if not verify_migration(engine):
+        raise SystemExit("Migration 002 verification failed")
+
+    print("\n" + "="*60)
+    print("Migration 002 applied successfully!")
+    print("="*60)
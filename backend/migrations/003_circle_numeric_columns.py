@@ -0,0 +1,231 @@
+"""
+Database migration: Add curvature_numeric and packed_rationals to circles.
+
+Reference: .DESIGN_SPEC.md Section 4.2 - Database Schema
+
+The Circle model writes two columns that databases created before them
+do not have:
+- curvature_numeric: NUMERIC(38, 20) - curvature as one sortable number,
+  NULL unless num/denom is an exact terminating decimal
+- packed_rationals: BLOB - the eight num/denom values as little-endian
+  int64, read by the render loaders (NULL falls back to the INTEGER columns)
+
+and the index that serves curvature range queries within a gasket:
+- ix_circles_gasket_curvature_numeric: (gasket_id, curvature_numeric)
+
+Migration Strategy:
+- ADD COLUMN operations are idempotent (existing columns are skipped)
+- Existing rows are backfilled from their INTEGER num/denom columns in
+  pages keyed on id, one commit per page
+- The index uses IF NOT EXISTS
+
+Usage:
+    python migrations/003_circle_numeric_columns.py
+"""
+
+from sqlalchemy import Engine, Numeric, bindparam, text
+from sqlalchemy.exc import OperationalError
+import logging
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = (
+    ("curvature_numeric", "NUMERIC(38, 20)"),
+    ("packed_rationals", "BLOB"),
+)
+
+NEW_INDEX = "ix_circles_gasket_curvature_numeric"
+
+
+def _existing_columns(conn, names) -> set:
+    """Return which of the given column names exist on the circles table."""
+    result = conn.execute(
+        text(
+            "SELECT name FROM pragma_table_info('circles') WHERE name IN :names"
+        ).bindparams(bindparam("names", expanding=True)),
+        {"names": list(names)},
+    )
+    return set(result.scalars())
+
+
+def migrate_up(engine: Engine) -> None:
+    """
+    Apply migration: add the columns and their index, then backfill.
+
+    Args:
+        engine: SQLAlchemy engine connected to database
+
+    Raises:
+        OperationalError: If migration fails (other than column already exists)
+    """
+    logger.info("Starting migration 003: Circle numeric columns")
+
+    with engine.begin() as conn:
+        existing = _existing_columns(conn, [name for name, _ in COLUMNS])
+
+        for column_name, column_type in COLUMNS:
+            if column_name in existing:
+                logger.info(f"⊘ Column already exists: circles.{column_name} (skipping)")
+                continue
+            try:
+                conn.execute(
+                    text(f"ALTER TABLE circles ADD COLUMN {column_name} {column_type}")
+                )
+                logger.info(f"✓ Added column: circles.{column_name}")
+            except OperationalError:
+                logger.error(f"✗ Failed to add column: circles.{column_name}")
+                raise
+
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {NEW_INDEX} "
+            "ON circles (gasket_id, curvature_numeric)"
+        ))
+        logger.info(f"✓ Index present: {NEW_INDEX}")
+
+    backfill_existing_data(engine)
+
+    logger.info("✓ Migration 003 complete")
+
+
+def backfill_existing_data(engine: Engine, batch_size: int = 1000) -> None:
+    """
+    Fill curvature_numeric and packed_rationals for rows written before them.
+
+    Values are computed with the same Circle.numeric_value() and
+    Circle.pack_rationals() used on insert, so backfilled rows match new
+    ones; rows where either is not representable keep NULL there.
+
+    Args:
+        engine: SQLAlchemy engine connected to database
+        batch_size: Circles fetched, updated and committed per page
+    """
+    # Imported here so the module loads before sys.path is set up (__main__)
+    from db.models.circle import Circle, _PACKED_RATIONAL_COLUMNS
+
+    select_page = text(f"""
+        SELECT id, {", ".join(_PACKED_RATIONAL_COLUMNS)}
+        FROM circles
+        WHERE (curvature_numeric IS NULL OR packed_rationals IS NULL)
+          AND id > :last_id
+        ORDER BY id
+        LIMIT :batch_size
+    """)
+    update_rows = text("""
+        UPDATE circles
+        SET curvature_numeric = :curvature_numeric,
+            packed_rationals = :packed_rationals
+        WHERE id = :id
+    """).bindparams(bindparam("curvature_numeric", type_=Numeric(38, 20)))
+
+    backfilled = 0
+    last_id = 0
+
+    with engine.connect() as conn:
+        while True:
+            page = conn.execute(
+                select_page, {"last_id": last_id, "batch_size": batch_size}
+            ).mappings().fetchall()
+            if not page:
+                break
+
+            params = [
+                {
+                    "id": row["id"],
+                    "curvature_numeric": Circle.numeric_value(
+                        row["curvature_num"], row["curvature_denom"]
+                    ),
+                    "packed_rationals": Circle.pack_rationals(row),
+                }
+                for row in page
+            ]
+
+            conn.execute(update_rows, params)
+            conn.commit()
+
+            backfilled += len(page)
+            last_id = page[-1]["id"]
+            logger.info(f"Backfilled {backfilled} circles (through id {last_id})")
+
+    logger.info(f"✓ Backfilled {backfilled} circles")
+
+
+def migrate_down(engine: Engine) -> None:
+    """
+    Rollback migration: drop the index and the columns.
+
+    WARNING: Only use for testing/rollback. Requires SQLite 3.35+ for
+    DROP COLUMN; on older versions the columns remain and are unused.
+
+    Args:
+        engine: SQLAlchemy engine connected to database
+    """
+    logger.warning("Rolling back migration 003: Removing circle numeric columns")
+
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP INDEX IF EXISTS {NEW_INDEX}"))
+        existing = _existing_columns(conn, [name for name, _ in COLUMNS])
+        for column_name, _ in COLUMNS:
+            if column_name in existing:
+                conn.execute(text(f"ALTER TABLE circles DROP COLUMN {column_name}"))
+                logger.info(f"✓ Removed column: circles.{column_name}")
+
+    logger.info("Migration 003 rollback complete")
+
+
+def verify_migration(engine: Engine) -> bool:
+    """
+    Verify that migration was applied successfully.
+
+    Args:
+        engine: SQLAlchemy engine connected to database
+
+    Returns:
+        True if both columns and the index exist
+    """
+    with engine.connect() as conn:
+        present = _existing_columns(conn, [name for name, _ in COLUMNS])
+        indexes = set(
+            conn.execute(
+                text("SELECT name FROM pragma_index_list('circles')")
+            ).scalars()
+        )
+
+    missing = {name for name, _ in COLUMNS} - present
+    if missing or NEW_INDEX not in indexes:
+        logger.error(
+            f"Migration incomplete. Missing columns: {missing or 'none'}; "
+            f"{NEW_INDEX} present: {NEW_INDEX in indexes}"
+        )
+        return False
+
+    logger.info("✓ Migration verified: circle numeric columns present")
+    return True
+
+
+if __name__ == "__main__":
+    """
+    Run migration directly from command line.
+
+    Usage:
+        python migrations/003_circle_numeric_columns.py
+    """
+    import sys
+    from pathlib import Path
+
+    # Add parent directory to path for imports
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    from db.base import engine
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    migrate_up(engine)
+    if not verify_migration(engine):
+        raise SystemExit("Migration 003 verification failed")
+
+    print("\n" + "="*60)
+    print("Migration 003 applied successfully!")
+    print("="*60)
@@ -0,0 +1,190 @@
+"""
+Database migration: Rekey gaskets from SHA-256 to BLAKE2b-256 cache keys.
+
+Reference: .DESIGN_SPEC.md Section 9.1 - Caching Strategy
+
+The gasket cache key (gaskets.hash) is now the BLAKE2b-256 digest of the
+canonical curvature string ("num/denom,..." of the sorted, reduced
+curvatures) instead of its SHA-256 digest. Lookups only use the new key,
+so gaskets stored under the old one would never be hit again; this
+migration recomputes the key of every such row from initial_curvatures.
+
+Both keys are 64 hex characters, so the column is unchanged.
+
+Migration Strategy:
+- Only rows whose hash is the SHA-256 key of their own curvatures are
+  rewritten, so the migration is idempotent and leaves new rows alone
+- Rows are processed in pages keyed on id, one commit per page
+
+Usage:
+    python migrations/004_rehash_gasket_keys.py
+"""
+
+import hashlib
+import json
+from fractions import Fraction
+from typing import List
+
+from sqlalchemy import Engine, text
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _canonical(curvatures: List[str]) -> bytes:
+    """Canonical "num/denom,..." form the cache keys are computed from."""
+    fracs = sorted(Fraction(c) for c in curvatures)
+    return ",".join(f"{f.numerator}/{f.denominator}" for f in fracs).encode()
+
+
+def _legacy_key(canonical: bytes) -> str:
+    """SHA-256 cache key (before this migration)."""
+    return hashlib.sha256(canonical).hexdigest()
+
+
+def _new_key(canonical: bytes) -> str:
+    """BLAKE2b-256 cache key (after this migration)."""
+    return hashlib.blake2b(canonical, digest_size=32).hexdigest()
+
+
+def _legacy_rows(conn, last_id: int, batch_size: int):
+    """
+    Next page of (id, canonical) for rows still keyed by SHA-256.
+
+    Returns:
+        (rows, last id scanned); rows is empty when the page had none
+    """
+    page = conn.execute(
+        text("""
+            SELECT id, hash, initial_curvatures
+            FROM gaskets
+            WHERE id > :last_id
+            ORDER BY id
+            LIMIT :batch_size
+        """),
+        {"last_id": last_id, "batch_size": batch_size},
+    ).fetchall()
+    if not page:
+        return [], None
+
+    rows = []
+    for gasket_id, key, initial_curvatures in page:
+        canonical = _canonical(json.loads(initial_curvatures))
+        if key == _legacy_key(canonical):
+            rows.append((gasket_id, canonical))
+    return rows, page[-1][0]
+
+
+def migrate_up(engine: Engine, batch_size: int = 1000) -> None:
+    """
+    Apply migration: rewrite SHA-256 gasket keys as BLAKE2b-256 keys.
+
+    Args:
+        engine: SQLAlchemy engine connected to database
+        batch_size: Gaskets scanned and committed per page
+    """
+    logger.info("Starting migration 004: Rehash gasket cache keys")
+
+    update_key = text("UPDATE gaskets SET hash = :hash WHERE id = :id")
+
+    rekeyed = 0
+    last_id = 0
+
+    with engine.connect() as conn:
+        while True:
+            rows, last_id = _legacy_rows(conn, last_id, batch_size)
+            if last_id is None:
+                break
+            if rows:
+                conn.execute(
+                    update_key,
+                    [
+                        {"id": gasket_id, "hash": _new_key(canonical)}
+                        for gasket_id, canonical in rows
+                    ],
+                )
+                conn.commit()
+                rekeyed += len(rows)
+
+    logger.info(f"✓ Migration 004 complete: rekeyed {rekeyed} gaskets")
+
+
+def migrate_down(engine: Engine) -> None:
+    """
+    Rollback migration: restore SHA-256 keys for rows keyed by BLAKE2b-256.
+
+    Args:
+        engine: SQLAlchemy engine connected to database
+    """
+    logger.warning("Rolling back migration 004: Restoring SHA-256 gasket keys")
+
+    with engine.begin() as conn:
+        page = conn.execute(
+            text("SELECT id, hash, initial_curvatures FROM gaskets")
+        ).fetchall()
+        params = []
+        for gasket_id, key, initial_curvatures in page:
+            canonical = _canonical(json.loads(initial_curvatures))
+            if key == _new_key(canonical):
+                params.append({"id": gasket_id, "hash": _legacy_key(canonical)})
+        if params:
+            conn.execute(text("UPDATE gaskets SET hash = :hash WHERE id = :id"), params)
+
+    logger.info("Migration 004 rollback complete")
+
+
+def verify_migration(engine: Engine, batch_size: int = 1000) -> bool:
+    """
+    Verify that migration was applied successfully.
+
+    Args:
+        engine: SQLAlchemy engine connected to database
+        batch_size: Gaskets scanned per page
+
+    Returns:
+        True if no gasket is still keyed by SHA-256
+    """
+    last_id = 0
+    with engine.connect() as conn:
+        while True:
+            rows, last_id = _legacy_rows(conn, last_id, batch_size)
+            if rows:
+                logger.error(
+                    f"Migration incomplete. Gaskets still keyed by SHA-256: "
+                    f"{[gasket_id for gasket_id, _ in rows]}"
+                )
+                return False
+            if last_id is None:
+                break
+
+    logger.info("✓ Migration verified: all gasket keys are BLAKE2b-256")
+    return True
+
+
+if __name__ == "__main__":
+    """
+    Run migration directly from command line.
+
+    Usage:
+        python migrations/004_rehash_gasket_keys.py
+    """
+    import sys
+    from pathlib import Path
+
+    # Add parent directory to path for imports
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    from db.base import engine
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    migrate_up(engine)
+    if not verify_migration(engine):
+        raise SystemExit("Migration 004 verification failed")
+
+    print("\n" + "="*60)
+    print("Migration 004 applied successfully!")
+    print("="*60)
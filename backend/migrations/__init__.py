@@ -12,6 +12,9 @@ Reference: .DESIGN_SPEC.md Section 8.4 - Hybrid Exact Arithmetic System
 
 Available Migrations:
 - 001_add_exact_columns: Add TEXT columns for hybrid exact arithmetic
+- 002_circle_indexes: Composite index for the circle response query
+- 003_circle_numeric_columns: Add curvature_numeric, packed_rationals and an index
+- 004_rehash_gasket_keys: Rekey gaskets from SHA-256 to BLAKE2b-256
 """
 
 from migrations.001_add_exact_columns import (
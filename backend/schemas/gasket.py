@@ -95,7 +95,7 @@ class GasketResponse(BaseModel):
 
     Attributes:
         id: Gasket database ID
-        hash: SHA-256 hash of initial curvatures (cache key)
+        hash: BLAKE2b-256 hash of initial curvatures (cache key)
         initial_curvatures: List of curvature strings
         num_circles: Total number of circles in gasket
         max_depth_cached: Maximum depth cached in database
@@ -119,7 +119,7 @@ class GasketResponse(BaseModel):
     """
 
     id: int = Field(..., description="Gasket database ID")
-    hash: str = Field(..., description="SHA-256 hash of initial curvatures")
+    hash: str = Field(..., description="BLAKE2b-256 hash of initial curvatures")
     initial_curvatures: List[str] = Field(
         ..., description="Initial curvature strings"
     )
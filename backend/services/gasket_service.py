@@ -10,24 +10,28 @@ This module implements the service layer for gasket operations, including:
 - Access tracking
 """
 
+import functools
 import hashlib
+import itertools
 import json
-from typing import List, Optional
-from fractions import Fraction
 from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from fractions import Fraction
 
-from sqlalchemy.orm import Session
+import numpy as np
+from fastapi import BackgroundTasks
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy.sql import func
 
-# Use relative import
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from db import Gasket, Circle
+from config import settings
+from db import Gasket, Circle, SessionLocal
+from db.base import utc_now
+from db.models.circle import _PACKED_RATIONAL_COLUMNS
 from core.gasket_generator import generate_apollonian_gasket
 from core.diophantine_generator import generate_apollonian_gasket as generate_diophantine_gasket
 from core.circle_math import fraction_to_tuple
+from core.circle_data import CircleData
 from core.exact_math import ExactNumber
 from schemas import GasketResponse, CircleResponse
 
@@ -50,7 +54,14 @@ def parse_curvature_string(s: str) -> ExactNumber:
         >>> parse_curvature_string("-1")
         -1  # int
     """
-    # Try parsing as Fraction first (handles both "6" and "3/2")
+    # Integers are the common case: int() is a C fast path, and a
+    # ValueError (e.g. "3/2") falls through to the Fraction parser
+    try:
+        return int(s)
+    except ValueError:
+        pass
+
+    # Fraction handles "3/2", "6/3", "-1/2", ...
     frac = Fraction(s)
 
     # If denominator is 1, return as int
@@ -60,22 +71,267 @@ def parse_curvature_string(s: str) -> ExactNumber:
         return frac  # Returns Fraction
 
 
+@functools.lru_cache(maxsize=4096)
+def _canonical_curvatures(curvatures: Tuple[str, ...]) -> str:
+    """
+    Canonical "num/denom,..." form of a curvature tuple (sorted, reduced).
+
+    Memoized on the raw strings, so repeated requests for the same gasket
+    (the cache-hit path) skip the parsing and sorting entirely.
+    """
+    # Integer-only input (the common case) skips Fraction construction;
+    # the canonical form is the same "n/1" the Fraction path produces
+    try:
+        ints = sorted(int(c) for c in curvatures)
+    except ValueError:
+        ints = None
+
+    if ints is not None:
+        canonical = ",".join(f"{n}/1" for n in ints)
+    else:
+        # Parse as Fractions for canonical representation
+        fracs = [Fraction(c) for c in curvatures]
+
+        # Sort for consistency (order shouldn't matter)
+        fracs_sorted = sorted(fracs)
+
+        # Create canonical string: "num1/denom1,num2/denom2,..."
+        canonical = ",".join(f"{f.numerator}/{f.denominator}" for f in fracs_sorted)
+
+    return canonical
+
+
+@functools.lru_cache(maxsize=4096)
+def _curvature_hash(curvatures: Tuple[str, ...]) -> str:
+    """
+    Cache key for a curvature tuple: 64-hex-char BLAKE2b-256 digest.
+
+    The key only has to be collision-free, not cryptographic; BLAKE2b is
+    faster than SHA-256 in CPython and keeps the column width unchanged.
+    """
+    canonical = _canonical_curvatures(curvatures).encode()
+    return hashlib.blake2b(canonical, digest_size=32).hexdigest()
+
+
+# Fields stored as num/denom INTEGER pairs
+_RATIONAL_FIELDS = ("curvature", "center_x", "center_y", "radius")
+
+# Rows per executemany in bulk_insert_circles
+INSERT_CHUNK_SIZE = 1000
+
+
+def _circle_to_row(
+    circle_data: CircleData,
+    gasket_id: int,
+    created_at: datetime,
+    pack_rationals: bool,
+) -> Dict:
+    """Build the circles-table column dict for one generated circle."""
+    # to_database_dict() provides both INTEGER and TEXT column values
+    row = circle_data.to_database_dict()
+    row["gasket_id"] = gasket_id
+    row["generation"] = circle_data.generation
+    row["created_at"] = created_at
+    row["parent_ids"] = Circle.pack_ids(circle_data.parent_ids)
+    row["tangent_ids"] = Circle.pack_ids(circle_data.tangent_ids)
+    row["curvature_numeric"] = Circle.numeric_value(
+        row["curvature_num"], row["curvature_denom"]
+    )
+    # Packed before fitting: a value beyond int64 leaves the BLOB NULL
+    # rather than packing its approximation
+    row["packed_rationals"] = Circle.pack_rationals(row) if pack_rationals else None
+    # Deep-generation values beyond int64 keep their exact TEXT form; the
+    # INTEGER columns get an approximation (see _rational_string())
+    for field in _RATIONAL_FIELDS:
+        num_key, denom_key = f"{field}_num", f"{field}_denom"
+        row[num_key], row[denom_key] = Circle.fit_int64(row[num_key], row[denom_key])
+    return row
+
+
+def _rational_string(exact: Optional[str], num: int, denom: int) -> str:
+    """
+    "num/denom" response string for one rational field.
+
+    Taken from the tagged *_exact text when it holds an int or fraction,
+    since the INTEGER pair is only an approximation for values fitted to
+    int64 by _circle_to_row(). Irrational ("sym:") and legacy (NULL) values
+    use the INTEGER pair.
+    """
+    if exact is not None:
+        tag, _, body = exact.partition(":")
+        if tag == "frac":
+            return body
+        if tag == "int":
+            return f"{body}/1"
+    return f"{num}/{denom}"
+
+
+def bulk_insert_circles(
+    db: Session, gasket_id: int, circles: Iterable[CircleData]
+) -> int:
+    """
+    Insert generated circles for a gasket with chunked executemany statements.
+
+    Builds plain column dicts and runs Core INSERTs, skipping ORM object
+    construction, identity-map bookkeeping and per-row flushes. Rows are
+    sent INSERT_CHUNK_SIZE at a time within the session's transaction, so
+    only one chunk of dicts is alive at once. Rows are inserted in the
+    order given, so ids follow generation order.
+
+    Args:
+        db: SQLAlchemy session (the insert joins its transaction)
+        gasket_id: ID of the already-flushed parent Gasket
+        circles: Circles to persist; may be a generator, consumed once
+
+    Returns:
+        Number of circles inserted
+    """
+    # Core table insert: the ORM entity would evaluate the hybrid
+    # properties at class level, which only make sense on instances
+    insert = Circle.__table__.insert()
+
+    # One client-side timestamp for the whole batch
+    created_at = utc_now()
+    pack_rationals = settings.PACKED_RATIONALS
+
+    count = 0
+    circles = iter(circles)
+    while True:
+        rows = [
+            _circle_to_row(circle_data, gasket_id, created_at, pack_rationals)
+            for circle_data in itertools.islice(circles, INSERT_CHUNK_SIZE)
+        ]
+        if not rows:
+            break
+        db.execute(insert, rows)
+        count += len(rows)
+
+    return count
+
+
+def load_render_rationals(db: Session, gasket_id: int) -> List[Tuple[int, ...]]:
+    """
+    Load the rational geometry of a gasket's circles as plain tuples.
+
+    Reads the single packed_rationals BLOB per row instead of eight INTEGER
+    columns and builds no ORM objects. Rows without a BLOB (written before
+    the column existed, or with values beyond int64) fall back to their
+    INTEGER columns, which hold an int64 approximation of such values; this
+    is enough for rendering, but exact values come from the *_exact columns.
+
+    Args:
+        db: SQLAlchemy session
+        gasket_id: Gasket database ID
+
+    Returns:
+        One (cx_num, cx_denom, cy_num, cy_denom, r_num, r_denom, k_num,
+        k_denom) tuple per circle, in id order
+    """
+    table = Circle.__table__
+    rows = db.execute(
+        select(table.c.packed_rationals, table.c.id)
+        .where(table.c.gasket_id == gasket_id)
+        .order_by(table.c.id)
+    ).all()
+
+    result = []
+    missing = []
+    for packed, circle_id in rows:
+        if packed is not None:
+            result.append(Circle.from_packed(packed))
+        else:
+            missing.append((len(result), circle_id))
+            result.append(None)
+
+    if missing:
+        columns = [table.c[name] for name in _PACKED_RATIONAL_COLUMNS]
+        by_id = {
+            row[0]: tuple(row[1:])
+            for row in db.execute(
+                select(table.c.id, *columns).where(
+                    table.c.id.in_([circle_id for _, circle_id in missing])
+                )
+            )
+        }
+        for index, circle_id in missing:
+            result[index] = by_id[circle_id]
+
+    return result
+
+
+def load_circles_for_render(db: Session, gasket_id: int) -> Dict[str, np.ndarray]:
+    """
+    Load a gasket's circle geometry as float64 arrays for drawing.
+
+    Builds on load_render_rationals(): the integer pairs go into one
+    (N, 8) int64 array and each quantity is a single vectorized division,
+    so no Circle objects or Fractions are created.
+
+    Args:
+        db: SQLAlchemy session
+        gasket_id: Gasket database ID
+
+    Returns:
+        Dict with float64 arrays "cx", "cy", "r" and "k", one entry per
+        circle in id order
+    """
+    rows = load_render_rationals(db, gasket_id)
+    values = np.asarray(rows, dtype=np.int64).reshape(len(rows), 8)
+    return {
+        "cx": values[:, 0] / values[:, 1],
+        "cy": values[:, 2] / values[:, 3],
+        "r": values[:, 4] / values[:, 5],
+        "k": values[:, 6] / values[:, 7],
+    }
+
+
+def record_access(db: Session, gasket_id: int, accessed_at: datetime) -> None:
+    """
+    Count one access of a gasket and commit.
+
+    A single SQL-side UPDATE (access_count = access_count + 1), so nothing
+    is loaded and concurrent accesses are never lost to a read-modify-write.
+    """
+    db.execute(
+        update(Gasket)
+        .where(Gasket.id == gasket_id)
+        .values(access_count=Gasket.access_count + 1, last_accessed_at=accessed_at)
+    )
+    db.commit()
+
+
+def record_access_in_background(gasket_id: int, accessed_at: datetime) -> None:
+    """record_access() in its own session, for use as a background task."""
+    db = SessionLocal()
+    try:
+        record_access(db, gasket_id, accessed_at)
+    finally:
+        db.close()
+
+
 class GasketService:
     """
     Service for gasket operations with caching.
 
     Attributes:
         db: SQLAlchemy database session
+        background_tasks: If set, access tracking is written after the
+            response is sent instead of committed on the request path
     """
 
-    def __init__(self, db: Session):
+    def __init__(
+        self, db: Session, background_tasks: Optional[BackgroundTasks] = None
+    ):
         """
         Initialize service with database session.
 
         Args:
             db: SQLAlchemy session
+            background_tasks: Optional FastAPI BackgroundTasks for deferred
+                access tracking
         """
         self.db = db
+        self.background_tasks = background_tasks
 
     def create_or_get_gasket(
         self, curvatures: List[str], max_depth: int
@@ -97,31 +353,29 @@ class GasketService:
         Reference:
             .DESIGN_SPEC.md section 9.1 - Hash-based caching
         """
-        # Step 1: Generate cache key (SHA-256 hash of sorted curvatures)
+        # Step 1: Generate cache key (BLAKE2b hash of sorted curvatures)
         gasket_hash = self._generate_hash(curvatures)
 
-        # Step 2: Check cache (database lookup by hash)
+        # Step 2: Check cache (database lookup by hash). Only metadata is
+        # loaded here; _gasket_to_response fetches the circles it serves.
         existing_gasket = (
-            self.db.query(Gasket).filter(Gasket.hash == gasket_hash).first()
+            self._query_gaskets().filter(Gasket.hash == gasket_hash).first()
         )
 
         if existing_gasket:
             # Step 3: Check if cached gasket has sufficient depth
             if existing_gasket.max_depth_cached >= max_depth:
-                # Cache hit! Update access tracking
-                existing_gasket.access_count += 1
-                existing_gasket.last_accessed_at = datetime.utcnow()
-                self.db.commit()
-
-                # Return cached gasket
-                return self._gasket_to_response(existing_gasket, max_depth)
+                # Cache hit! Return cached gasket and count the access
+                response = self._gasket_to_response(existing_gasket, max_depth)
+                return self._track_access(response)
 
             else:
                 # Need to generate more depth
                 # For MVP, regenerate entire gasket
                 # TODO: In Phase 7, implement incremental generation
-                self.db.delete(existing_gasket)
-                self.db.commit()
+                # The delete is committed together with the regenerated
+                # gasket (one transaction), or rolled back if generation fails
+                self._delete_gasket_row(existing_gasket.id)
 
         # Step 4: Cache miss - generate new gasket
         gasket = self._generate_and_persist(curvatures, max_depth, gasket_hash)
@@ -129,33 +383,61 @@ class GasketService:
         # Step 5: Return response
         return self._gasket_to_response(gasket, max_depth)
 
-    def get_gasket(self, gasket_id: int) -> Optional[GasketResponse]:
+    def _query_gaskets(self):
+        """
+        Gasket query that refuses to lazy-load Gasket.circles.
+
+        Responses load circles with their own depth-filtered query; touching
+        the relationship would fetch every circle, so it raises instead.
+        """
+        return self.db.query(Gasket).options(raiseload(Gasket.circles))
+
+    def get_gasket(
+        self, gasket_id: int, include_circles: bool = True
+    ) -> Optional[GasketResponse]:
         """
         Retrieve gasket by ID.
 
         Args:
             gasket_id: Gasket database ID
+            include_circles: If False, return metadata only (circles=[])
+                without querying the circles table
 
         Returns:
             GasketResponse if found, None otherwise
         """
-        gasket = self.db.query(Gasket).filter(Gasket.id == gasket_id).first()
+        gasket = self._query_gaskets().filter(Gasket.id == gasket_id).first()
 
         if not gasket:
             return None
 
-        # Update access tracking
-        gasket.access_count += 1
-        gasket.last_accessed_at = datetime.utcnow()
-        self.db.commit()
-
-        # Return all cached circles
+        # Return all cached circles and count the access
         max_depth = gasket.max_depth_cached
-        return self._gasket_to_response(gasket, max_depth)
+        response = self._gasket_to_response(gasket, max_depth, include_circles)
+        return self._track_access(response)
+
+    def _track_access(self, response: GasketResponse) -> GasketResponse:
+        """
+        Record one access of the gasket in response and reflect it there.
+
+        With background_tasks set, the UPDATE runs after the response is
+        sent, so a cache hit does not wait on a commit.
+        """
+        accessed_at = utc_now()
+        if self.background_tasks is not None:
+            self.background_tasks.add_task(
+                record_access_in_background, response.id, accessed_at
+            )
+        else:
+            record_access(self.db, response.id, accessed_at)
+
+        response.access_count += 1
+        response.last_accessed_at = accessed_at.isoformat()
+        return response
 
     def _generate_hash(self, curvatures: List[str]) -> str:
         """
-        Generate SHA-256 hash of curvatures for cache key.
+        Generate BLAKE2b-256 hash of curvatures for cache key.
 
         Curvatures are sorted and canonicalized (as Fractions) before hashing
         to ensure consistent keys regardless of input order.
@@ -164,23 +446,15 @@ class GasketService:
             curvatures: List of curvature strings
 
         Returns:
-            64-character hex SHA-256 hash
+            64-character hex BLAKE2b-256 hash
 
         Example:
             >>> _generate_hash(["1", "1", "1"])
-            'a665a45920422f9d417e4867efdc4fb8a04a1f3fff1fa07e998e86f7f7a27ae3'
+            'd9ee23864d5e9046e69ea6f017c786e68c097947919d064231c869a8e9f8a681'
         """
-        # Parse as Fractions for canonical representation
-        fracs = [Fraction(c) for c in curvatures]
-
-        # Sort for consistency (order shouldn't matter)
-        fracs_sorted = sorted(fracs)
-
-        # Create canonical string: "num1/denom1,num2/denom2,..."
-        canonical = ",".join(f"{f.numerator}/{f.denominator}" for f in fracs_sorted)
-
-        # Generate SHA-256 hash
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        # Plain string sort (no parsing) so input orderings share one
+        # memoized entry; the canonical form does the numeric sort
+        return _curvature_hash(tuple(sorted(curvatures)))
 
     def _generate_and_persist(
         self, curvatures: List[str], max_depth: int, gasket_hash: str
@@ -203,57 +477,37 @@ class GasketService:
         # Preserves int type for integers, uses Fraction for rationals
         parsed_curvatures = [parse_curvature_string(c) for c in curvatures]
 
-        # Generate gasket using core algorithm
-        circles_data = list(
-            #generate_diophantine_gasket(parsed_curvatures, max_depth, stream=False)
-            generate_apollonian_gasket(parsed_curvatures, max_depth, stream=False)
+        # Generate gasket using core algorithm, streaming circles straight
+        # into the chunked insert so the full list is never materialized
+        circles_data = (
+            #generate_diophantine_gasket(parsed_curvatures, max_depth, stream=True)
+            generate_apollonian_gasket(parsed_curvatures, max_depth, stream=True)
         )
 
-        # Create Gasket model
+        # Create Gasket model (num_circles is known once the stream is drained)
         gasket = Gasket(
             hash=gasket_hash,
             initial_curvatures=json.dumps(curvatures),
-            num_circles=len(circles_data),
+            num_circles=0,
             max_depth_cached=max_depth,
             access_count=1,
         )
         self.db.add(gasket)
         self.db.flush()  # Get gasket.id
 
-        # Create Circle models
-        for circle_data in circles_data:
-            # Convert CircleData to Circle model using hybrid exact arithmetic
-            # to_database_dict() provides both INTEGER and TEXT column values
-            db_dict = circle_data.to_database_dict()
-
-            circle = Circle(
-                gasket_id=gasket.id,
-                generation=circle_data.generation,
-                # INTEGER columns (for indexing and backward compatibility)
-                curvature_num=db_dict["curvature_num"],
-                curvature_denom=db_dict["curvature_denom"],
-                center_x_num=db_dict["center_x_num"],
-                center_x_denom=db_dict["center_x_denom"],
-                center_y_num=db_dict["center_y_num"],
-                center_y_denom=db_dict["center_y_denom"],
-                radius_num=db_dict["radius_num"],
-                radius_denom=db_dict["radius_denom"],
-                # TEXT columns (for exact storage, Phase 3 migration)
-                curvature_exact=db_dict["curvature_exact"],
-                center_x_exact=db_dict["center_x_exact"],
-                center_y_exact=db_dict["center_y_exact"],
-                radius_exact=db_dict["radius_exact"],
-                # Metadata
-                parent_ids=json.dumps(circle_data.parent_ids),
-                tangent_ids=json.dumps(circle_data.tangent_ids),
-            )
-            self.db.add(circle)
+        # Insert circles chunk by chunk as they are generated (no per-row
+        # ORM objects); generation errors surface here, so undo the gasket
+        try:
+            gasket.num_circles = bulk_insert_circles(self.db, gasket.id, circles_data)
+        except Exception:
+            self.db.rollback()
+            raise
 
         self.db.commit()
         return gasket
 
     def _gasket_to_response(
-        self, gasket: Gasket, max_depth: int
+        self, gasket: Gasket, max_depth: int, include_circles: bool = True
     ) -> GasketResponse:
         """
         Convert Gasket model to response schema.
@@ -261,38 +515,64 @@ class GasketService:
         Args:
             gasket: Gasket database model
             max_depth: Maximum depth to include (for filtering circles)
+            include_circles: If False, skip loading circles; num_circles
+                then reports the stored count
 
         Returns:
             GasketResponse schema
         """
-        # Filter circles by max_depth
-        circles = [
-            c for c in gasket.circles if c.generation <= max_depth
-        ]
+        if not include_circles:
+            return self._build_response(gasket, gasket.num_circles, [])
+
+        # Load only the circles within max_depth, filtered in SQL (served
+        # by ix_circles_gasket_gen_id) rather than loading gasket.circles
+        circles = (
+            self.db.query(Circle)
+            .filter(Circle.gasket_id == gasket.id, Circle.generation <= max_depth)
+            .order_by(Circle.id)
+            .all()
+        )
 
-        # Convert circles to response schemas
+        # Convert circles to response schemas. Every field is built here with
+        # its final type (str / int / List[int]), so skip per-field validation;
+        # GasketResponse keeps the instances as-is
+        construct = CircleResponse.model_construct
         circle_responses = []
         for circle in circles:
-            circle_resp = CircleResponse(
+            circle_resp = construct(
                 id=circle.id,
-                curvature=f"{circle.curvature_num}/{circle.curvature_denom}",
+                curvature=_rational_string(
+                    circle.curvature_exact, circle.curvature_num, circle.curvature_denom
+                ),
                 center={
-                    "x": f"{circle.center_x_num}/{circle.center_x_denom}",
-                    "y": f"{circle.center_y_num}/{circle.center_y_denom}",
+                    "x": _rational_string(
+                        circle.center_x_exact, circle.center_x_num, circle.center_x_denom
+                    ),
+                    "y": _rational_string(
+                        circle.center_y_exact, circle.center_y_num, circle.center_y_denom
+                    ),
                 },
-                radius=f"{circle.radius_num}/{circle.radius_denom}",
+                radius=_rational_string(
+                    circle.radius_exact, circle.radius_num, circle.radius_denom
+                ),
                 generation=circle.generation,
-                parent_ids=json.loads(circle.parent_ids) if circle.parent_ids else [],
-                tangent_ids=json.loads(circle.tangent_ids) if circle.tangent_ids else [],
+                parent_ids=circle.parent_ids,
+                tangent_ids=circle.tangent_ids,
             )
             circle_responses.append(circle_resp)
 
-        # Convert gasket to response
+        return self._build_response(gasket, len(circle_responses), circle_responses)
+
+    @staticmethod
+    def _build_response(
+        gasket: Gasket, num_circles: int, circles: List[CircleResponse]
+    ) -> GasketResponse:
+        """Build the GasketResponse for a gasket and its serialized circles."""
         return GasketResponse(
             id=gasket.id,
             hash=gasket.hash,
             initial_curvatures=json.loads(gasket.initial_curvatures),
-            num_circles=len(circle_responses),
+            num_circles=num_circles,
             max_depth_cached=gasket.max_depth_cached,
             created_at=gasket.created_at.isoformat() if gasket.created_at else "",
             last_accessed_at=(
@@ -301,7 +581,7 @@ class GasketService:
                 else None
             ),
             access_count=gasket.access_count,
-            circles=circle_responses,
+            circles=circles,
         )
 
     def delete_gasket(self, gasket_id: int) -> bool:
@@ -314,11 +594,12 @@ class GasketService:
         Returns:
             True if a gasket was deleted, False if not found.
         """
-        gasket = self.db.query(Gasket).filter(Gasket.id == gasket_id).first()
-        if not gasket:
-            return False
-
-        # Delete gasket (CASCADE should remove circles if configured)
-        self.db.delete(gasket)
+        deleted = self._delete_gasket_row(gasket_id)
         self.db.commit()
-        return True
+        return deleted
+
+    def _delete_gasket_row(self, gasket_id: int) -> bool:
+        """Delete a gasket in the current transaction, without committing."""
+        # One DELETE statement; the database cascades to the circles
+        result = self.db.execute(delete(Gasket).where(Gasket.id == gasket_id))
+        return result.rowcount > 0
@@ -27,6 +27,12 @@ from main import app
 from db.base import Base, engine, SessionLocal
 from db.models.gasket import Gasket
 from db.models.circle import Circle
+from services import GasketService
+from services.gasket_service import (
+    _curvature_hash,
+    load_circles_for_render,
+    load_render_rationals,
+)
 
 
 @pytest.fixture(scope="function")
@@ -145,6 +151,82 @@ class TestPostGaskets:
         assert circle.center_y_exact.startswith(("int:", "frac:", "sym:"))
         assert circle.radius_exact.startswith(("int:", "frac:", "sym:"))
 
+    def test_packed_rationals_match_integer_columns(self, client, db_session):
+        """Test the packed BLOB mirrors the INTEGER columns it denormalizes."""
+        response = client.post("/api/gaskets", json={
+            "curvatures": ["2", "3", "15"],
+            "max_depth": 2
+        })
+        assert response.status_code == 201
+        gasket_id = response.json()["id"]
+
+        circles = db_session.query(Circle).order_by(Circle.id).all()
+        expected = [
+            (
+                c.center_x_num, c.center_x_denom,
+                c.center_y_num, c.center_y_denom,
+                c.radius_num, c.radius_denom,
+                c.curvature_num, c.curvature_denom,
+            )
+            for c in circles
+        ]
+        assert all(c.packed_rationals is not None for c in circles)
+        assert load_render_rationals(db_session, gasket_id) == expected
+
+        # Rows without a BLOB fall back to the INTEGER columns
+        circles[0].packed_rationals = None
+        db_session.commit()
+        assert load_render_rationals(db_session, gasket_id) == expected
+
+    def test_load_circles_for_render(self, client, db_session):
+        """Test render arrays match the exact values as floats."""
+        response = client.post("/api/gaskets", json={
+            "curvatures": ["2", "3", "15"],
+            "max_depth": 2
+        })
+        gasket_id = response.json()["id"]
+
+        arrays = load_circles_for_render(db_session, gasket_id)
+        circles = db_session.query(Circle).order_by(Circle.id).all()
+
+        assert len(arrays["k"]) == len(circles)
+        for i, circle in enumerate(circles):
+            assert arrays["cx"][i] == float(circle.center_x)
+            assert arrays["cy"][i] == float(circle.center_y)
+            assert arrays["r"][i] == float(circle.radius)
+            assert arrays["k"][i] == float(circle.curvature)
+
+        empty = load_circles_for_render(db_session, gasket_id + 1)
+        assert empty["k"].shape == (0,)
+
+    def test_circles_share_batch_timestamp(self, client, db_session):
+        """Test bulk-inserted circles get one client-side created_at."""
+        response = client.post("/api/gaskets", json={
+            "curvatures": ["1", "2", "2"],
+            "max_depth": 2
+        })
+        assert response.status_code == 201
+
+        timestamps = {c.created_at for c in db_session.query(Circle).all()}
+        assert len(timestamps) == 1
+        assert None not in timestamps
+
+    def test_bulk_insert_in_chunks(self, client, db_session, monkeypatch):
+        """Test circles inserted across several chunks are all persisted in order."""
+        import services.gasket_service as gasket_service
+
+        monkeypatch.setattr(gasket_service, "INSERT_CHUNK_SIZE", 7)
+        response = client.post("/api/gaskets", json={
+            "curvatures": ["2", "3", "15"],
+            "max_depth": 2
+        })
+        assert response.status_code == 201
+
+        data = response.json()
+        circles = db_session.query(Circle).order_by(Circle.id).all()
+        assert len(circles) == data["num_circles"] > 7
+        assert [c.generation for c in circles] == sorted(c.generation for c in circles)
+
     def test_create_gasket_fraction_curvatures(self, client, db_session):
         """
         Test gasket creation with fraction curvatures ["3/2", "5/3", "7/4"].
@@ -276,6 +358,12 @@ class TestPostGaskets:
         gasket_count = db_session.query(Gasket).count()
         assert gasket_count == 1, "Should reuse existing gasket (cache hit)"
 
+        # Only circles within the requested depth are returned
+        assert data2["num_circles"] < data1["num_circles"]
+        assert max(c["generation"] for c in data2["circles"]) == 3
+        ids = [c["id"] for c in data2["circles"]]
+        assert ids == sorted(ids)
+
     def test_cache_miss_insufficient_depth(self, client, db_session):
         """
         Test cache miss when cached depth < requested depth.
@@ -372,6 +460,54 @@ class TestGetGasket:
 
         assert response.status_code == 404
 
+    def test_get_gasket_meta(self, client, db_session):
+        """Test metadata endpoint returns counts but no circles."""
+        create_response = client.post("/api/gaskets", json={
+            "curvatures": ["1", "2", "2"],
+            "max_depth": 2
+        })
+        created = create_response.json()
+
+        response = client.get(f"/api/gaskets/{created['id']}/meta")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["circles"] == []
+        assert data["num_circles"] == created["num_circles"]
+        assert data["access_count"] == created["access_count"] + 1
+
+        assert client.get("/api/gaskets/99999/meta").status_code == 404
+
+    def test_values_beyond_int64_served_exactly(self, client, db_session):
+        """Test rationals fitted to int64 columns are still returned exactly."""
+        huge = f"{10**20 + 1}/{10**20}"
+        create_response = client.post("/api/gaskets", json={
+            "curvatures": [huge, "1", "1"],
+            "max_depth": 1
+        })
+        assert create_response.status_code == 201
+        gasket_id = create_response.json()["id"]
+
+        response = client.get(f"/api/gaskets/{gasket_id}")
+
+        assert response.status_code == 200
+        circle = response.json()["circles"][0]
+        assert circle["curvature"] == huge
+        assert circle["radius"] == f"{10**20}/{10**20 + 1}"
+
+        # The INTEGER pair is approximate, so no BLOB is packed from it
+        stored = (
+            db_session.query(Circle)
+            .filter_by(gasket_id=gasket_id)
+            .order_by(Circle.id)
+            .first()
+        )
+        assert Fraction(stored.curvature_num, stored.curvature_denom) != Fraction(huge)
+        assert stored.packed_rationals is None
+        assert len(load_render_rationals(db_session, gasket_id)) == len(
+            response.json()["circles"]
+        )
+
     def test_access_tracking(self, client, db_session):
         """Test that access_count increments on each GET."""
         # Create gasket
@@ -642,6 +778,50 @@ class TestCachingBehavior:
 
         assert hash1 != hash2, "Different curvatures should produce different hashes"
 
+    def test_integer_hash_matches_fraction_form(self):
+        """Test that the integer fast path hashes like the Fraction path."""
+        assert _curvature_hash(("2", "-1", "3")) == _curvature_hash(("4/2", "-1", "9/3"))
+        assert _curvature_hash(("1", "1", "1")) != _curvature_hash(("1", "1", "3/2"))
+
+    def test_failed_regeneration_keeps_cached_gasket(self, db_session, monkeypatch):
+        """Test that the stale gasket is only deleted if regeneration commits."""
+        import services.gasket_service as gasket_service
+
+        service = GasketService(db_session)
+        created = service.create_or_get_gasket(["1", "2", "2"], max_depth=1)
+
+        def failing_generator(*args, **kwargs):
+            raise RuntimeError("generation failed")
+            yield
+
+        monkeypatch.setattr(gasket_service, "generate_apollonian_gasket", failing_generator)
+        with pytest.raises(RuntimeError):
+            service.create_or_get_gasket(["1", "2", "2"], max_depth=3)
+
+        kept = db_session.get(Gasket, created.id)
+        assert kept is not None
+        assert kept.max_depth_cached == 1
+        assert db_session.query(Circle).filter_by(gasket_id=created.id).count() == created.num_circles
+
+    def test_service_tracks_access_without_background_tasks(self, db_session):
+        """Test that a bare GasketService commits access tracking itself."""
+        service = GasketService(db_session)
+        created = service.create_or_get_gasket(["1", "2", "2"], max_depth=1)
+
+        hit = service.create_or_get_gasket(["1", "2", "2"], max_depth=1)
+        assert hit.access_count == created.access_count + 1
+
+        fetched = service.get_gasket(created.id, include_circles=False)
+        assert fetched.access_count == created.access_count + 2
+
+        other = SessionLocal()
+        try:
+            stored = other.get(Gasket, created.id)
+            assert stored.access_count == created.access_count + 2
+            assert stored.last_accessed_at is not None
+        finally:
+            other.close()
+
 
 class TestErrorHandling:
     """Tests for validation and error responses."""
@@ -702,3 +882,21 @@ class TestErrorHandling:
         # Should either reject or handle gracefully
         # (implementation may have max depth validation)
         assert response.status_code in [201, 400, 422]
+
+
+class TestHealthCheck:
+    """Tests for GET /health."""
+
+    def test_health_reports_database_connected(self, client):
+        """Test the probe reaches the database and reuses the result."""
+        import main
+
+        main._db_health["checked_at"] = None
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["database"] == "connected"
+
+        checked_at = main._db_health["checked_at"]
+        client.get("/health")
+        assert main._db_health["checked_at"] == checked_at
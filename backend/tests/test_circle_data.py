@@ -176,6 +176,46 @@ class TestCircleDataHash:
         assert circle1.hash_key() != circle2.hash_key()
 
 
+class TestCircleDataFloats:
+    """Tests for cached float projection."""
+
+    def test_as_floats_values(self):
+        """Test that as_floats() projects curvature and center to floats."""
+        circle = CircleData(
+            curvature=Fraction(3, 2),
+            center=(Fraction(1, 4), -1),
+            generation=0,
+        )
+
+        assert circle.as_floats() == (1.5, 0.25, -1.0)
+
+    def test_as_floats_cached(self):
+        """Test that the projection is computed once and not compared."""
+        circle = CircleData(curvature=2, center=(0, 0), generation=0)
+        floats = circle.as_floats()
+
+        assert circle.as_floats() is floats
+        assert circle == CircleData(curvature=2, center=(0, 0), generation=0)
+
+    def test_with_floats_seeds_projection(self):
+        """Test that with_floats() supplies the projection up front."""
+        floats = (2.0, 0.5, 0.0)
+        circle = CircleData.with_floats(
+            floats, curvature=2, center=(Fraction(1, 2), 0), generation=1
+        )
+
+        assert circle.as_floats() is floats
+        assert circle == CircleData(curvature=2, center=(Fraction(1, 2), 0), generation=1)
+
+    def test_radius_cached(self):
+        """Test that the radius is computed once and not compared."""
+        circle = CircleData(curvature=Fraction(3, 2), center=(0, 0), generation=0)
+        radius = circle.radius()
+
+        assert circle.radius() is radius
+        assert circle == CircleData(curvature=Fraction(3, 2), center=(0, 0), generation=0)
+
+
 class TestCircleDataSerialization:
     """Tests for to_dict serialization."""
 
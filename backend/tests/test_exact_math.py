@@ -17,11 +17,13 @@ from fractions import Fraction
 import sympy as sp
 from sympy import sqrt, Rational, I, simplify
 
+from core import exact_math
 from core.exact_math import (
     # Type detection
     is_sympy_integer,
     is_sympy_rational,
     sympy_to_exact,
+    sympy_to_exact_batch,
     # Arithmetic operations
     smart_add,
     smart_multiply,
@@ -44,6 +46,7 @@ from core.exact_math import (
     parse_exact,
     to_numerator_denominator,
     to_fraction_lossy,
+    # Batched operations
 )
 
 
@@ -147,6 +150,21 @@ class TestTypeDetection:
         assert result == Fraction(-5, 3)
         assert isinstance(result, Fraction)
 
+    # sympy_to_exact_batch tests (2 tests)
+    def test_sympy_to_exact_batch_matches_scalar(self):
+        """Test batch conversion matches sympy_to_exact element by element."""
+        exprs = [sqrt(4) + 1, sqrt(4) / 4, sqrt(2), sqrt(2) * sqrt(6) + sqrt(3)]
+        result = sympy_to_exact_batch(exprs)
+        assert result[:3] == [3, Fraction(1, 2), sqrt(2)]
+        assert isinstance(result[0], int)
+        assert isinstance(result[1], Fraction)
+        assert simplify(result[3] - 3 * sqrt(3)) == 0
+
+    def test_sympy_to_exact_batch_duplicates_and_plain_numbers(self):
+        """Test duplicates keep their positions and int/Fraction pass through."""
+        result = sympy_to_exact_batch([sqrt(9), 5, sqrt(9), Fraction(1, 3)])
+        assert result == [3, 5, 3, Fraction(1, 3)]
+
 
 class TestArithmeticOperations:
     """Tests for arithmetic operation functions (30 tests)."""
@@ -238,6 +256,12 @@ class TestArithmeticOperations:
         assert result == Fraction(3, 2)
         assert isinstance(result, Fraction)
 
+    def test_smart_divide_int_negative_denominator(self):
+        """Test int division normalizes sign and reduces to lowest terms."""
+        result = smart_divide(6, -4)
+        assert result == Fraction(-3, 2)
+        assert (result.numerator, result.denominator) == (-3, 2)
+
     def test_smart_divide_fractions_to_int(self):
         """Test fraction division resulting in int."""
         result = smart_divide(Fraction(3, 2), Fraction(3, 4))
@@ -314,6 +338,23 @@ class TestArithmeticOperations:
         assert result == Fraction(1, 4)
         assert isinstance(result, Fraction)
 
+    def test_smart_power_negative_int_exponent(self):
+        """Test 2^-2 = 1/4 stays exact instead of becoming a float."""
+        result = smart_power(2, -2)
+        assert result == Fraction(1, 4)
+        assert isinstance(result, Fraction)
+
+    def test_smart_power_rational_exponent_perfect_root(self):
+        """Test 8^(2/3) = 4 and (4/9)^(-1/2) = 3/2 without SymPy."""
+        assert smart_power(8, Fraction(2, 3)) == 4
+        assert isinstance(smart_power(8, Fraction(2, 3)), int)
+        assert smart_power(Fraction(4, 9), Fraction(-1, 2)) == Fraction(3, 2)
+
+    def test_smart_power_rational_exponent_irrational_result(self):
+        """Test 2^(1/2) falls back to SymPy."""
+        result = smart_power(2, Fraction(1, 2))
+        assert result == sqrt(2)
+
     def test_smart_power_irrational_base(self):
         """Test (sqrt(2))^2 = 2."""
         result = smart_power(sqrt(2), 2)
@@ -418,6 +459,19 @@ class TestComplexOperations:
         assert real == 0
         assert imag == 2
 
+    def test_complex_sqrt_gaussian_integer(self):
+        """Test sqrt(3 - 4i) = 2 - i stays in int arithmetic."""
+        real, imag = smart_complex_sqrt((3, -4))
+        assert (real, imag) == (2, -1)
+        assert isinstance(real, int) and isinstance(imag, int)
+
+    def test_complex_sqrt_non_gaussian_root(self):
+        """Test sqrt(2i) = 1 + i and sqrt(1 + i) falls back to SymPy."""
+        assert smart_complex_sqrt((0, 2)) == (1, 1)
+        real, imag = smart_complex_sqrt((1, 1))
+        assert isinstance(real, sp.Expr)
+        assert abs(complex(sp.N(real + imag * I)) ** 2 - (1 + 1j)) < 1e-12
+
     # smart_real, smart_imag tests (4 tests)
     def test_smart_real_from_tuple(self):
         """Test extracting real part from tuple."""
@@ -480,6 +534,24 @@ class TestConversionFunctions:
         result = to_sympy(3.14)
         assert isinstance(result, sp.Float)
 
+    def test_to_sympy_from_numpy_scalar(self):
+        """Test other SymPy-convertible numbers go through sympify."""
+        import numpy as np
+        result = to_sympy(np.int64(7))
+        assert result == sp.Integer(7)
+
+    def test_to_sympy_rejects_string(self):
+        """Test strings are not parsed implicitly."""
+        with pytest.raises(TypeError, match="Cannot convert") as excinfo:
+            to_sympy("sqrt(2)")
+        assert isinstance(excinfo.value.__cause__, sp.SympifyError)
+
+    @pytest.mark.parametrize("value", [(1,), [1, 2], {1: 2}])
+    def test_to_sympy_rejects_containers(self, value):
+        """Test containers are rejected rather than returned as non-Expr."""
+        with pytest.raises(TypeError, match="Cannot convert"):
+            to_sympy(value)
+
     # to_string tests (4 tests)
     def test_to_string_from_int(self):
         """Test converting int to string."""
@@ -541,6 +613,13 @@ class TestConversionFunctions:
         result = parse_exact("frac:-3/4")
         assert result == Fraction(-3, 4)
 
+    def test_parse_exact_fraction_memoized(self):
+        """Test repeated 'frac:' strings share one Fraction; errors are not cached."""
+        assert parse_exact("frac:5/7") is parse_exact("frac:5/7")
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parse_exact("frac:1/2/3")
+
     # to_numerator_denominator tests (2 tests)
     def test_to_numerator_denominator_int(self):
         """Test converting int to (num, denom)."""
@@ -566,6 +645,12 @@ class TestConversionFunctions:
         result = to_fraction_lossy(frac)
         assert result == frac
 
+    def test_to_fraction_lossy_high_precision(self):
+        """Test large max_denom is not limited by float precision."""
+        result = to_fraction_lossy(sqrt(2), max_denom=10**20)
+        assert result.denominator > 10**17
+        assert abs(sp.Rational(result.numerator, result.denominator) - sqrt(2)) < sp.Rational(1, 10**20)
+
 
 class TestEdgeCases:
     """Tests for edge cases and error handling (15 tests)."""
@@ -667,6 +752,32 @@ class TestEdgeCases:
             format_exact(3.14)  # float not supported
 
 
+class TestSympyCacheClearing:
+    """Tests for periodic SymPy cache clearing (2 tests)."""
+
+    def test_cache_cleared_every_interval(self, monkeypatch):
+        """Test SymPy cache is cleared after _SYMPY_CLEAR_INTERVAL SymPy ops."""
+        calls = []
+        monkeypatch.setattr(exact_math, "_SYMPY_CLEAR_INTERVAL", 2)
+        monkeypatch.setattr(exact_math, "_sympy_op_count", 0)
+        monkeypatch.setattr(exact_math, "clear_cache", lambda: calls.append(1))
+
+        smart_add(sqrt(2), 1)
+        assert calls == []
+        smart_multiply(sqrt(2), 3)
+        assert calls == [1]
+
+    def test_fast_path_does_not_count(self, monkeypatch):
+        """Test int/Fraction arithmetic never triggers cache clearing."""
+        calls = []
+        monkeypatch.setattr(exact_math, "_SYMPY_CLEAR_INTERVAL", 1)
+        monkeypatch.setattr(exact_math, "clear_cache", lambda: calls.append(1))
+
+        smart_add(1, 2)
+        smart_divide(Fraction(1, 2), 3)
+        assert calls == []
+
+
 # Test that round-trip conversions work correctly
 class TestRoundTripConversions:
     """Tests for round-trip conversions (5 tests)."""
@@ -0,0 +1,232 @@
+"""
+Unit tests for the float64 gasket generator.
+
+Reference: backend/core/float_generator.py
+"""
+
+import math
+import numpy as np
+import pytest
+from fractions import Fraction
+from collections import Counter
+
+from core.float_generator import (
+    descartes_solve_f64,
+    descartes_reflect_f64_batch,
+    generate_apollonian_gasket,
+    generate_gasket_array,
+    MAX_DENOMINATOR,
+    _float_to_exact,
+    _initial_capacity,
+    _small_rationals,
+)
+from core.gasket_generator import generate_apollonian_gasket as generate_exact_gasket
+
+
+class TestDescartesSolveF64:
+    """Tests for descartes_solve_f64()."""
+
+    def test_standard_configuration(self):
+        """Test (-1, 2, 2) gives the two circles of curvature 3."""
+        (k_a, x_a, y_a), (k_b, x_b, y_b) = descartes_solve_f64(
+            -1.0, 2.0, 2.0, 0.0, 0.0, 0.5, 0.0, -0.5, 0.0
+        )
+
+        assert k_a == pytest.approx(3.0)
+        assert k_b == pytest.approx(3.0)
+        assert x_a == pytest.approx(0.0)
+        assert x_b == pytest.approx(0.0)
+        assert sorted([y_a, y_b]) == pytest.approx([-2 / 3, 2 / 3])
+
+    def test_solutions_are_tangent(self):
+        """Test both solutions are tangent to all three circles."""
+        circles = [(-1.0, 0.0, 0.0), (2.0, 0.5, 0.0), (3.0, 0.0, 2 / 3)]
+        (k1, x1, y1), (k2, x2, y2), (k3, x3, y3) = circles
+
+        for k, x, y in descartes_solve_f64(k1, k2, k3, x1, y1, x2, y2, x3, y3):
+            for ki, xi, yi in circles:
+                distance = math.hypot(x - xi, y - yi)
+                assert distance == pytest.approx(abs(1 / k + 1 / ki))
+
+    def test_invalid_triplet_returns_nan(self):
+        """Test a negative discriminant yields NaN solutions."""
+        for k, x, y in descartes_solve_f64(-1.0, 2.0, 0.5, 0, 0, 1, 0, 0, 1):
+            assert math.isnan(k)
+
+
+def _weighted(*circles):
+    """Build an (N, 3) array of curvature-weighted (k, k*x, k*y) rows."""
+    return np.array([(k, k * x, k * y) for k, x, y in circles])
+
+
+class TestDescartesReflectF64Batch:
+    """Tests for descartes_reflect_f64_batch()."""
+
+    def test_reflects_to_other_root(self):
+        """Test reflecting one Descartes root gives the other root."""
+        r1 = _weighted((-1.0, 0.0, 0.0))
+        r2 = _weighted((2.0, 0.5, 0.0))
+        r3 = _weighted((2.0, -0.5, 0.0))
+        parent = _weighted((3.0, 0.0, 2 / 3))
+
+        result = descartes_reflect_f64_batch(r1, r2, r3, parent)
+
+        assert result[0] == pytest.approx(_weighted((3.0, 0.0, -2 / 3))[0])
+
+    def test_matches_scalar_solver(self):
+        """Test reflection agrees with the non-parent root of descartes_solve_f64()."""
+        triplet = [(-1.0, 0.0, 0.0), (2.0, 0.5, 0.0), (3.0, 0.0, 2 / 3)]
+        (k1, x1, y1), (k2, x2, y2), (k3, x3, y3) = triplet
+        roots = descartes_solve_f64(k1, k2, k3, x1, y1, x2, y2, x3, y3)
+        rows = [_weighted(circle) for circle in triplet]
+
+        reflected = descartes_reflect_f64_batch(*rows, _weighted(roots[0]))
+
+        assert reflected[0] == pytest.approx(_weighted(roots[1])[0])
+
+    def test_straight_line_has_zero_curvature(self):
+        """Test a straight-line reflection comes back with zero curvature."""
+        r1 = _weighted((1.0, 0.0, 0.0))
+        r2 = _weighted((1.0, 2.0, 0.0))
+        r3 = _weighted((1.0, 4.0, 0.0))
+        parent = _weighted((6.0, 0.0, 0.0))
+
+        result = descartes_reflect_f64_batch(r1, r2, r3, parent)
+
+        assert result[0, 0] == pytest.approx(0.0)
+
+
+class TestFloatToExact:
+    """Tests for _float_to_exact()."""
+
+    def test_matches_limit_denominator(self):
+        """Test results equal Fraction.limit_denominator() exactly."""
+        values = [2 / 3, -1 / 7, 0.5, 1e-12, math.pi, -math.sqrt(2), 123456.789, 1 / 3 * 1e-5]
+        for value in values:
+            expected = Fraction(value).limit_denominator(MAX_DENOMINATOR)
+            assert _float_to_exact(value) == expected
+
+    def test_compiled_fast_path_matches_limit_denominator(self):
+        """Test every value settled by _small_rationals() matches limit_denominator()."""
+        rng = np.random.default_rng(0)
+        values = np.concatenate([
+            rng.integers(-5000, 5000, 2000) / rng.integers(1, 5000, 2000),
+            rng.uniform(-3, 3, 2000),
+            [2 / 3, -1 / 7, 0.0, 1e300, -1e-300, math.pi],
+        ])
+
+        numerators, denominators = _small_rationals(values)
+
+        assert denominators[:2000].all()
+        for value, n, d in zip(values, numerators, denominators):
+            if d:
+                assert Fraction(int(n), int(d)) == Fraction(value).limit_denominator(MAX_DENOMINATOR)
+
+    def test_integers_become_int(self):
+        """Test integral floats convert to int, not Fraction."""
+        assert _float_to_exact(-4.0) == -4
+        assert isinstance(_float_to_exact(-4.0), int)
+        assert isinstance(_float_to_exact(3.0000000000000004), int)
+
+
+class TestFloatGenerateApollonianGasket:
+    """Tests for float64 generate_apollonian_gasket()."""
+
+    def test_generation_counts(self):
+        """Test each generation after the first triples in size."""
+        circles = list(generate_apollonian_gasket([Fraction(-1), Fraction(2), Fraction(2)], 5))
+        counts = Counter(c.generation for c in circles)
+
+        assert counts == {0: 3, 1: 2, 2: 6, 3: 18, 4: 54, 5: 162}
+
+    def test_deep_generation_has_no_duplicates(self):
+        """Test the compiled kernel keeps exact tree counts at depth 8."""
+        circles = list(generate_apollonian_gasket([Fraction(-1), Fraction(2), Fraction(2)], 8))
+
+        assert len(circles) == 3 + 2 * (3**8 - 1) // 2
+        assert len({(c.curvature, c.center) for c in circles}) == len(circles)
+
+    def test_initial_capacity_bounds_gasket_size(self):
+        """Test the preallocated buffers fit a full gasket without growing."""
+        for depth in range(6):
+            circles = list(generate_apollonian_gasket([Fraction(-1), Fraction(2), Fraction(2)], depth))
+            assert len(circles) <= _initial_capacity(3, depth)
+
+        assert _initial_capacity(3, 40) == _initial_capacity(3, 13)
+
+    def test_irrational_configuration(self):
+        """Test (1, 1, 1) generates without symbolic arithmetic."""
+        circles = list(generate_apollonian_gasket([Fraction(1), Fraction(1), Fraction(1)], 4))
+
+        assert len(circles) == 3 + 2 + 6 + 18 + 54
+        curvatures = sorted(float(c.curvature) for c in circles if c.generation == 1)
+        assert curvatures == pytest.approx([3 - 2 * math.sqrt(3), 3 + 2 * math.sqrt(3)])
+
+    def test_integer_gasket_values_exact(self):
+        """Test integral gaskets convert back to exact ints."""
+        circles = list(generate_apollonian_gasket([Fraction(-1), Fraction(2), Fraction(2)], 3))
+
+        assert all(isinstance(c.curvature, int) for c in circles if c.generation > 0)
+        assert {c.curvature for c in circles if c.generation <= 2} == {-1, 2, 3, 6, 15}
+
+    def test_matches_exact_generator(self):
+        """Test circles found by the exact generator are also found here."""
+        curvatures = [Fraction(-1), Fraction(2), Fraction(2)]
+        float_keys = {
+            (float(c.curvature), float(c.center[0]), float(c.center[1]))
+            for c in generate_apollonian_gasket(curvatures, 3)
+        }
+
+        for circle in generate_exact_gasket(curvatures, 3):
+            key = (float(circle.curvature), float(circle.center[0]), float(circle.center[1]))
+            assert any(
+                all(abs(a - b) < 1e-9 for a, b in zip(key, other)) for other in float_keys
+            )
+
+    def test_streaming_mode(self):
+        """Test streaming yields the same circles in BFS order."""
+        curvatures = [Fraction(-1), Fraction(2), Fraction(2)]
+        streamed = list(generate_apollonian_gasket(curvatures, 3, stream=True))
+        batched = list(generate_apollonian_gasket(curvatures, 3, stream=False))
+
+        assert [c.hash_key() for c in streamed] == [c.hash_key() for c in batched]
+        generations = [c.generation for c in streamed]
+        assert generations == sorted(generations)
+
+    def test_no_duplicates(self):
+        """Test that no circle is generated twice."""
+        circles = list(generate_apollonian_gasket([Fraction(-2), Fraction(3), Fraction(6)], 5))
+        hashes = [c.hash_key() for c in circles]
+
+        assert len(hashes) == len(set(hashes))
+
+    def test_depth_zero_returns_initial_circles(self):
+        """Test max_depth=0 yields only the initial circles."""
+        circles = list(generate_apollonian_gasket([Fraction(-1), Fraction(2), Fraction(2)], 0))
+
+        assert len(circles) == 3
+        assert all(c.generation == 0 for c in circles)
+
+
+class TestGenerateGasketArray:
+    """Tests for generate_gasket_array()."""
+
+    def test_matches_circle_generator(self):
+        """Test the raw array holds the same circles, in the same order."""
+        curvatures = [Fraction(1), Fraction(1), Fraction(1)]
+        array = generate_gasket_array(curvatures, 4)
+        circles = list(generate_apollonian_gasket(curvatures, 4))
+
+        expected = [
+            (float(c.curvature), float(c.center[0]), float(c.center[1]), c.generation)
+            for c in circles
+        ]
+        assert array.shape == (len(circles), 4)
+        assert array == pytest.approx(np.array(expected))
+
+    def test_depth_zero_returns_initial_circles(self):
+        """Test max_depth=0 gives only the initial circles at generation 0."""
+        array = generate_gasket_array([Fraction(-1), Fraction(2), Fraction(2)], 0)
+
+        assert array[:, 0].tolist() == [-1.0, 2.0, 2.0]
+        assert (array[:, 3] == 0).all()
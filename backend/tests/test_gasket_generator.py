@@ -5,13 +5,18 @@ Reference: backend/core/gasket_generator.py
 """
 
 import pytest
+import sympy as sp
 from fractions import Fraction
 from core.gasket_generator import (
     initialize_standard_gasket,
     generate_apollonian_gasket,
-    is_duplicate
+    is_duplicate,
+    add_to_spatial_index,
+    verify_tangency,
+    verify_tangency_batch,
 )
 from core.circle_data import CircleData
+from core.descartes import descartes_solve
 
 
 class TestInitializeStandardGasket:
@@ -140,6 +145,14 @@ class TestInitializeStandardGasket:
             expected_radius = Fraction(1) / abs(circle.curvature)
             assert circle.radius() == expected_radius or circle.radius() == -expected_radius
 
+    def test_equal_curvatures_equilateral_placement(self):
+        """Test (2, 2, 2) places the third center exactly at (1/2, sqrt(3)/2)."""
+        circles = initialize_standard_gasket([2, 2, 2])
+
+        assert circles[2].center == (Fraction(1, 2), sp.sqrt(3) / 2)
+        for a, b in [(circles[0], circles[1]), (circles[1], circles[2]), (circles[2], circles[0])]:
+            assert verify_tangency(a, b)
+
 
 class TestGenerateApollonianGasket:
     """Tests for full gasket generation."""
@@ -299,6 +312,78 @@ class TestGenerateApollonianGasket:
         assert len(circles) <= 20  # Should not have more than 20
 
 
+    def test_generation_counts_triple(self):
+        """Test every circle spawns three children, so generations triple."""
+        curvatures = [Fraction(-1), Fraction(2), Fraction(2)]
+        circles = list(generate_apollonian_gasket(curvatures, max_depth=5, stream=False))
+
+        from collections import Counter
+        counts = Counter(c.generation for c in circles)
+        assert counts == {0: 3, 1: 2, 2: 6, 3: 18, 4: 54, 5: 162}
+
+        # Integral gasket stays integral under reflection
+        assert all(isinstance(c.curvature, int) for c in circles if c.generation > 0)
+
+    def test_rational_gasket_stays_exact(self):
+        """Test a rational placement generates tangent circles with int/Fraction values."""
+        curvatures = [Fraction(2), Fraction(3), Fraction(15)]
+        circles = list(generate_apollonian_gasket(curvatures, max_depth=3, stream=False))
+
+        assert len(circles) == 3 + 2 + 6 + 18
+        for circle in circles:
+            values = (circle.curvature, *circle.center)
+            assert all(isinstance(v, (int, Fraction)) for v in values)
+
+        # First-generation circles are tangent to all three initial circles
+        for child in (c for c in circles if c.generation == 1):
+            assert all(verify_tangency(child, parent) for parent in circles[:3])
+
+    def test_verify_tangency_exact_for_large_coordinates(self):
+        """Test rational tangency is exact where float64 error exceeds the tolerance."""
+        m = 10**7 + Fraction(1, 3)
+        circle1 = CircleData(curvature=1, center=(0, 0), generation=0)
+        # Center distance 5m equals r1 + r2 exactly (3-4-5 triangle)
+        circle2 = CircleData(curvature=1 / (5 * m - 1), center=(3 * m, 4 * m), generation=0)
+
+        assert verify_tangency(circle1, circle2)
+
+    def test_verify_tangency_batch_matches_pairwise(self):
+        """Test the batched check agrees with verify_tangency() on every pair."""
+        circles = list(generate_apollonian_gasket([-1, 2, 2], max_depth=2, stream=False))
+
+        tangent = verify_tangency_batch(circles)
+
+        assert tangent.shape == (len(circles), len(circles))
+        assert tangent.any()
+        for i, circle1 in enumerate(circles):
+            assert not tangent[i, i]
+            for j in range(i + 1, len(circles)):
+                assert tangent[i, j] == tangent[j, i] == verify_tangency(circle1, circles[j])
+
+
+class TestDescartesSolve:
+    """Tests for descartes_solve as used by the generation BFS."""
+
+    def test_descartes_solve_straight_line_has_no_center(self):
+        """A straight-line solution (curvature 0) is (0, None); the other is kept."""
+        circle1 = (1, (0, 0))
+        circle2 = (1, (2, 0))
+        circle3 = (0, (0, 1))
+
+        solutions = descartes_solve(circle1, circle2, circle3)
+
+        assert (0, None) in solutions
+        assert sorted(k for k, _ in solutions) == [0, 4]
+
+    def test_seed_with_straight_line_root_still_generates(self):
+        """Seed (1, 1, 4) has roots 12 and 0; the k=12 child is generated."""
+        circles = list(generate_apollonian_gasket([1, 1, 4], max_depth=2))
+        curvatures = sorted(c.curvature for c in circles)
+
+        assert curvatures == [1, 1, 4, 12, 24, 33, 33]
+        assert all(c.curvature != 0 for c in circles)
+
+
 class TestIsDuplicate:
     """
     Tests for is_duplicate() helper function.
@@ -419,6 +504,50 @@ class TestIsDuplicate:
             []
         )
 
+    def test_spatial_index_matches_list_scan(self):
+        """Test that a spatial index gives the same answers as the list scan."""
+        circles = [
+            CircleData(Fraction(1), (Fraction(0), Fraction(0)), 0, []),
+            CircleData(Fraction(2), (Fraction(1), Fraction(0)), 0, []),
+            CircleData(Fraction(3), (Fraction(2), Fraction(-1, 3)), 0, []),
+        ]
+        index = {}
+        for circle in circles:
+            add_to_spatial_index(index, circle)
+
+        queries = [
+            (Fraction(2), (Fraction(1), Fraction(0))),
+            (Fraction(3), (Fraction(2), Fraction(-1, 3))),
+            (Fraction(1000000000000, 1000000000001), (Fraction(0), Fraction(0))),
+            (Fraction(101, 100), (Fraction(0), Fraction(0))),
+            (Fraction(2), (Fraction(1), Fraction(1))),
+        ]
+        for curvature, center in queries:
+            assert is_duplicate(curvature, center, index) == is_duplicate(
+                curvature, center, circles
+            )
+
+    def test_spatial_index_neighbor_cell(self):
+        """Test that near-duplicates straddling a cell boundary are found."""
+        index = {}
+        add_to_spatial_index(
+            index,
+            CircleData(Fraction(1), (Fraction(0), Fraction(0)), 0, []),
+            tolerance=1e-3
+        )
+
+        # 1.0006 rounds into a different cell than 1.0 at width 1e-3
+        assert is_duplicate(
+            Fraction(10006, 10000),
+            (Fraction(0), Fraction(0)),
+            index,
+            tolerance=1e-3
+        )
+
+    def test_no_duplicate_in_empty_index(self):
+        """Test that no duplicate is found in an empty spatial index."""
+        assert not is_duplicate(Fraction(1), (Fraction(0), Fraction(0)), {})
+
 
 class TestParentCircleDetection:
     """
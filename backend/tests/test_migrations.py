@@ -0,0 +1,162 @@
+"""
+Tests for the migrations in migrations/.
+
+Each test builds a database with the schema the models had before any
+migration (baseline), applies the migrations in order and checks that
+the current service layer can write and read gaskets on the result.
+"""
+
+import hashlib
+import importlib.util
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from db.models.circle import Circle
+from services import GasketService
+from services.gasket_service import load_render_rationals
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
+MIGRATIONS = (
+    "001_add_exact_columns",
+    "002_circle_indexes",
+    "003_circle_numeric_columns",
+    "004_rehash_gasket_keys",
+)
+
+# Schema created by the models before the migrations existed
+BASELINE_SCHEMA = """
+CREATE TABLE gaskets (
+    id INTEGER NOT NULL,
+    hash VARCHAR(64) NOT NULL,
+    initial_curvatures TEXT NOT NULL,
+    num_circles INTEGER,
+    max_depth_cached INTEGER,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    last_accessed_at DATETIME,
+    access_count INTEGER NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_gaskets_hash ON gaskets (hash);
+CREATE INDEX ix_gaskets_id ON gaskets (id);
+CREATE TABLE circles (
+    id INTEGER NOT NULL,
+    gasket_id INTEGER NOT NULL,
+    generation INTEGER NOT NULL,
+    curvature_num INTEGER NOT NULL,
+    curvature_denom INTEGER NOT NULL,
+    center_x_num INTEGER NOT NULL,
+    center_x_denom INTEGER NOT NULL,
+    center_y_num INTEGER NOT NULL,
+    center_y_denom INTEGER NOT NULL,
+    radius_num INTEGER NOT NULL,
+    radius_denom INTEGER NOT NULL,
+    parent_ids TEXT,
+    tangent_ids TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY(gasket_id) REFERENCES gaskets (id) ON DELETE CASCADE
+);
+CREATE INDEX ix_circles_generation ON circles (generation);
+CREATE INDEX ix_circles_curvature ON circles (curvature_num, curvature_denom);
+CREATE INDEX ix_circles_id ON circles (id);
+CREATE INDEX ix_circles_gasket_generation ON circles (gasket_id, generation);
+CREATE INDEX ix_circles_gasket_id ON circles (gasket_id);
+"""
+
+
+def load_migration(name):
+    """Import a migration module (file names are not valid identifiers)."""
+    spec = importlib.util.spec_from_file_location(name, MIGRATIONS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def baseline_engine(tmp_path):
+    """File-backed SQLite engine with the baseline schema and one legacy gasket."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    raw = engine.raw_connection()
+    try:
+        raw.executescript(BASELINE_SCHEMA)
+        raw.executescript("""
+            INSERT INTO gaskets (id, hash, initial_curvatures, num_circles,
+                                 max_depth_cached, access_count)
+            VALUES (1, 'legacy', '["1", "1", "1"]', 1, 0, 1);
+            INSERT INTO circles (id, gasket_id, generation,
+                                 curvature_num, curvature_denom,
+                                 center_x_num, center_x_denom,
+                                 center_y_num, center_y_denom,
+                                 radius_num, radius_denom,
+                                 parent_ids, tangent_ids)
+            VALUES (1, 1, 0, 3, 2, 1, 4, -1, 3, 2, 3, '[]', '[2, 3]');
+        """)
+        raw.commit()
+    finally:
+        raw.close()
+    yield engine
+    engine.dispose()
+
+
+def test_migrations_upgrade_baseline_database(baseline_engine):
+    """Test that migrated baseline databases accept new gaskets."""
+    for name in MIGRATIONS:
+        migration = load_migration(name)
+        migration.migrate_up(baseline_engine)
+        assert migration.verify_migration(baseline_engine), name
+
+    with Session(baseline_engine) as db:
+        response = GasketService(db).create_or_get_gasket(["-1", "2", "2"], 2)
+        assert response.num_circles > 0
+
+        rationals = load_render_rationals(db, response.id)
+        assert len(rationals) == response.num_circles
+
+        legacy = db.get(Circle, 1)
+        assert legacy.curvature_numeric == Decimal("1.5")
+        assert Circle.from_packed(legacy.packed_rationals) == (1, 4, -1, 3, 2, 3, 3, 2)
+        assert legacy.tangent_ids == [2, 3]
+
+
+def test_migration_003_is_idempotent(baseline_engine):
+    """Test that 003 can be applied twice and rolled back."""
+    migration = load_migration("003_circle_numeric_columns")
+    migration.migrate_up(baseline_engine)
+    migration.migrate_up(baseline_engine)
+    assert migration.verify_migration(baseline_engine)
+
+    migration.migrate_down(baseline_engine)
+    assert not migration.verify_migration(baseline_engine)
+
+    with baseline_engine.connect() as conn:
+        columns = set(
+            conn.execute(text("SELECT name FROM pragma_table_info('circles')")).scalars()
+        )
+    assert "curvature_numeric" not in columns
+
+
+def test_migration_004_rekeys_sha256_gaskets(baseline_engine):
+    """Test that a gasket stored under its SHA-256 key is a cache hit after 004."""
+    with baseline_engine.begin() as conn:
+        conn.execute(
+            text("UPDATE gaskets SET hash = :hash WHERE id = 1"),
+            {"hash": hashlib.sha256(b"1/1,1/1,1/1").hexdigest()},
+        )
+
+    migration = load_migration("004_rehash_gasket_keys")
+    assert not migration.verify_migration(baseline_engine)
+    for name in MIGRATIONS:
+        load_migration(name).migrate_up(baseline_engine)
+    assert migration.verify_migration(baseline_engine)
+
+    with Session(baseline_engine) as db:
+        response = GasketService(db).create_or_get_gasket(["1", "1", "1"], 0)
+        assert response.id == 1
+
+    migration.migrate_down(baseline_engine)
+    assert not migration.verify_migration(baseline_engine)
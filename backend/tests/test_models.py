@@ -5,6 +5,7 @@ Reference: backend/db/models/
 """
 
 import pytest
+from decimal import Decimal
 from fractions import Fraction
 from sqlalchemy.orm import Session
 
@@ -136,6 +137,16 @@ class TestCircleModel:
         assert circle.curvature_num == 5
         assert circle.curvature_denom == 7
 
+    def test_hybrid_property_fraction_cached(self, db_session: Session):
+        """Test repeated access reuses the Fraction until the columns change."""
+        circle = Circle(curvature_num=3, curvature_denom=2)
+
+        first = circle.curvature
+        assert circle.curvature is first
+
+        circle.curvature_num = 5
+        assert circle.curvature == Fraction(5, 2)
+
     def test_all_hybrid_properties(self, db_session: Session):
         """Test all hybrid properties."""
         gasket = Gasket(hash="test", initial_curvatures='[]')
@@ -159,3 +170,179 @@ class TestCircleModel:
         assert circle.center_x == Fraction(1, 2)
         assert circle.center_y == Fraction(3, 4)
         assert circle.radius == Fraction(5, 6)
+
+    def test_parent_ids_packed(self, db_session: Session):
+        """Test parent IDs round-trip through the packed int32 column."""
+        gasket = Gasket(hash="test", initial_curvatures='[]')
+        db_session.add(gasket)
+        db_session.commit()
+
+        circle = Circle(
+            gasket_id=gasket.id,
+            generation=1,
+            curvature_num=3,
+            curvature_denom=1,
+            center_x_num=0,
+            center_x_denom=1,
+            center_y_num=2,
+            center_y_denom=3,
+            radius_num=1,
+            radius_denom=3,
+            parent_ids=[1, 2, 3],
+            tangent_ids=[1, 2, 3, 7],
+        )
+        db_session.add(circle)
+        db_session.commit()
+        db_session.expire_all()
+
+        stored = db_session.get(Circle, circle.id)
+        assert len(stored.parent_ids_packed) == 12
+        assert stored.parent_ids == [1, 2, 3]
+        assert len(stored.tangent_ids_packed) == 16
+        assert stored.tangent_ids == [1, 2, 3, 7]
+
+    def test_unpack_legacy_json_parent_ids(self):
+        """Test rows written with JSON parent IDs still decode."""
+        assert Circle.unpack_ids("[1, 2, 3]") == [1, 2, 3]
+        assert Circle.unpack_ids(None) == []
+        assert Circle.unpack_ids(b"") == []
+
+    def test_hybrid_property_requires_lowest_terms(self):
+        """Test the columns' lowest-terms invariant is checked in debug runs."""
+        circle = Circle(curvature_num=-3, curvature_denom=9)
+
+        with pytest.raises(AssertionError):
+            circle.curvature
+
+    def test_exact_value_cached_per_text(self):
+        """Test exact values are reused until the TEXT column changes."""
+        circle = Circle(
+            curvature_num=3, curvature_denom=2, curvature_exact="sym:sqrt(2)"
+        )
+
+        first = circle.curvature_exact_value
+        assert circle.curvature_exact_value is first
+
+        circle.curvature_exact = "frac:3/2"
+        assert circle.curvature_exact_value == Fraction(3, 2)
+
+        circle.curvature_exact = None
+        assert circle.curvature_exact_value is circle.curvature
+
+    def test_loaded_exact_values_parsed_once(self, db_session: Session, monkeypatch):
+        """Test a loaded circle parses each exact column on first read only."""
+        from db.models import circle as circle_module
+
+        gasket = Gasket(hash="test", initial_curvatures='[]')
+        db_session.add(gasket)
+        db_session.commit()
+        circle = Circle(
+            gasket_id=gasket.id,
+            generation=0,
+            curvature_num=3, curvature_denom=2, curvature_exact="frac:3/2",
+            center_x_num=0, center_x_denom=1, center_x_exact="int:0",
+            center_y_num=1, center_y_denom=1, center_y_exact="sym:sqrt(2)",
+            radius_num=2, radius_denom=3, radius_exact="frac:2/3",
+        )
+        db_session.add(circle)
+        db_session.commit()
+        db_session.expire_all()
+
+        parsed = []
+        real_parse = circle_module.parse_exact
+        monkeypatch.setattr(
+            circle_module, "parse_exact", lambda s: parsed.append(s) or real_parse(s)
+        )
+
+        stored = db_session.get(Circle, circle.id)
+        for _ in range(3):
+            stored.curvature_exact_value
+            stored.center_x_exact_value
+            stored.center_y_exact_value
+            stored.radius_exact_value
+
+        assert sorted(parsed) == ["frac:2/3", "frac:3/2", "int:0", "sym:sqrt(2)"]
+
+    def test_curvature_numeric(self, db_session: Session):
+        """Test curvature_numeric holds terminating decimals and NULL otherwise."""
+        assert Circle.numeric_value(3, 8) == Decimal("0.375")
+        assert Circle.numeric_value(-7, 1) == Decimal(-7)
+        assert Circle.numeric_value(1, 3) is None
+        assert Circle.numeric_value(1, 2**21) is None
+
+        gasket = Gasket(hash="test", initial_curvatures='[]')
+        db_session.add(gasket)
+        db_session.commit()
+
+        for k in (Fraction(5, 2), Fraction(-1), Fraction(2, 3), Fraction(3, 4)):
+            circle = Circle(
+                gasket_id=gasket.id,
+                generation=0,
+                center_x_num=0, center_x_denom=1,
+                center_y_num=0, center_y_denom=1,
+                radius_num=1, radius_denom=1,
+            )
+            circle.curvature = k
+            db_session.add(circle)
+        db_session.commit()
+
+        ordered = (
+            db_session.query(Circle)
+            .filter(Circle.curvature_numeric.isnot(None))
+            .order_by(Circle.curvature_numeric)
+            .all()
+        )
+        assert [c.curvature for c in ordered] == [-1, Fraction(3, 4), Fraction(5, 2)]
+
+    def test_fit_int64(self, db_session: Session):
+        """Test values beyond int64 are approximated in the INTEGER columns."""
+        assert Circle.fit_int64(-3, 7) == (-3, 7)
+
+        huge = Fraction(3**50, 2**70 + 1)
+        num, denom = Circle.fit_int64(huge.numerator, huge.denominator)
+        assert -(2**63) <= num < 2**63 and 0 < denom < 2**63
+        assert abs(Fraction(num, denom) - huge) < Fraction(1, 2**60)
+
+        with pytest.raises(ValueError):
+            Circle.fit_int64(2**70, 1)
+
+        gasket = Gasket(hash="test", initial_curvatures='[]')
+        db_session.add(gasket)
+        db_session.commit()
+        circle = Circle(
+            gasket_id=gasket.id,
+            generation=9,
+            center_x_num=0, center_x_denom=1,
+            center_y_num=0, center_y_denom=1,
+            radius_num=1, radius_denom=1,
+            curvature_exact=f"frac:{huge.numerator}/{huge.denominator}",
+        )
+        circle.curvature = huge
+        db_session.add(circle)
+        db_session.commit()
+        db_session.expire_all()
+
+        stored = db_session.get(Circle, circle.id)
+        assert (stored.curvature_num, stored.curvature_denom) == (num, denom)
+        assert stored.curvature_exact_value == huge
+
+    def test_setter_primes_fraction_cache(self):
+        """Assigning a Fraction makes the getter return that same object."""
+        circle = Circle()
+        value = Fraction(5, 7)
+        circle.curvature = value
+
+        assert circle.curvature_num == 5
+        assert circle.curvature_denom == 7
+        assert circle.curvature is value
+
+        # Writing the INTEGER columns directly still invalidates the entry
+        circle.curvature_num = 3
+        assert circle.curvature == Fraction(3, 7)
+
+    def test_parse_exact_sympy_memoized(self):
+        """Test identical "sym:" strings share one parsed expression."""
+        Circle._clear_exact_cache()
+
+        first = Circle.parse_exact("sym:sqrt(2)/2")
+        assert Circle.parse_exact("sym:sqrt(2)/2") is first